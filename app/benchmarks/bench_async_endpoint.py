@@ -0,0 +1,185 @@
+"""
+Compares the p50/p99 latency of a single room endpoint that calculates the
+room inline on the event loop with the same endpoint that offloads it to
+the threadpool, under an open loop load of `--rps` requests per second.
+Both endpoints parse the body the same way and calculate with the same
+`PaintCansPipeline` of the application, so only the offload differs.
+
+Requests are sent in process straight to the ASGI application, so the
+latency includes the middlewares, the routing, the request body parsing and
+the response serialization, but no network and no HTTP client. Each latency is measured from the time the
+request was scheduled, so a saturated endpoint is not hidden by requests
+that start late. The result cache is disabled and the wall validation memo
+cleared before each run, so every request is calculated.
+
+Usage:
+    python -m benchmarks.bench_async_endpoint [--rps N] [--seconds S]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+from time import perf_counter
+
+os.environ.setdefault("RESULT_CACHE_SIZE", "0")
+
+from functools import partial  # noqa: E402
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+
+from src.api.factory import create_api  # noqa: E402
+from src.extensions.offload import run_inline_or_offload  # noqa: E402
+from src.schemas.request.room import Room  # noqa: E402
+from src.schemas.response.paint_cans_needed import (  # noqa: E402
+    PaintCansNeeded,
+)
+from src.services.room_validator import RoomValidator  # noqa: E402
+
+REQUESTS_PER_SECOND = 2000
+SECONDS = 5
+INLINE_PATH = "/benchmark/paint_cans_needed_inline"
+OFFLOAD_PATH = "/benchmark/paint_cans_needed_offload"
+
+
+def build_api():
+    api = create_api()
+    pipeline = api.state.paint_cans_pipeline
+
+    def add_endpoint(path: str, max_inline_size: int) -> None:
+        @api.post(path, response_model=PaintCansNeeded)
+        async def post_paint_cans(room: Room):
+            try:
+                return await run_inline_or_offload(
+                    partial(pipeline.calculate, room),
+                    size=len(room.walls),
+                    max_inline_size=max_inline_size,
+                )
+            except ValidationError as error:
+                return JSONResponse(status_code=422, content=error.errors())
+
+    add_endpoint(INLINE_PATH, max_inline_size=sys.maxsize)
+    add_endpoint(OFFLOAD_PATH, max_inline_size=-1)
+    return api
+
+
+def build_payloads(number_payloads: int) -> list:
+    generator = random.Random(0)
+    return [
+        {
+            "walls": [
+                {
+                    "width": generator.uniform(3, 7),
+                    "height": generator.uniform(2.5, 5),
+                    "number_doors": generator.randint(0, 1),
+                    "number_windows": generator.randint(0, 2),
+                }
+                for _ in range(4)
+            ]
+        }
+        for _ in range(number_payloads)
+    ]
+
+
+async def post(api, path: str, body: bytes) -> int:
+    """
+    Sends a POST request to the ASGI application and returns the status
+    code of the response.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"benchmark"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    status_code = None
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    await api(scope, receive, send)
+    return status_code
+
+
+async def run_load(
+    api, path: str, bodies: list, requests_per_second: int
+) -> list:
+    latencies = []
+    interval = 1 / requests_per_second
+
+    async def send(body: bytes, scheduled_at: float) -> None:
+        status_code = await post(api, path, body)
+        latencies.append(perf_counter() - scheduled_at)
+        assert status_code in (200, 422)
+
+    tasks = []
+    start = perf_counter()
+    for index, body in enumerate(bodies):
+        scheduled_at = start + index * interval
+        delay = scheduled_at - perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(send(body, scheduled_at)))
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def percentile(latencies: list, rate: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(rate * len(ordered)))]
+
+
+async def benchmark(requests_per_second: int, seconds: float) -> None:
+    api = build_api()
+    bodies = [
+        json.dumps(payload).encode()
+        for payload in build_payloads(int(requests_per_second * seconds))
+    ]
+    print(
+        f"rps: {requests_per_second}, requests: {len(bodies)}\n"
+        f"{'endpoint':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}"
+        f" {'max (ms)':>10}"
+    )
+    for name, path in (("offload", OFFLOAD_PATH), ("inline", INLINE_PATH)):
+        await run_load(api, path, bodies[:200], requests_per_second)
+        RoomValidator._walls_validations.clear()
+        latencies = await run_load(api, path, bodies, requests_per_second)
+        print(
+            f"{name:>10} {percentile(latencies, 0.50) * 1e3:>10.3f}"
+            f" {percentile(latencies, 0.99) * 1e3:>10.3f}"
+            f" {max(latencies) * 1e3:>10.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rps", type=int, default=REQUESTS_PER_SECOND)
+    parser.add_argument("--seconds", type=float, default=SECONDS)
+    arguments = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(benchmark(arguments.rps, arguments.seconds))
+
+
+if __name__ == "__main__":
+    main()
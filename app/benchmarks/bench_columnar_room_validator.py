@@ -0,0 +1,82 @@
+"""
+Compares `RoomValidator` with `ColumnarRoomValidator` validating batches of
+random rooms.
+
+Usage:
+    python -m benchmarks.bench_columnar_room_validator [--rooms N]
+"""
+import argparse
+import logging
+import random
+from time import perf_counter
+
+from src.schemas.request.room import Room
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.exception import InvalidRoomDimensionError
+from src.services.room_validator import RoomValidator
+
+NUMBER_ROOMS = 2_000
+
+
+def build_rooms(number_rooms: int) -> list:
+    generator = random.Random(0)
+    return [
+        Room(
+            walls=[
+                {
+                    "width": generator.uniform(0.5, 12),
+                    "height": generator.uniform(0.5, 6),
+                    "number_doors": generator.randint(0, 2),
+                    "number_windows": generator.randint(0, 3),
+                }
+                for _ in range(4)
+            ]
+        )
+        for _ in range(number_rooms)
+    ]
+
+
+def validate_with_room_validator(rooms: list) -> list:
+    results = []
+    for room in rooms:
+        try:
+            RoomValidator(room).validate_dimensions()
+            results.append({})
+        except InvalidRoomDimensionError as error:
+            results.append(error.args[0])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=NUMBER_ROOMS)
+    number_rooms = parser.parse_args().rooms
+
+    logging.disable(logging.CRITICAL)
+    rooms = build_rooms(number_rooms)
+    print(f"rooms: {number_rooms}, walls: {number_rooms * 4}")
+
+    start = perf_counter()
+    expected = validate_with_room_validator(rooms)
+    print(f"RoomValidator: {perf_counter() - start:.3f}s")
+
+    start = perf_counter()
+    columnar_validator = ColumnarRoomValidator.from_rooms(rooms)
+    loaded = perf_counter()
+    result = columnar_validator.invalid_dimensions_values()
+    finished = perf_counter()
+    print(
+        f"ColumnarRoomValidator: {finished - start:.3f}s"
+        f" (load: {loaded - start:.3f}s,"
+        f" validate: {finished - loaded:.3f}s)"
+    )
+
+    start = perf_counter()
+    columnar_validator.failures()
+    print(f"ColumnarRoomValidator masks only: {perf_counter() - start:.4f}s")
+
+    assert result == expected
+
+
+if __name__ == "__main__":
+    main()
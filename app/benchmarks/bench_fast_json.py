@@ -0,0 +1,108 @@
+"""
+Compares the CPU spent decoding a room body and encoding the paint cans
+needed by the Pydantic path of FastAPI with the msgspec fast JSON path.
+
+The Pydantic path parses the body with `json.loads`, validates it into a
+`Room`, validates the response against `PaintCansNeeded` with
+`serialize_response` and renders it with `JSONResponse`. The fast path
+decodes the body with `decode_room` and encodes the response with
+`encode_paint_cans_needed`.
+
+Usage:
+    python -m benchmarks.bench_fast_json [--requests N]
+"""
+import argparse
+import json
+from time import perf_counter
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.api.resources.paint_cans_calculator.fast_json_codecs import (
+    decode_room,
+)
+from src.api.resources.paint_cans_calculator.responses import (
+    encode_paint_cans_needed,
+)
+from src.controllers.main_controller import PaintCansController
+from src.extensions.fast_json import PreEncodedJSONResponse
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+
+NUMBER_REQUESTS = 100_000
+BODY = json.dumps(
+    {
+        "walls": [
+            {"width": 7, "height": 5, "number_doors": 1, "number_windows": 2},
+            {"width": 7, "height": 5, "number_doors": 2, "number_windows": 2},
+            {"width": 7, "height": 5, "number_doors": 0, "number_windows": 0},
+            {"width": 7, "height": 5, "number_doors": 0, "number_windows": 0},
+        ]
+    }
+).encode()
+
+
+def run_coroutine(coroutine):
+    """
+    Runs a coroutine that never suspends without an event loop.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("The coroutine suspended.")
+
+
+def pydantic_path(number_requests: int, response: PaintCansNeeded) -> float:
+    response_field = create_response_field(
+        name="Response_post_paint_cans", type_=PaintCansNeeded
+    )
+
+    start = perf_counter()
+    for _ in range(number_requests):
+        Room.validate(json.loads(BODY))
+        JSONResponse(
+            run_coroutine(
+                serialize_response(
+                    field=response_field,
+                    response_content=response,
+                    is_coroutine=True,
+                )
+            )
+        )
+    return perf_counter() - start
+
+
+def fast_path(number_requests: int, response: PaintCansNeeded) -> float:
+    start = perf_counter()
+    for _ in range(number_requests):
+        decode_room(BODY)
+        PreEncodedJSONResponse(encode_paint_cans_needed(response))
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=NUMBER_REQUESTS)
+    number_requests = parser.parse_args().requests
+
+    response = PaintCansController(
+        decode_room(BODY)
+    ).calculate_paint_cans_needed_controller()
+    assert JSONResponse(response.dict()).body == encode_paint_cans_needed(
+        response
+    )
+
+    pydantic_elapsed = pydantic_path(number_requests, response)
+    fast_elapsed = fast_path(number_requests, response)
+    print(
+        f"requests: {number_requests}\n"
+        f"pydantic: {pydantic_elapsed / number_requests * 1e6:8.2f} us/req\n"
+        f"fast:     {fast_elapsed / number_requests * 1e6:8.2f} us/req\n"
+        f"speedup:  {pydantic_elapsed / fast_elapsed:8.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Shows that `log_exceptions` keeps memory flat and adds almost no cost to
+calls that do not raise.
+
+A request is simulated by a call through three decorated layers, one in
+every `ERROR_EVERY` requests raising an exception that is logged to
+`os.devnull`.
+
+Usage:
+    python -m benchmarks.bench_logger [--requests N]
+"""
+import argparse
+import logging
+import os
+import tracemalloc
+from time import perf_counter
+
+from src.extensions.logger import (
+    LOGGER_NAME,
+    configure_logging,
+    log_exceptions,
+    shutdown_logging,
+)
+
+NUMBER_REQUESTS = 1_000_000
+CHECKPOINTS = 10
+ERROR_EVERY = 100
+
+
+@log_exceptions(msg="exception_benchmark", extra={"layer": "service"})
+def service(request: int) -> int:
+    if not request % ERROR_EVERY:
+        raise ValueError("Invalid request.")
+    return request
+
+
+@log_exceptions(msg="exception_benchmark", extra={"layer": "coordinator"})
+def coordinator(request: int) -> int:
+    return service(request)
+
+
+@log_exceptions(msg="exception_benchmark", extra={"layer": "controller"})
+def controller(request: int) -> int:
+    return coordinator(request)
+
+
+def handle(request: int) -> None:
+    try:
+        controller(request)
+    except ValueError:
+        pass
+
+
+def measure_happy_path_overhead(number_calls: int) -> None:
+    def function(value):
+        return value
+
+    decorated = log_exceptions(msg="exception_benchmark", extra={})(function)
+
+    for name, callable_ in (("plain", function), ("decorated", decorated)):
+        start = perf_counter()
+        for value in range(number_calls):
+            callable_(value)
+        elapsed = perf_counter() - start
+        print(f"{name} call: {elapsed / number_calls * 1e9:.0f}ns")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=NUMBER_REQUESTS)
+    number_requests = parser.parse_args().requests
+
+    with open(os.devnull, "w") as devnull:
+        configure_logging(stream=devnull)
+
+        measure_happy_path_overhead(number_requests)
+
+        tracemalloc.start()
+        step = max(number_requests // CHECKPOINTS, 1)
+        print(f"{'requests':>10} {'memory (KiB)':>14} {'handlers':>9}")
+        for request in range(1, number_requests + 1):
+            handle(request)
+            if not request % step:
+                current, _ = tracemalloc.get_traced_memory()
+                handlers = sum(
+                    len(logging.getLogger(name).handlers)
+                    for name in logging.root.manager.loggerDict
+                    if name.startswith(LOGGER_NAME)
+                )
+                print(f"{request:>10} {current / 1024:>14.1f} {handlers:>9}")
+        tracemalloc.stop()
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
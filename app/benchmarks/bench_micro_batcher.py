@@ -0,0 +1,92 @@
+"""
+Compares the p50/p99 latency of the async single room endpoint with and
+without the micro-batcher, under an open loop load of `--rps` requests per
+second, and reports the mean size of the batches.
+
+The requests are sent in process straight to the ASGI application, as in
+`bench_async_endpoint`, with the result cache disabled.
+
+Usage:
+    python -m benchmarks.bench_micro_batcher [--rps N] [--seconds S]
+        [--window SECONDS] [--max-size N]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("RESULT_CACHE_SIZE", "0")
+
+from benchmarks.bench_async_endpoint import (  # noqa: E402
+    ASYNC_PATH,
+    build_payloads,
+    percentile,
+    run_load,
+)
+from config import ApiConfig  # noqa: E402
+from src.api.factory import create_api  # noqa: E402
+from src.services.room_validator import RoomValidator  # noqa: E402
+
+REQUESTS_PER_SECOND = 5000
+SECONDS = 5
+WINDOW = 0.001
+MAX_SIZE = 64
+
+
+async def benchmark(
+    requests_per_second: int, seconds: float, window: float, max_size: int
+) -> None:
+    bodies = [
+        json.dumps(payload).encode()
+        for payload in build_payloads(int(requests_per_second * seconds))
+    ]
+    print(
+        f"rps: {requests_per_second}, requests: {len(bodies)}\n"
+        f"{'endpoint':>14} {'p50 (ms)':>10} {'p99 (ms)':>10}"
+        f" {'max (ms)':>10} {'batch size':>11}"
+    )
+    for name, micro_batch_window in (("inline", 0), ("micro-batched", window)):
+        with patch.object(
+            ApiConfig, "MICRO_BATCH_WINDOW", micro_batch_window
+        ), patch.object(ApiConfig, "MICRO_BATCH_MAX_SIZE", max_size):
+            api = create_api()
+
+        await run_load(api, ASYNC_PATH, bodies[:200], requests_per_second)
+        RoomValidator._walls_validations.clear()
+        latencies = await run_load(
+            api, ASYNC_PATH, bodies, requests_per_second
+        )
+        micro_batcher = api.state.paint_cans_micro_batcher
+        batch_size = (
+            micro_batcher.stats()["mean_batch_size"] if micro_batcher else 1
+        )
+        print(
+            f"{name:>14} {percentile(latencies, 0.50) * 1e3:>10.3f}"
+            f" {percentile(latencies, 0.99) * 1e3:>10.3f}"
+            f" {max(latencies) * 1e3:>10.3f} {batch_size:>11.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rps", type=int, default=REQUESTS_PER_SECOND)
+    parser.add_argument("--seconds", type=float, default=SECONDS)
+    parser.add_argument("--window", type=float, default=WINDOW)
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE)
+    arguments = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(
+        benchmark(
+            arguments.rps,
+            arguments.seconds,
+            arguments.window,
+            arguments.max_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
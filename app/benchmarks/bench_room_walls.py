@@ -0,0 +1,108 @@
+"""
+Measures how parsing, validating and calculating a single room scales with
+its number of walls, from a four walls room up to a whole building.
+
+For each bucket of number of walls, the time per wall should stay roughly
+constant. The pipeline validates rooms with at least
+`ApiConfig.COLUMNAR_VALIDATION_MIN_WALLS` walls by columns.
+
+Usage:
+    python -m benchmarks.bench_room_walls [--walls N [N ...]] [--repeat N]
+"""
+import argparse
+import json
+import logging
+import random
+from time import perf_counter
+
+from config import ApiConfig
+from src.api.resources.paint_cans_calculator.fast_json_codecs import (
+    decode_room,
+)
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.result_cache import ResultCache
+from src.schemas.request.room import Room
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.exception import InvalidRoomDimensionError
+from src.services.room_validator import RoomValidator
+
+WALLS_BUCKETS = (4, 64, 1024, 8192)
+REPEAT = 5
+
+
+def build_body(number_walls: int) -> bytes:
+    generator = random.Random(number_walls)
+    return json.dumps(
+        {
+            "walls": [
+                {
+                    "width": round(generator.uniform(4, 8), 2),
+                    "height": round(generator.uniform(2.5, 4), 2),
+                    "number_doors": generator.randint(0, 1),
+                    "number_windows": generator.randint(0, 1),
+                }
+                for _ in range(number_walls)
+            ]
+        }
+    ).encode()
+
+
+def best_of(repeat: int, function) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def validate_with_room_validator(room: Room) -> None:
+    try:
+        RoomValidator(room).validate_dimensions()
+    except InvalidRoomDimensionError:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--walls", type=int, nargs="+", default=WALLS_BUCKETS)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+    print(
+        f"columnar validation from"
+        f" {ApiConfig.COLUMNAR_VALIDATION_MIN_WALLS} walls"
+    )
+
+    for number_walls in args.walls:
+        body = build_body(number_walls)
+        room = Room.parse_raw(body)
+        timings = {
+            "pydantic": best_of(args.repeat, lambda: Room.parse_raw(body)),
+            "msgspec": best_of(args.repeat, lambda: decode_room(body)),
+            "RoomValidator": best_of(
+                args.repeat, lambda: validate_with_room_validator(room)
+            ),
+            "Columnar": best_of(
+                args.repeat,
+                lambda: ColumnarRoomValidator.from_rooms(
+                    (room,)
+                ).invalid_dimensions_values(),
+            ),
+            "pipeline": best_of(
+                args.repeat, lambda: pipeline.calculate(decode_room(body))
+            ),
+        }
+        print(
+            f"walls: {number_walls:>6}  "
+            + "  ".join(
+                f"{name}: {timing * 1e6 / number_walls:7.2f}us/wall"
+                for name, timing in timings.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
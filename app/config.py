@@ -1,3 +1,4 @@
+import json
 import os
 from os.path import dirname, join
 
@@ -15,3 +16,77 @@ class ApiConfig:
     SERVER_PORT = int(os.environ.get("SERVER_PORT") or 8000)
     WORKERS = int(os.environ.get("WORKERS") or 1)
     LOG_LEVEL = os.environ.get("LOG_LEVEL") or "info"
+    LOG_EXCEPTIONS = (
+        os.environ.get("LOG_EXCEPTIONS", "true").lower() != "false"
+    )
+
+    LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE") or 10000)
+    ERROR_LOG_LEVEL = os.environ.get("ERROR_LOG_LEVEL") or "warning"
+    ERROR_LOG_SAMPLING_WINDOW = float(
+        os.environ.get("ERROR_LOG_SAMPLING_WINDOW") or 60
+    )
+    ERROR_LOG_SAMPLING_BURST = int(
+        os.environ.get("ERROR_LOG_SAMPLING_BURST") or 10
+    )
+
+    ROOM_MAX_WALLS = int(os.environ.get("ROOM_MAX_WALLS") or 10000)
+    COLUMNAR_VALIDATION_MIN_WALLS = int(
+        os.environ.get("COLUMNAR_VALIDATION_MIN_WALLS") or 256
+    )
+    BATCH_MAX_ROOMS = int(os.environ.get("BATCH_MAX_ROOMS") or 10000)
+    REQUEST_MAX_WALLS = int(os.environ.get("REQUEST_MAX_WALLS") or 40000)
+    STREAM_CHUNK_ROOMS = int(os.environ.get("STREAM_CHUNK_ROOMS") or 256)
+    STREAM_CHUNK_BYTES = int(os.environ.get("STREAM_CHUNK_BYTES") or 1 << 20)
+    STREAM_MAX_LINE_BYTES = int(
+        os.environ.get("STREAM_MAX_LINE_BYTES") or 2 << 20
+    )
+    FAST_JSON = os.environ.get("FAST_JSON", "true").lower() != "false"
+    ETAGS = os.environ.get("ETAGS", "true").lower() != "false"
+    ETAG_CACHE_CONTROL = os.environ.get("ETAG_CACHE_CONTROL", "no-cache")
+    ASYNC_INLINE_MAX_WALLS = int(
+        os.environ.get("ASYNC_INLINE_MAX_WALLS") or 256
+    )
+
+    MICRO_BATCH_WINDOW = float(os.environ.get("MICRO_BATCH_WINDOW") or 0)
+    MICRO_BATCH_MAX_SIZE = int(os.environ.get("MICRO_BATCH_MAX_SIZE") or 64)
+
+    RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE") or 1024)
+    RESULT_CACHE_TTL = float(os.environ.get("RESULT_CACHE_TTL") or 0)
+    SHARED_RESULT_CACHE_FILE = os.environ.get("SHARED_RESULT_CACHE_FILE")
+    SHARED_RESULT_CACHE_SLOTS = int(
+        os.environ.get("SHARED_RESULT_CACHE_SLOTS") or 16384
+    )
+    SHARED_RESULT_CACHE_SLOT_BYTES = int(
+        os.environ.get("SHARED_RESULT_CACHE_SLOT_BYTES") or 1024
+    )
+    CACHE_SNAPSHOT_FILE = os.environ.get("CACHE_SNAPSHOT_FILE")
+    CACHE_SNAPSHOT_INTERVAL = float(
+        os.environ.get("CACHE_SNAPSHOT_INTERVAL") or 60
+    )
+    WALL_CACHE_SIZE = int(os.environ.get("WALL_CACHE_SIZE") or 4096)
+    RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE") or 1024)
+    CACHE_MAX_INVALID_WALLS = int(
+        os.environ.get("CACHE_MAX_INVALID_WALLS") or 16
+    )
+
+    PAINT_CANS_ALLOCATION = (
+        os.environ.get("PAINT_CANS_ALLOCATION") or "greedy"
+    ).lower()
+    EXACT_ALLOCATION_MAX_AREA = float(
+        os.environ.get("EXACT_ALLOCATION_MAX_AREA") or 1000
+    )
+    ALLOCATION_MAX_TABLE_UNITS = int(
+        os.environ.get("ALLOCATION_MAX_TABLE_UNITS") or 250000
+    )
+    PAINT_CAN_PRICES = {
+        float(size): float(price)
+        for size, price in json.loads(
+            os.environ.get("PAINT_CAN_PRICES") or "{}"
+        ).items()
+    }
+
+    PAINT_CAN_CATALOGS_FILE = os.environ.get("PAINT_CAN_CATALOGS_FILE")
+    PAINT_CAN_CATALOGS_POLL_INTERVAL = float(
+        os.environ.get("PAINT_CAN_CATALOGS_POLL_INTERVAL") or 5
+    )
+    PAINT_CAN_CATALOG = os.environ.get("PAINT_CAN_CATALOG") or "default"
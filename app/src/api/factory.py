@@ -1,19 +1,130 @@
 from fastapi import FastAPI
 
+from config import ApiConfig
+from src.api.resources.metrics.router import metrics_router_v1
 from src.api.resources.paint_cans_calculator.router import paint_mall_router_v1
+from src.controllers.micro_batcher import PaintCansMicroBatcher
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.cache_snapshot import CacheSnapshot
+from src.extensions.logger import configure_logging, shutdown_logging
+from src.extensions.metrics import register_metrics
+from src.extensions.request_logging import RequestLoggingMiddleware
+from src.extensions.result_cache import ResultCache
+from src.extensions.shared_result_cache import SharedResultCache
+from src.extensions.single_flight import SingleFlight
+from src.services.paint_can_catalog import PaintCanCatalogRegistry
 
 
 def create_api() -> FastAPI:
     """
-    Creates a new instance of the FastAPI application and includes the paint mall API router.
+    Configures the logging once and creates a new instance of the FastAPI
+    application including the request logging middleware, the paint mall
+    and metrics API routers, and a last shutdown hook that flushes the
+    logging queue. The paint cans pipeline shared by every request is built here,
+    once, and kept in `api.state.paint_cans_pipeline`, with its own result
+    cache, kept in `api.state.results_cache`, and its own rooms in flight,
+    kept in `api.state.in_flight`.
+
+    When `ApiConfig.SHARED_RESULT_CACHE_FILE` is set, the pipeline shares
+    its results with every worker that maps the same file, through a
+    `SharedResultCache` namespaced by the version of the rules.
+
+    When `ApiConfig.MICRO_BATCH_WINDOW` is set, the rooms of concurrent
+    single room requests are calculated together by a micro-batcher, kept
+    in `api.state.paint_cans_micro_batcher`, None otherwise.
+
+    The paint can catalogs of `ApiConfig.PAINT_CAN_CATALOGS_FILE` are loaded
+    and compiled here too, kept in `api.state.paint_can_catalogs`, and
+    polled for changes while the application runs.
+
+    When `ApiConfig.CACHE_SNAPSHOT_FILE` is set, the results of the
+    snapshot saved by the previous process are loaded into the pipeline
+    here, skipping the ones built with other rules or catalogs, and the
+    snapshot is saved every `ApiConfig.CACHE_SNAPSHOT_INTERVAL` seconds
+    and on shutdown.
 
     Returns:
     --------
     api: FastAPI
         The created instance of the FastAPI application.
     """
+    configure_logging()
+
     api = FastAPI()
+    shared_cache = None
+    if ApiConfig.SHARED_RESULT_CACHE_FILE:
+        shared_cache = SharedResultCache(
+            ApiConfig.SHARED_RESULT_CACHE_FILE,
+            slots=ApiConfig.SHARED_RESULT_CACHE_SLOTS,
+            slot_bytes=ApiConfig.SHARED_RESULT_CACHE_SLOT_BYTES,
+            namespace=PaintCansPipeline.rules_version(),
+        )
+        api.add_event_handler("shutdown", shared_cache.close)
+        register_metrics("shared_result_cache", shared_cache.stats)
+    api.state.results_cache = ResultCache(
+        max_size=ApiConfig.RESULT_CACHE_SIZE, ttl=ApiConfig.RESULT_CACHE_TTL
+    )
+    register_metrics("result_cache", api.state.results_cache.stats)
+    api.state.in_flight = SingleFlight()
+    register_metrics("single_flight", api.state.in_flight.stats)
+    api.state.paint_cans_pipeline = PaintCansPipeline(
+        results_cache=api.state.results_cache,
+        shared_cache=shared_cache,
+        in_flight=api.state.in_flight,
+    )
+    api.state.paint_cans_micro_batcher = None
+    if ApiConfig.MICRO_BATCH_WINDOW > 0:
+        api.state.paint_cans_micro_batcher = PaintCansMicroBatcher(
+            api.state.paint_cans_pipeline,
+            window=ApiConfig.MICRO_BATCH_WINDOW,
+            max_size=ApiConfig.MICRO_BATCH_MAX_SIZE,
+        )
+        register_metrics(
+            "paint_cans_micro_batcher",
+            api.state.paint_cans_micro_batcher.stats,
+        )
+
+    paint_can_catalogs = PaintCanCatalogRegistry(
+        path=ApiConfig.PAINT_CAN_CATALOGS_FILE,
+        max_area=ApiConfig.EXACT_ALLOCATION_MAX_AREA,
+        default_id=ApiConfig.PAINT_CAN_CATALOG,
+    )
+    api.state.paint_can_catalogs = paint_can_catalogs
+    api.add_event_handler(
+        "startup",
+        lambda: paint_can_catalogs.start_polling(
+            ApiConfig.PAINT_CAN_CATALOGS_POLL_INTERVAL
+        ),
+    )
+    api.add_event_handler("shutdown", paint_can_catalogs.stop_polling)
+    register_metrics("paint_can_catalogs", paint_can_catalogs.stats)
+
+    if ApiConfig.CACHE_SNAPSHOT_FILE:
+        pipeline = api.state.paint_cans_pipeline
+        cache_snapshot = CacheSnapshot(
+            ApiConfig.CACHE_SNAPSHOT_FILE,
+            version=PaintCansPipeline.rules_version(),
+            export_entries=pipeline.export_results,
+        )
+        pipeline.import_results(
+            cache_snapshot.load(),
+            (None, *paint_can_catalogs.catalogs()),
+            on_failure=cache_snapshot.import_failed,
+        )
+        api.add_event_handler(
+            "startup",
+            lambda: cache_snapshot.start_saving(
+                ApiConfig.CACHE_SNAPSHOT_INTERVAL
+            ),
+        )
+        api.add_event_handler("shutdown", cache_snapshot.stop_saving)
+        register_metrics("cache_snapshot", cache_snapshot.stats)
 
+    api.add_middleware(RequestLoggingMiddleware)
     api.include_router(paint_mall_router_v1)
+    api.include_router(metrics_router_v1)
+    # The logging queue is flushed and stopped last, after every other
+    # shutdown hook, so the records they log are written.
+    api.add_event_handler("shutdown", shutdown_logging)
 
     return api
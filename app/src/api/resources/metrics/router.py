@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from .service_metrics import register_get_metrics_view
+
+metrics_router_v1 = APIRouter(
+    prefix="/api/v1",
+    tags=["Metrics Endpoints"],
+)
+
+register_get_metrics_view(metrics_router_v1)
@@ -0,0 +1,40 @@
+from typing import Dict
+
+from fastapi import APIRouter
+
+from src.extensions.metrics import collect_metrics
+
+
+def register_get_metrics_view(router: APIRouter):
+    @router.get(
+        path="/metrics",
+        status_code=200,
+        summary="Return the internal metrics of the service.",
+        responses={
+            200: {
+                "description": "The current value of each metric.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "logging": {
+                                "dropped_records": 0,
+                                "queued_records": 0,
+                            }
+                        }
+                    }
+                },
+            },
+        },
+    )
+    def get_metrics() -> Dict[str, dict]:
+        """Return the internal metrics of the service, grouped by the
+        component that reports them.
+
+        ## Response Body
+
+        - `logging.dropped_records` (int): The log records dropped because
+            the logging queue was full.
+        - `logging.queued_records` (int): The log records waiting to be
+            written.
+        """
+        return collect_metrics()
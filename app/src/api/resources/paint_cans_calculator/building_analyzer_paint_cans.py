@@ -0,0 +1,173 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from src.controllers.building_controller import BuildingQuoteController
+from src.schemas.request.building import Building
+from src.schemas.response.building_quote import BuildingQuote
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import UnavailableAllocationError
+
+from .catalogs import (
+    CATALOG_NOT_FOUND_RESPONSE,
+    catalog_query,
+    select_paint_can_catalog,
+)
+
+
+def register_post_building_quote_view(router: APIRouter):
+    @router.post(
+        path="/paint_mall/paint_cans_needed/building",
+        response_model=BuildingQuote,
+        response_model_exclude_none=True,
+        status_code=200,
+        summary=(
+            "Quote the paint cans needed to paint a whole building, bought"
+            " together for each floor and for the building."
+        ),
+        responses={
+            200: {
+                "description": (
+                    "The result of each room and the free area and paint"
+                    " cans of each floor and of the building."
+                ),
+                "content": {
+                    "application/json": {
+                        "example": BuildingQuote.Config.schema_extra["example"]
+                    }
+                },
+            },
+            422: {
+                "description": "Validation error",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": [
+                                {
+                                    "loc": [
+                                        "body",
+                                        "floors",
+                                        0,
+                                        "rooms",
+                                        0,
+                                        "walls",
+                                        0,
+                                        "width",
+                                    ],
+                                    "msg": "ensure this value is greater than 0",
+                                    "type": "value_error.number.not_gt",
+                                    "ctx": {"limit_value": 0},
+                                }
+                            ]
+                        }
+                    }
+                },
+            },
+            404: CATALOG_NOT_FOUND_RESPONSE,
+            500: {
+                "description": "Server error",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "An error occurred on the server."
+                        }
+                    }
+                },
+            },
+        },
+    )
+    async def post_building_quote(
+        building: Building,
+        request: Request,
+        allocation: Optional[AllocationStrategy] = Query(
+            default=None,
+            description=(
+                "`greedy` prefers the largest cans, `exact` leaves the least"
+                " paint over with the fewest cans, `cheapest` buys the"
+                " cheapest cans. Defaults to the server configuration."
+            ),
+        ),
+        catalog: Optional[str] = catalog_query(),
+    ) -> BuildingQuote:
+        """Quote the paint cans needed to paint a whole building.
+
+        The paint is bought together for each floor and for the whole
+        building, so the paint left over in one room covers the others.
+
+        ## Request Body
+
+        The request body should be a JSON object containing an array of
+        floors, each one with an array of rooms, where each room has the
+        same shape of the body accepted by `/paint_mall/paint_cans_needed`.
+        The building can have up to `BATCH_MAX_ROOMS` rooms.
+
+        Example:
+
+        ```json
+        {
+          "floors": [
+            {
+              "rooms": [
+                {
+                  "walls": [
+                    {"width": 7, "height": 5, "number_doors": 1, "number_windows": 2},
+                    {"width": 7, "height": 5, "number_doors": 2, "number_windows": 2},
+                    {"width": 7, "height": 5, "number_doors": 0, "number_windows": 0},
+                    {"width": 7, "height": 5, "number_doors": 0, "number_windows": 0}
+                  ]
+                }
+              ]
+            }
+          ]
+        }
+        ```
+
+        ## Query Parameters
+
+        - `allocation` (string, optional): The strategy to choose the paint
+            cans of each floor and of the building, as in
+            `/paint_mall/paint_cans_needed`.
+        - `catalog` (string, optional): The id of the paint can catalog.
+
+        ## Response Body
+
+        A JSON object with the quote of each floor, in the same order of
+        the floors, and the `free_area` and `paint_cans` of the building.
+        Each floor contains one result per room, in the same order of the
+        rooms, and its own `free_area` and `paint_cans`. Each room result
+        contains either its `free_area`, when the room dimensions are
+        consistent, or `errors`, with the inconsistencies found for each
+        wall of the room. Rooms with errors are left out of the totals.
+
+        ## Error Responses
+
+        - `404` (Not found): If the paint can catalog does not exist.
+
+        - `422` (Validation error): If the request body fails validation,
+            returns a JSON object with the following properties:
+            detail (array): An array of objects containing details
+             about each validation error.
+        - `500` (Server error): If an unexpected error occurs on the
+            server, returns a JSON object with the following properties:
+            detail (string): A description of the error.
+
+        """
+
+        paint_can_catalog = select_paint_can_catalog(request, catalog)
+        try:
+            building_quote = BuildingQuoteController(
+                building, allocation, paint_can_catalog
+            )
+            response = await (
+                building_quote.calculate_building_quote_controller_async()
+            )
+
+        except UnavailableAllocationError as error:
+            raise HTTPException(status_code=422, detail=str(error))
+        except Exception:
+            raise HTTPException(
+                status_code=500,
+                detail="An internal error occurred on the server.",
+            )
+
+        return response
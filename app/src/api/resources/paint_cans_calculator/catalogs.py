@@ -0,0 +1,52 @@
+from typing import Optional
+
+from fastapi import HTTPException, Query, Request
+
+from src.services.exception import UnknownPaintCanCatalogError
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+
+CATALOG_QUERY_DESCRIPTION = (
+    "The id of the paint can catalog. Defaults to the server configuration."
+)
+
+CATALOG_NOT_FOUND_RESPONSE = {
+    "description": "Paint can catalog not found",
+    "content": {
+        "application/json": {
+            "example": {"detail": "The paint can catalog 'eu' was not found."}
+        }
+    },
+}
+
+
+def catalog_query() -> Optional[str]:
+    """
+    Returns the declaration of the optional `catalog` query param.
+    """
+    return Query(default=None, description=CATALOG_QUERY_DESCRIPTION)
+
+
+def select_paint_can_catalog(
+    request: Request, catalog_id: Optional[str]
+) -> Optional[CompiledPaintCanCatalog]:
+    """
+    Selects a paint can catalog from the registry of the application.
+
+    Args:
+        request (Request): The request, whose application keeps the
+            registry in `app.state.paint_can_catalogs`.
+        catalog_id (str): The id of the catalog, the default one when None.
+
+    Returns:
+        The compiled catalog, or None for the built-in catalog.
+
+    Raises:
+        HTTPException: With status code 404, if no catalog has the id.
+    """
+    try:
+        return request.app.state.paint_can_catalogs.get(catalog_id)
+    except UnknownPaintCanCatalogError as error:
+        raise HTTPException(
+            status_code=404,
+            detail=f"The paint can catalog '{error.args[0]}' was not found.",
+        )
@@ -0,0 +1,67 @@
+from hashlib import blake2b
+from typing import Optional, Tuple
+
+from fastapi import Request
+
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.conditional_requests import register_etag
+from src.schemas.request.room import Room
+from src.services.exception import UnknownPaintCanCatalogError
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
+from .fast_json_codecs import decode_room_key
+
+
+def paint_cans_needed_etag(
+    request: Request, body: bytes
+) -> Optional[Tuple[str, bool]]:
+    """
+    Computes the strong ETag of the amount of paint cans needed to paint
+    the room of a request, from the raw body, without building the Room
+    and Walls or validating their dimensions, and checks if the pipeline
+    of the application already calculated the paint cans needed of the
+    room, so a room with inconsistent dimensions, or one the catalog can
+    not serve, is never answered with a 304.
+
+    The ETag is a digest of `Room.canonical_key`, the allocation strategy,
+    every value of the catalog and `PaintCansPipeline.rules_version()`, so
+    it changes whenever the response may change, and it is the same in
+    every process.
+
+    Args:
+        request (Request): The request, with the `allocation` and `catalog`
+            query params.
+        body (bytes): The JSON body of the request.
+
+    Returns:
+        The quoted ETag and True when the pipeline holds the PaintCansNeeded
+        of the room, or None when the body can not be decoded, or the
+        allocation strategy or the catalog do not exist, in which case the
+        request is handled without ETag.
+    """
+    room_key = decode_room_key(body)
+    if room_key is None:
+        return None
+
+    query_params = request.query_params
+    try:
+        catalog = request.app.state.paint_can_catalogs.get(
+            query_params.get("catalog")
+        )
+        allocation_key = PaintCansCalculator.allocation_key(
+            query_params.get("allocation"), catalog
+        )
+    except (UnknownPaintCanCatalogError, ValueError):
+        return None
+
+    key = (PaintCansPipeline.rules_version(), allocation_key, room_key)
+    etag = f'"{blake2b(repr(key).encode(), digest_size=16).hexdigest()}"'
+    pipeline = request.app.state.paint_cans_pipeline
+    return etag, pipeline.has_paint_cans_needed(allocation_key, room_key)
+
+
+def register_paint_mall_etags() -> None:
+    """
+    Registers the ETag functions of the paint mall models.
+    """
+    register_etag(Room, paint_cans_needed_etag)
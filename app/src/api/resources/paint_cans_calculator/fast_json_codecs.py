@@ -0,0 +1,111 @@
+from typing import Annotated, Optional, Tuple
+
+import msgspec
+
+from config import ApiConfig
+from src.extensions.fast_json import (
+    register_fast_json_decoder,
+    register_fast_json_encoder,
+)
+from src.schemas.request.room import Room, canonical_room_key
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+from src.schemas.wall import Wall
+
+from .responses import paint_cans_needed_body
+
+
+class WallStruct(msgspec.Struct, forbid_unknown_fields=True):
+    """
+    The msgspec schema of a wall in a request body, with the same
+    constraints of the `Wall` fields.
+    """
+
+    width: Annotated[float, msgspec.Meta(gt=0)]
+    height: Annotated[float, msgspec.Meta(gt=0)]
+    number_doors: Annotated[int, msgspec.Meta(ge=0)] = 0
+    number_windows: Annotated[int, msgspec.Meta(ge=0)] = 0
+
+
+class RoomStruct(msgspec.Struct, forbid_unknown_fields=True):
+    """
+    The msgspec schema of the body of a room, with the same shape and
+    number of walls of `Room`.
+    """
+
+    walls: Annotated[
+        Tuple[WallStruct, ...],
+        msgspec.Meta(min_length=1, max_length=ApiConfig.ROOM_MAX_WALLS),
+    ]
+
+
+_room_decoder = msgspec.json.Decoder(RoomStruct)
+
+
+def decode_room(body: bytes) -> Optional[Room]:
+    """
+    Decodes the body of a room with a precompiled msgspec decoder.
+
+    The decoder is stricter than Pydantic, it does not coerce strings or
+    booleans into numbers, so every body it accepts is validated by
+    Pydantic into the same values. The Room and Walls are built without
+    validating them again.
+
+    Args:
+        body (bytes): The JSON body of the request.
+
+    Returns:
+        The Room of the body, or None if it can not be decoded, in which
+        case the body must be validated by Pydantic.
+    """
+    try:
+        room = _room_decoder.decode(body)
+    except msgspec.DecodeError:
+        return None
+
+    return Room.construct(
+        walls=tuple(
+            Wall.construct(
+                width=wall.width,
+                height=wall.height,
+                number_doors=wall.number_doors,
+                number_windows=wall.number_windows,
+            )
+            for wall in room.walls
+        )
+    )
+
+
+def decode_room_key(body: bytes) -> Optional[bytes]:
+    """
+    Decodes the body of a room straight into its `Room.canonical_key`,
+    without building the Room and Walls.
+
+    Args:
+        body (bytes): The JSON body of the request.
+
+    Returns:
+        The canonical key of the room of the body, or None if it can not be
+        decoded.
+    """
+    try:
+        room = _room_decoder.decode(body)
+    except msgspec.DecodeError:
+        return None
+
+    return canonical_room_key(
+        (
+            float(wall.width),
+            float(wall.height),
+            int(wall.number_doors),
+            int(wall.number_windows),
+        )
+        for wall in room.walls
+    )
+
+
+def register_paint_mall_fast_json_codecs() -> None:
+    """
+    Registers the fast JSON codecs of the paint mall models.
+    """
+    register_fast_json_decoder(Room, decode_room)
+    register_fast_json_encoder(PaintCansNeeded, paint_cans_needed_body)
@@ -0,0 +1,106 @@
+import msgspec
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.fast_json import PreEncodedJSONResponse
+from src.extensions.metrics import register_metrics
+from src.extensions.result_cache import ResultCache
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+
+_encoder = msgspec.json.Encoder()
+
+_paint_cans_needed_bodies = ResultCache(max_size=ApiConfig.RESPONSE_CACHE_SIZE)
+_unprocessable_entity_bodies = ResultCache(
+    max_size=ApiConfig.RESPONSE_CACHE_SIZE
+)
+
+
+def encode_paint_cans_needed(paint_cans_needed: PaintCansNeeded) -> bytes:
+    """
+    Encodes the paint cans needed into the same JSON bytes of the FastAPI
+    serialization, where the sizes of the cans are keys like "18.0".
+
+    Args:
+        paint_cans_needed (PaintCansNeeded): The response to be encoded.
+
+    Returns:
+        bytes: The JSON of the response.
+    """
+    return _encoder.encode(
+        {
+            "paint_cans": {
+                str(size): amount
+                for size, amount in paint_cans_needed.paint_cans.items()
+            }
+        }
+    )
+
+
+def paint_cans_needed_body(paint_cans_needed: PaintCansNeeded) -> bytes:
+    """
+    Returns the JSON bytes of the paint cans needed, encoded once for each
+    distinct amount of paint cans and interned in a bounded cache.
+
+    Args:
+        paint_cans_needed (PaintCansNeeded): The response to be encoded.
+
+    Returns:
+        bytes: The JSON of the response.
+    """
+    paint_cans_key = tuple(paint_cans_needed.paint_cans.items())
+    body = _paint_cans_needed_bodies.get(paint_cans_key)
+    if body is None:
+        body = encode_paint_cans_needed(paint_cans_needed)
+        _paint_cans_needed_bodies.put(paint_cans_key, body)
+    return body
+
+
+def unprocessable_entity_response(
+    room: Room, error: ValidationError
+) -> PreEncodedJSONResponse:
+    """
+    Builds the 422 response of a room with inconsistent dimensions. The
+    errors of a room only depend on its dimensions, so the JSON bytes are
+    encoded once for each distinct room and interned in a bounded cache,
+    keyed by the digest of the room, unless the errors are too large for
+    `PaintCansPipeline.is_cacheable()`.
+
+    Args:
+        room (Room): The room with inconsistent dimensions.
+        error (ValidationError): The error raised for the room.
+
+    Returns:
+        PreEncodedJSONResponse: The response, with the same body of a
+        `JSONResponse` of the errors.
+    """
+    if not PaintCansPipeline.is_cacheable(error):
+        return PreEncodedJSONResponse(
+            JSONResponse(content=error.errors()).body, status_code=422
+        )
+
+    room_key = room.canonical_key
+    body = _unprocessable_entity_bodies.get(room_key)
+    if body is None:
+        body = JSONResponse(content=error.errors()).body
+        _unprocessable_entity_bodies.put(room_key, body)
+    return PreEncodedJSONResponse(body, status_code=422)
+
+
+def response_cache_metrics() -> dict:
+    """
+    Returns the metrics of the caches of encoded responses.
+
+    Returns:
+        dict: The stats of the paint cans needed and unprocessable entity
+        bodies caches.
+    """
+    return {
+        "paint_cans_needed": _paint_cans_needed_bodies.stats(),
+        "unprocessable_entity": _unprocessable_entity_bodies.stats(),
+    }
+
+
+register_metrics("response_cache", response_cache_metrics)
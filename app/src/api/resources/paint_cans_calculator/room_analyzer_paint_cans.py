@@ -1,10 +1,22 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from functools import partial
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import ValidationError
 
-from src.controllers.main_controller import PaintCansController
+from config import ApiConfig
+from src.extensions.offload import run_inline_or_offload
 from src.schemas.request.room import Room
 from src.schemas.response.paint_cans_needed import PaintCansNeeded
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import UnavailableAllocationError
+
+from .catalogs import (
+    CATALOG_NOT_FOUND_RESPONSE,
+    catalog_query,
+    select_paint_can_catalog,
+)
+from .responses import unprocessable_entity_response
 
 
 def register_post_paint_cans_needed_view(router: APIRouter):
@@ -46,6 +58,7 @@ def register_post_paint_cans_needed_view(router: APIRouter):
                     }
                 },
             },
+            404: CATALOG_NOT_FOUND_RESPONSE,
             500: {
                 "description": "Server error",
                 "content": {
@@ -58,13 +71,26 @@ def register_post_paint_cans_needed_view(router: APIRouter):
             },
         },
     )
-    def post_paint_cans(room: Room) -> JSONResponse | PaintCansNeeded:
+    async def post_paint_cans(
+        room: Room,
+        request: Request,
+        allocation: Optional[AllocationStrategy] = Query(
+            default=None,
+            description=(
+                "`greedy` prefers the largest cans, `exact` leaves the least"
+                " paint over with the fewest cans, `cheapest` buys the"
+                " cheapest cans. Defaults to the server configuration."
+            ),
+        ),
+        catalog: Optional[str] = catalog_query(),
+    ) -> Response | PaintCansNeeded:
         """Calculate the amount of paint cans needed to paint a room.
 
         ## Request Body
 
         The request body should be a JSON object containing an array of walls,
-        where each wall is defined by the following properties:
+        from one up to `ROOM_MAX_WALLS`, where each wall is defined by the
+        following properties:
 
         - `width` (float): The width of the wall in feet.
         - `height` (float): The height of the wall in feet.
@@ -103,26 +129,59 @@ def register_post_paint_cans_needed_view(router: APIRouter):
           ]
         }
         ```
+
+        ## Query Parameters
+
+        - `allocation` (string, optional): `greedy` gives preference to the
+            largest cans, `exact` chooses the cans that leave the least paint
+            over and, among those, the fewest cans, `cheapest` chooses the
+            cheapest cans at the prices of the catalog.
+        - `catalog` (string, optional): The id of the paint can catalog,
+            with its own sizes, coverage and prices.
+
         ## Error Responses
 
+        - `404` (Not found): If the paint can catalog does not exist.
+
         - `422` (Validation error): If the request body fails validation,
             returns a JSON object with the following properties:
             detail (array): An array of objects containing details
-             about each validation error.
+             about each validation error. Or, if the catalog does not have
+             the prices needed by the `cheapest` allocation, detail (string).
         - `500` (Server error): If an unexpected error occurs on the
             server, returns a JSON object with the following properties:
             detail (string): A description of the error.
 
         """
 
+        paint_can_catalog = select_paint_can_catalog(request, catalog)
+        micro_batcher = request.app.state.paint_cans_micro_batcher
+        number_walls = len(room.walls)
         try:
-            paint_cans_needed = PaintCansController(room)
-            response = (
-                paint_cans_needed.calculate_paint_cans_needed_controller()
-            )
+            # Large rooms are not batched, they are calculated on their own
+            # in the threadpool.
+            if (
+                micro_batcher is None
+                or number_walls > ApiConfig.ASYNC_INLINE_MAX_WALLS
+            ):
+                response = await run_inline_or_offload(
+                    partial(
+                        request.app.state.paint_cans_pipeline.calculate,
+                        room,
+                        allocation,
+                        paint_can_catalog,
+                    ),
+                    size=number_walls,
+                )
+            else:
+                response = await micro_batcher.calculate(
+                    room, allocation, paint_can_catalog
+                )
 
         except ValidationError as error:
-            return JSONResponse(status_code=422, content=error.errors())
+            return unprocessable_entity_response(room, error)
+        except UnavailableAllocationError as error:
+            raise HTTPException(status_code=422, detail=str(error))
         except Exception:
             raise HTTPException(
                 status_code=500,
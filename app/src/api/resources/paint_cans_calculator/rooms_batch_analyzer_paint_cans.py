@@ -0,0 +1,179 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from src.controllers.batch_controller import PaintCansBatchController
+from src.schemas.request.rooms_batch import RoomsBatch
+from src.schemas.response.paint_cans_needed_batch import PaintCansNeededBatch
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import UnavailableAllocationError
+
+from .catalogs import (
+    CATALOG_NOT_FOUND_RESPONSE,
+    catalog_query,
+    select_paint_can_catalog,
+)
+
+
+def register_post_paint_cans_needed_batch_view(router: APIRouter):
+    @router.post(
+        path="/paint_mall/paint_cans_needed/batch",
+        response_model=PaintCansNeededBatch,
+        response_model_exclude_none=True,
+        status_code=200,
+        summary=(
+            "Calculate the amount of paint cans needed to paint each room"
+            " of a batch."
+        ),
+        responses={
+            200: {
+                "description": (
+                    "One result per room: the amount of paint cans needed"
+                    " or the inconsistencies found on its walls."
+                ),
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "results": [
+                                {
+                                    "paint_cans": {
+                                        "18.0": 1,
+                                        "3.6": 2,
+                                        "2.5": 0,
+                                        "0.5": 2,
+                                    }
+                                },
+                                {
+                                    "errors": {
+                                        "Wall_1": [
+                                            "Wall is 2.10m shorter than"
+                                            " the door."
+                                        ]
+                                    }
+                                },
+                            ]
+                        }
+                    }
+                },
+            },
+            422: {
+                "description": "Validation error",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": [
+                                {
+                                    "loc": [
+                                        "body",
+                                        "rooms",
+                                        0,
+                                        "walls",
+                                        0,
+                                        "width",
+                                    ],
+                                    "msg": "ensure this value is greater than 0",
+                                    "type": "value_error.number.not_gt",
+                                    "ctx": {"limit_value": 0},
+                                }
+                            ]
+                        }
+                    }
+                },
+            },
+            404: CATALOG_NOT_FOUND_RESPONSE,
+            500: {
+                "description": "Server error",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "An error occurred on the server."
+                        }
+                    }
+                },
+            },
+        },
+    )
+    async def post_paint_cans_batch(
+        rooms_batch: RoomsBatch,
+        request: Request,
+        allocation: Optional[AllocationStrategy] = Query(
+            default=None,
+            description=(
+                "`greedy` prefers the largest cans, `exact` leaves the least"
+                " paint over with the fewest cans, `cheapest` buys the"
+                " cheapest cans. Defaults to the server configuration."
+            ),
+        ),
+        catalog: Optional[str] = catalog_query(),
+    ) -> PaintCansNeededBatch:
+        """Calculate the amount of paint cans needed to paint each room of a
+        batch.
+
+        ## Request Body
+
+        The request body should be a JSON object containing an array of
+        rooms, where each room has the same shape of the body accepted by
+        `/paint_mall/paint_cans_needed`.
+
+        Example:
+
+        ```json
+        {
+          "rooms": [
+            {
+              "walls": [
+                {"width": 7, "height": 5, "number_doors": 1, "number_windows": 2},
+                {"width": 7, "height": 5, "number_doors": 2, "number_windows": 2},
+                {"width": 7, "height": 5, "number_doors": 0, "number_windows": 0},
+                {"width": 7, "height": 5, "number_doors": 0, "number_windows": 0}
+              ]
+            }
+          ]
+        }
+        ```
+
+        ## Query Parameters
+
+        - `allocation` (string, optional): The strategy to choose the paint
+            cans of every room, as in `/paint_mall/paint_cans_needed`.
+        - `catalog` (string, optional): The id of the paint can catalog.
+
+        ## Response Body
+
+        A JSON object with an array of results, one per room and in the same
+        order of the rooms. Each result contains either `paint_cans`, when
+        the room dimensions are consistent, or `errors`, with the
+        inconsistencies found for each wall of the room.
+
+        ## Error Responses
+
+        - `404` (Not found): If the paint can catalog does not exist.
+
+        - `422` (Validation error): If the request body fails validation,
+            returns a JSON object with the following properties:
+            detail (array): An array of objects containing details
+             about each validation error.
+        - `500` (Server error): If an unexpected error occurs on the
+            server, returns a JSON object with the following properties:
+            detail (string): A description of the error.
+
+        """
+
+        paint_can_catalog = select_paint_can_catalog(request, catalog)
+        try:
+            paint_cans_needed = PaintCansBatchController(
+                rooms_batch.rooms, allocation, paint_can_catalog
+            )
+            response = await (
+                paint_cans_needed.calculate_paint_cans_needed_batch_controller_async()
+            )
+
+        except UnavailableAllocationError as error:
+            raise HTTPException(status_code=422, detail=str(error))
+        except Exception:
+            raise HTTPException(
+                status_code=500,
+                detail="An internal error occurred on the server.",
+            )
+
+        return response
@@ -0,0 +1,134 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from src.controllers.stream_controller import PaintCansStreamController
+from src.extensions.ndjson import NDJSON_MEDIA_TYPE, NDJSONStreamingResponse
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import UnavailableAllocationError
+
+from .catalogs import (
+    CATALOG_NOT_FOUND_RESPONSE,
+    catalog_query,
+    select_paint_can_catalog,
+)
+from .fast_json_codecs import decode_room
+
+
+def register_post_paint_cans_needed_stream_view(router: APIRouter):
+    @router.post(
+        path="/paint_mall/paint_cans_needed/stream",
+        response_class=NDJSONStreamingResponse,
+        status_code=200,
+        summary=(
+            "Calculate the amount of paint cans needed to paint each room"
+            " of a stream of newline-delimited JSON rooms."
+        ),
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    NDJSON_MEDIA_TYPE: {
+                        "schema": {"type": "string"},
+                        "example": (
+                            '{"walls": [{"width": 7, "height": 5}]}\n'
+                            '{"walls": [{"width": 0.1, "height": 0.1}]}\n'
+                        ),
+                    }
+                },
+            }
+        },
+        responses={
+            200: {
+                "description": (
+                    "One NDJSON line per room, with the number of its line"
+                    " and the amount of paint cans needed, the"
+                    " inconsistencies found on its walls or the errors of"
+                    " a line that is not a valid room."
+                ),
+                "content": {
+                    NDJSON_MEDIA_TYPE: {
+                        "example": (
+                            '{"line":1,"paint_cans":{"18.0":0,"3.6":1,'
+                            '"2.5":1,"0.5":2}}\n'
+                            '{"line":2,"errors":{"Wall_1":["The wall area,'
+                            " 0.01m2, is out of range between 1m2 and"
+                            ' 50m2."]}}\n'
+                        )
+                    }
+                },
+            },
+            404: CATALOG_NOT_FOUND_RESPONSE,
+            422: {
+                "description": "Unavailable allocation",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": (
+                                "The paint can catalog 'default' has no"
+                                " prices."
+                            )
+                        }
+                    }
+                },
+            },
+        },
+    )
+    async def post_paint_cans_stream(
+        request: Request,
+        allocation: Optional[AllocationStrategy] = Query(
+            default=None,
+            description=(
+                "`greedy` prefers the largest cans, `exact` leaves the least"
+                " paint over with the fewest cans, `cheapest` buys the"
+                " cheapest cans. Defaults to the server configuration."
+            ),
+        ),
+        catalog: Optional[str] = catalog_query(),
+    ) -> NDJSONStreamingResponse:
+        """Calculate the amount of paint cans needed to paint each room of a
+        stream of rooms.
+
+        ## Request Body
+
+        Newline-delimited JSON, one room per line, where each room has the
+        same shape of the body accepted by `/paint_mall/paint_cans_needed`.
+        Blank lines are skipped. The body is read as it arrives, so it can
+        have any number of rooms.
+
+        ## Query Parameters
+
+        - `allocation` (string, optional): The strategy to choose the paint
+            cans of every room, as in `/paint_mall/paint_cans_needed`.
+        - `catalog` (string, optional): The id of the paint can catalog.
+
+        ## Response Body
+
+        Newline-delimited JSON, one line per room and in the same order of
+        the rooms, streamed as the rooms are calculated. Each line is an
+        object with the `line` of the room and either `paint_cans`, when
+        the room dimensions are consistent, `errors`, with the
+        inconsistencies found for each wall of the room, or `detail`, with
+        the validation errors of a line that is not a valid room, or is
+        longer than `STREAM_MAX_LINE_BYTES`.
+
+        ## Error Responses
+
+        - `404` (Not found): If the paint can catalog does not exist.
+
+        - `422` (Validation error): If the catalog can not choose the paint
+            cans with the allocation strategy.
+
+        """
+
+        paint_can_catalog = select_paint_can_catalog(request, catalog)
+        try:
+            paint_cans_needed = PaintCansStreamController(
+                request.stream(), allocation, paint_can_catalog, decode_room
+            )
+        except UnavailableAllocationError as error:
+            raise HTTPException(status_code=422, detail=str(error))
+
+        return NDJSONStreamingResponse(
+            paint_cans_needed.calculate_paint_cans_needed_stream_controller()
+        )
@@ -1,10 +1,27 @@
 from fastapi import APIRouter
 
+from src.extensions.conditional_requests import ConditionalRoute
+
+from .building_analyzer_paint_cans import register_post_building_quote_view
+from .etags import register_paint_mall_etags
+from .fast_json_codecs import register_paint_mall_fast_json_codecs
 from .room_analyzer_paint_cans import register_post_paint_cans_needed_view
+from .rooms_batch_analyzer_paint_cans import (
+    register_post_paint_cans_needed_batch_view,
+)
+from .rooms_stream_analyzer_paint_cans import (
+    register_post_paint_cans_needed_stream_view,
+)
 
 paint_mall_router_v1 = APIRouter(
     prefix="/api/v1",
     tags=["Paint Mall Endpoints"],
+    route_class=ConditionalRoute,
 )
 
+register_paint_mall_fast_json_codecs()
+register_paint_mall_etags()
 register_post_paint_cans_needed_view(paint_mall_router_v1)
+register_post_paint_cans_needed_batch_view(paint_mall_router_v1)
+register_post_building_quote_view(paint_mall_router_v1)
+register_post_paint_cans_needed_stream_view(paint_mall_router_v1)
@@ -0,0 +1,137 @@
+from typing import List
+
+import numpy as np
+
+from src.extensions.logger import log_exceptions
+from src.extensions.offload import run_inline_or_offload
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed_batch import (
+    PaintCansNeededBatch,
+    RoomPaintCansResult,
+)
+from src.services.can_allocation import AllocationStrategy
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
+
+class PaintCansBatchController:
+    """
+    A controller class that handles the logic for calculating the amount of
+    paint cans needed to paint each room of a batch of rooms.
+
+    The walls of all rooms are validated at once by `ColumnarRoomValidator`,
+    which applies the `RoomValidator` rules as array masks, and the paint
+    cans of all consistent rooms are calculated at once by
+    `PaintCansCalculator.calculate_many()`.
+    A room with inconsistent dimensions does not interrupt the batch, its
+    wall errors are reported in its own result instead.
+
+    Attributes:
+        rooms: A list of Room objects representing the rooms to be painted.
+        allocation: The AllocationStrategy used to choose the paint cans.
+        catalog: The CompiledPaintCanCatalog of the paint cans, None for the
+            built-in one.
+
+    Methods:
+        calculate_paint_cans_needed_batch_controller(): Calculates the amount
+        of paint cans needed for each room and returns a PaintCansNeededBatch
+        object with one result per room, in the same order of the rooms.
+
+        calculate_paint_cans_needed_batch_controller_async(): The same
+        calculation for async endpoints, run inline on the event loop for
+        small batches and in the threadpool for large ones.
+
+    Raises:
+        TypeError: If any of the rooms is not an instance of the Room class.
+    """
+
+    def __init__(
+        self,
+        rooms: List[Room],
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ):
+        self.rooms = rooms
+        self.allocation = PaintCansCalculator.allocation_strategy(allocation)
+        self.catalog = catalog
+
+        if not all(isinstance(room, Room) for room in rooms):
+            raise TypeError(
+                "The rooms argument must be a list of instances of the Room"
+                " class."
+            )
+
+    @log_exceptions(
+        msg="exception_paint_cans_calculator_service",
+        extra={
+            "paint_cans_batch_controller": (
+                "calculate_paint_cans_needed_batch_controller"
+            )
+        },
+    )
+    def calculate_paint_cans_needed_batch_controller(
+        self,
+    ) -> PaintCansNeededBatch:
+        """
+        Calculates the amount of paint cans needed to paint each room of the
+        batch.
+
+        Returns:
+            A PaintCansNeededBatch object containing one result per room.
+        """
+        try:
+            invalid_dimensions_values = ColumnarRoomValidator.from_rooms(
+                self.rooms
+            ).invalid_dimensions_values()
+
+            valid_rooms = [
+                room
+                for room, invalid_dimensions_value in zip(
+                    self.rooms, invalid_dimensions_values
+                )
+                if not invalid_dimensions_value
+            ]
+            paint_cans_needed = iter(
+                PaintCansCalculator.calculate_many(
+                    np.fromiter(
+                        (room.geometry.free_area for room in valid_rooms),
+                        np.float64,
+                        len(valid_rooms),
+                    ),
+                    self.allocation,
+                    self.catalog,
+                )
+            )
+
+            results = [
+                RoomPaintCansResult(errors=invalid_dimensions_value)
+                if invalid_dimensions_value
+                else RoomPaintCansResult(
+                    paint_cans=PaintCansCalculator.paint_cans_from_counts(
+                        next(paint_cans_needed), self.catalog
+                    )
+                )
+                for invalid_dimensions_value in invalid_dimensions_values
+            ]
+        except Exception:
+            raise
+
+        return PaintCansNeededBatch(results=results)
+
+    async def calculate_paint_cans_needed_batch_controller_async(
+        self,
+    ) -> PaintCansNeededBatch:
+        """
+        Calculates the amount of paint cans needed to paint each room of the
+        batch from an async endpoint. Batches of up to
+        `ApiConfig.ASYNC_INLINE_MAX_WALLS` walls, over all rooms, are
+        calculated inline on the event loop, larger ones in the threadpool.
+
+        Returns:
+            A PaintCansNeededBatch object containing one result per room.
+        """
+        return await run_inline_or_offload(
+            self.calculate_paint_cans_needed_batch_controller,
+            size=sum(len(room.walls) for room in self.rooms),
+        )
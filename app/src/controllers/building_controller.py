@@ -0,0 +1,165 @@
+import numpy as np
+
+from src.extensions.logger import log_exceptions
+from src.extensions.offload import run_inline_or_offload
+from src.schemas.request.building import Building
+from src.schemas.response.building_quote import (
+    BuildingQuote,
+    FloorQuote,
+    RoomQuote,
+)
+from src.services.can_allocation import AllocationStrategy
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
+
+class BuildingQuoteController:
+    """
+    A controller class that handles the logic for quoting the paint cans
+    needed to paint a whole building, bought together for each floor and
+    for the building.
+
+    The walls of all rooms of the building are validated at once by
+    `ColumnarRoomValidator`, with the `RoomValidator` rules. The free areas
+    of the consistent rooms are summed per floor in a single pass, and the
+    paint cans of every floor and of the building are calculated at once by
+    `PaintCansCalculator.calculate_many()`, on the pooled areas, so the
+    paint left over in one room covers the others.
+    A room with inconsistent dimensions does not interrupt the quote, its
+    wall errors are reported in its own result and its area is left out of
+    the totals.
+
+    Attributes:
+        building: The Building to be painted.
+        allocation: The AllocationStrategy used to choose the paint cans.
+        catalog: The CompiledPaintCanCatalog of the paint cans, None for the
+            built-in one.
+
+    Methods:
+        calculate_building_quote_controller(): Validates every room and
+        returns a BuildingQuote object with the result of each room and the
+        totals of each floor and of the building.
+
+        calculate_building_quote_controller_async(): The same calculation
+        for async endpoints, run inline on the event loop for small
+        buildings and in the threadpool for large ones.
+
+    Raises:
+        TypeError: If the building is not an instance of the Building class.
+    """
+
+    def __init__(
+        self,
+        building: Building,
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ):
+        self.building = building
+        self.allocation = PaintCansCalculator.allocation_strategy(allocation)
+        self.catalog = catalog
+
+        if not isinstance(building, Building):
+            raise TypeError(
+                "The building argument must be an instance of the Building"
+                " class."
+            )
+
+    @log_exceptions(
+        msg="exception_paint_cans_calculator_service",
+        extra={
+            "building_quote_controller": (
+                "calculate_building_quote_controller"
+            )
+        },
+    )
+    def calculate_building_quote_controller(self) -> BuildingQuote:
+        """
+        Quotes the paint cans needed to paint the building.
+
+        Returns:
+            A BuildingQuote object containing one result per room and the
+            free area and paint cans of each floor and of the building.
+        """
+        try:
+            floors = self.building.floors
+            rooms = self.building.rooms
+            invalid_dimensions_values = ColumnarRoomValidator.from_rooms(
+                rooms
+            ).invalid_dimensions_values()
+
+            free_areas = np.fromiter(
+                (
+                    0.0
+                    if invalid_dimensions_value
+                    else room.geometry.free_area
+                    for room, invalid_dimensions_value in zip(
+                        rooms, invalid_dimensions_values
+                    )
+                ),
+                np.float64,
+                len(rooms),
+            )
+            floors_indexes = np.repeat(
+                np.arange(len(floors)),
+                [len(floor.rooms) for floor in floors],
+            )
+            floors_free_areas = np.bincount(
+                floors_indexes, weights=free_areas, minlength=len(floors)
+            )
+            building_free_area = floors_free_areas.sum()
+
+            paint_cans_needed = PaintCansCalculator.calculate_many(
+                np.append(floors_free_areas, building_free_area),
+                self.allocation,
+                self.catalog,
+            )
+
+            rooms_quotes = iter(
+                RoomQuote(errors=invalid_dimensions_value)
+                if invalid_dimensions_value
+                else RoomQuote(free_area=round(free_area, 2))
+                for free_area, invalid_dimensions_value in zip(
+                    free_areas.tolist(), invalid_dimensions_values
+                )
+            )
+            floors_quotes = [
+                FloorQuote(
+                    rooms=[next(rooms_quotes) for _ in floor.rooms],
+                    free_area=round(floor_free_area, 2),
+                    paint_cans=PaintCansCalculator.paint_cans_from_counts(
+                        counts, self.catalog
+                    ),
+                )
+                for floor, floor_free_area, counts in zip(
+                    floors, floors_free_areas.tolist(), paint_cans_needed
+                )
+            ]
+        except Exception:
+            raise
+
+        return BuildingQuote(
+            floors=floors_quotes,
+            free_area=round(float(building_free_area), 2),
+            paint_cans=PaintCansCalculator.paint_cans_from_counts(
+                paint_cans_needed[-1], self.catalog
+            ),
+        )
+
+    async def calculate_building_quote_controller_async(
+        self,
+    ) -> BuildingQuote:
+        """
+        Quotes the paint cans needed to paint the building from an async
+        endpoint. Buildings of up to `ApiConfig.ASYNC_INLINE_MAX_WALLS`
+        walls, over all rooms, are quoted inline on the event loop, larger
+        ones in the threadpool.
+
+        Returns:
+            A BuildingQuote object containing one result per room and the
+            totals of each floor and of the building.
+        """
+        return await run_inline_or_offload(
+            self.calculate_building_quote_controller,
+            size=sum(len(room.walls) for room in self.building.rooms),
+        )
@@ -9,7 +9,9 @@ from src.schemas.response.paint_cans_needed import PaintCansNeeded
 from src.schemas.response.unprocessable_geometric_object import (
     UnprocessedGeometricObject,
 )
+from src.services.can_allocation import AllocationStrategy
 from src.services.exception import InvalidRoomDimensionError
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
 from src.services.paint_cans_needed_calculator import PaintCansCalculator
 from src.services.room_validator import RoomValidator
 
@@ -18,8 +20,15 @@ class PaintCansController:
     """
     A controller class that handles the logic for calculating the amount of paint cans needed to paint a room.
 
+    Every call validates and calculates the room. The routes calculate
+    through `PaintCansPipeline`, with its result cache, and this controller
+    is kept as the reference implementation of its results.
+
     Attributes:
         room: A Room object representing the room to be painted.
+        allocation: The AllocationStrategy used to choose the paint cans.
+        catalog: The CompiledPaintCanCatalog of the paint cans, None for the
+            built-in one.
 
     Methods:
         validate_response(paint_can_service): Validates the response from the PaintCansNeededCoordinator object
@@ -32,8 +41,15 @@ class PaintCansController:
         ValidationError: If the input room object fails validation.
     """
 
-    def __init__(self, room: Room):
+    def __init__(
+        self,
+        room: Room,
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ):
         self.room = room
+        self.allocation = PaintCansCalculator.allocation_strategy(allocation)
+        self.catalog = catalog
 
         if not isinstance(room, Room):
             raise TypeError(
@@ -73,6 +89,8 @@ class PaintCansController:
                 )
         except InvalidRoomDimensionError as error:
             return UnprocessedGeometricObject(errors=error.args[0])
+        except ValidationError:
+            raise
         except Exception:
             raise
 
@@ -97,7 +115,9 @@ class PaintCansController:
         """
         try:
             room_validator = RoomValidator(self.room)
-            paint_cans_calculator = PaintCansCalculator(self.room)
+            paint_cans_calculator = PaintCansCalculator(
+                self.room, self.allocation, self.catalog
+            )
 
             paint_can_service = PaintCansNeededCoordinator(
                 room_validator, paint_cans_calculator
@@ -0,0 +1,225 @@
+import asyncio
+import contextvars
+from functools import partial
+from typing import Dict, Hashable, List
+
+from pydantic import ValidationError
+
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.logger import log_exceptions
+from src.extensions.offload import run_inline_or_offload
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+from src.services.can_allocation import AllocationStrategy
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
+
+class _PendingBatch:
+    """
+    The rooms collected for a batch, and the futures of their requests.
+    """
+
+    __slots__ = ("allocation", "catalog", "rooms", "futures", "timer")
+
+    def __init__(
+        self, allocation: AllocationStrategy, catalog: CompiledPaintCanCatalog
+    ) -> None:
+        self.allocation = allocation
+        self.catalog = catalog
+        self.rooms: List[Room] = []
+        self.futures: List[asyncio.Future] = []
+        self.timer = None
+
+
+class PaintCansMicroBatcher:
+    """
+    Collects the rooms of concurrent single room requests and calculates
+    them together with `PaintCansPipeline.calculate_many()`, which
+    validates and calculates all rooms of a batch at once.
+
+    The first room of a batch waits for, at most, `window` seconds for
+    other rooms with the same allocation strategy and catalog. The batch is
+    calculated when the window ends or as soon as it has `max_size` rooms,
+    so the latency added to a request is bounded by the window, even with
+    no other request to share it with.
+
+    It must only be used from the event loop. The batches are calculated
+    inline on the event loop, or in the threadpool when they have more than
+    `ApiConfig.ASYNC_INLINE_MAX_WALLS` walls, outside of the context of any
+    request, and the errors are raised in the request of each room.
+
+    Attributes:
+        _pipeline (PaintCansPipeline): The pipeline that calculates the
+            batches.
+        _window (float): The longest time a room waits for a batch, in
+            seconds.
+        _max_size (int): The largest number of rooms of a batch.
+        _pending (dict): The batch being collected for each allocation
+            strategy and catalog.
+        _tasks (set): The batches being calculated.
+        _requests (int): The number of rooms calculated.
+        _batches (int): The number of batches calculated.
+
+    Methods:
+        calculate(room, allocation, catalog) -> PaintCansNeeded:
+            Calculates the amount of paint cans needed to paint a room in
+            the next batch.
+
+        stats() -> dict:
+            Returns the number of rooms and batches calculated.
+
+    Raises:
+        TypeError: If the pipeline is not an instance of PaintCansPipeline.
+        ValueError: If the window is negative or the max size is not
+            positive.
+    """
+
+    __slots__ = (
+        "_pipeline",
+        "_window",
+        "_max_size",
+        "_pending",
+        "_tasks",
+        "_requests",
+        "_batches",
+    )
+
+    def __init__(
+        self, pipeline: PaintCansPipeline, window: float, max_size: int
+    ) -> None:
+        if not isinstance(pipeline, PaintCansPipeline):
+            raise TypeError(
+                "The pipeline argument must be an instance of the"
+                " PaintCansPipeline class."
+            )
+        if window < 0:
+            raise ValueError("The window must not be negative.")
+        if max_size < 1:
+            raise ValueError("The max size must be positive.")
+
+        self._pipeline = pipeline
+        self._window = window
+        self._max_size = max_size
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._tasks = set()
+        self._requests = 0
+        self._batches = 0
+
+    @log_exceptions(
+        msg="exception_paint_cans_calculator_service",
+        extra={"paint_cans_micro_batcher": "calculate"},
+    )
+    async def calculate(
+        self,
+        room: Room,
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> PaintCansNeeded:
+        """
+        Calculates the amount of paint cans needed to paint the room, in the
+        next batch of rooms with the same allocation strategy and catalog.
+
+        Args:
+            room (Room): The room to be painted.
+            allocation (AllocationStrategy): The strategy to choose the paint
+                cans, `ApiConfig.PAINT_CANS_ALLOCATION` when not given.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
+
+        Returns:
+            The same PaintCansNeeded returned by
+            `PaintCansPipeline.calculate()`.
+
+        Raises:
+            ValidationError: If the room has inconsistent dimensions, the
+                same error raised by `PaintCansPipeline.calculate()`.
+        """
+        loop = asyncio.get_running_loop()
+        allocation = PaintCansCalculator.allocation_strategy(allocation)
+        key = PaintCansCalculator.allocation_key(allocation, catalog)
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(allocation, catalog)
+            batch.timer = loop.call_later(
+                self._window,
+                self._flush,
+                key,
+                context=contextvars.Context(),
+            )
+
+        future = loop.create_future()
+        batch.rooms.append(room)
+        batch.futures.append(future)
+        if len(batch.rooms) >= self._max_size:
+            batch.timer.cancel()
+            self._flush(key)
+
+        result = await future
+        if isinstance(result, ValidationError):
+            raise ValidationError(result.raw_errors, result.model)
+        return result
+
+    def _flush(self, key: Hashable) -> None:
+        """
+        Stops collecting the batch of a key and starts calculating it, in a
+        task outside of the context of any request.
+        """
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            self._calculate_batch(batch), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _calculate_batch(self, batch: _PendingBatch) -> None:
+        """
+        Calculates the rooms of a batch and resolves the future of each
+        room. An error raised for the whole batch is raised in every
+        request of the batch.
+        """
+        self._requests += len(batch.rooms)
+        self._batches += 1
+        try:
+            results = await run_inline_or_offload(
+                partial(
+                    self._pipeline.calculate_many,
+                    batch.rooms,
+                    batch.allocation,
+                    batch.catalog,
+                ),
+                size=sum(len(room.walls) for room in batch.rooms),
+            )
+        except Exception as error:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        """
+        Returns the number of rooms and batches calculated.
+
+        Returns:
+            dict: The rooms, batches and mean size of the batches.
+        """
+        requests, batches = self._requests, self._batches
+        return {
+            "requests": requests,
+            "batches": batches,
+            "mean_batch_size": requests / batches if batches else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"PaintCansMicroBatcher(window= {self._window},"
+            f" max_size= {self._max_size})"
+        )
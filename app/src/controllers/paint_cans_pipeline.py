@@ -0,0 +1,630 @@
+from functools import partial
+from hashlib import blake2b
+from typing import (
+    Callable,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import msgspec
+import numpy as np
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.extensions.logger import log_exceptions
+from src.extensions.metrics import register_metrics
+from src.extensions.result_cache import ResultCache
+from src.extensions.shared_result_cache import SharedResultCache
+from src.extensions.single_flight import SingleFlight
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+from src.schemas.response.unprocessable_geometric_object import (
+    UnprocessedGeometricObject,
+)
+from src.services.can_allocation import AllocationStrategy
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.exception import InvalidRoomDimensionError
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+from src.services.room_validator import RoomValidator
+from src.services.validation_result import WallValidation
+
+_PAINT_CANS_NEEDED = 0
+_UNPROCESSABLE = 1
+
+_result_encoder = msgspec.msgpack.Encoder()
+_result_decoder = msgspec.msgpack.Decoder()
+
+
+class PaintCansPipeline:
+    """
+    A stateless pipeline that calculates the amount of paint cans needed to
+    paint a room, built once by `create_api()` and shared by every request.
+
+    It gives the same results of `PaintCansController`, but binds the
+    validator rules and the calculator once, reads the areas from
+    `Room.geometry`, instead of building a
+    `RoomValidator`, a `PaintCansCalculator` and a
+    `PaintCansNeededCoordinator`, with their interface checks, for every
+    request. The only objects allocated per request are the results.
+
+    The pipeline keeps no state between calls besides its thread safe
+    result cache and the wall validation memo, so it can be called from
+    many threads and coroutines at once.
+
+    Rooms with at least `ApiConfig.COLUMNAR_VALIDATION_MIN_WALLS` walls are
+    validated by `ColumnarRoomValidator`, as array masks over all walls,
+    and do not go through the wall validation memo, so a single large room
+    does not evict the walls of every other room.
+
+    Class-level Attributes:
+        RULES_VERSION (int): The version of the logic of the rules and the
+            calculator, to be bumped when it changes without any of the
+            values of `rules_version()`.
+
+    When a `SharedResultCache` is given, the results missing from the
+    result cache of the process are looked up there, and every result
+    calculated is stored there too, encoded by `encode_result()`, so the
+    processes that share it calculate each room only once.
+
+    While a room missing from the caches is being calculated by `calculate()`,
+    the identical rooms requested from other threads, such as the large
+    rooms offloaded to the threadpool, wait for its result through a
+    `SingleFlight` keyed like the result cache, instead of calculating it
+    again.
+
+    Attributes:
+        _results_cache (ResultCache): The cache of the result of each room.
+        _shared_cache (SharedResultCache): The cache of the encoded result
+            of each room shared with other processes, None for no shared
+            cache.
+        _in_flight (SingleFlight): The rooms being calculated by
+            `calculate()`.
+        _paint_cans_needed_models (ResultCache): The PaintCansNeeded of each
+            distinct amount of paint cans, shared by every room with that
+            amount, so the model is only built and validated once.
+
+    Methods:
+        calculate(room, allocation, catalog) -> PaintCansNeeded:
+            Calculates the amount of paint cans needed to paint a room.
+
+        calculate_many(rooms, allocation, catalog) -> list:
+            Calculates the amount of paint cans needed to paint each one of
+            many rooms at once, without raising for inconsistent rooms.
+
+        rules_version() -> str:
+            Returns the version of the rules the results are built with.
+
+        has_paint_cans_needed(allocation_key, room_key) -> bool:
+            Checks if the PaintCansNeeded of a room is cached.
+
+        is_cacheable(result) -> bool:
+            Checks if a result is small enough to be cached.
+
+        encode_result(result) -> bytes:
+            Encodes a result into compact bytes.
+
+        decode_result(encoded) -> PaintCansNeeded | ValidationError:
+            Decodes the bytes of a result.
+
+        export_results() -> list:
+            Returns the encoded results of the result cache.
+
+        import_results(entries, catalogs, on_failure) -> int:
+            Stores the encoded results of the current catalogs.
+
+    Raises:
+        TypeError: If the results cache is not an instance of ResultCache,
+            the shared cache is not an instance of SharedResultCache, or the
+            in flight rooms are not an instance of SingleFlight.
+    """
+
+    RULES_VERSION = 1
+
+    _paint_cans_needed_models = ResultCache(
+        max_size=ApiConfig.RESPONSE_CACHE_SIZE
+    )
+
+    __slots__ = (
+        "_results_cache",
+        "_shared_cache",
+        "_in_flight",
+        "_wall_validation",
+        "_format_walls_validations",
+        "_paint_cans_for_free_area",
+        "_allocation_strategy",
+        "_allocation_key",
+    )
+
+    def __init__(
+        self,
+        results_cache: ResultCache,
+        shared_cache: Optional[SharedResultCache] = None,
+        in_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        """
+        Initializes a new instance of the PaintCansPipeline class.
+
+        Args:
+            results_cache (ResultCache): The cache of the result of each
+                room, keyed by the allocation strategy, the catalog and
+                `Room.canonical_key`.
+            shared_cache (SharedResultCache): The cache of the encoded
+                result of each room shared with other processes, with the
+                same keys, None for no shared cache.
+            in_flight (SingleFlight): The rooms being calculated, with the
+                same keys, a new SingleFlight when not given.
+
+        Raises:
+            TypeError: If the results cache is not an instance of
+                ResultCache, the shared cache is not an instance of
+                SharedResultCache, or the in flight rooms are not an
+                instance of SingleFlight.
+        """
+        if not isinstance(results_cache, ResultCache):
+            raise TypeError(
+                "The results_cache argument must be an instance of the"
+                " ResultCache class."
+            )
+        if shared_cache is not None and not isinstance(
+            shared_cache, SharedResultCache
+        ):
+            raise TypeError(
+                "The shared_cache argument must be an instance of the"
+                " SharedResultCache class."
+            )
+        if in_flight is not None and not isinstance(in_flight, SingleFlight):
+            raise TypeError(
+                "The in_flight argument must be an instance of the"
+                " SingleFlight class."
+            )
+
+        self._results_cache = results_cache
+        self._shared_cache = shared_cache
+        self._in_flight = SingleFlight() if in_flight is None else in_flight
+        self._wall_validation = RoomValidator.wall_validation
+        self._format_walls_validations = RoomValidator.format_walls_validations
+        self._paint_cans_for_free_area = (
+            PaintCansCalculator.paint_cans_for_free_area
+        )
+        self._allocation_strategy = PaintCansCalculator.allocation_strategy
+        self._allocation_key = PaintCansCalculator.allocation_key
+
+    @classmethod
+    def rules_version(cls) -> str:
+        """
+        Returns the version of the rules the results are built with, a
+        digest of `RULES_VERSION`, the values of the `RoomValidator` rules
+        and the largest area of the exact allocation. Along with
+        `PaintCansCalculator.allocation_key()` and `Room.canonical_key`, it
+        tells apart results that are kept outside of the process.
+
+        Returns:
+            str: The hexadecimal digest of the rules.
+        """
+        rules = (
+            cls.RULES_VERSION,
+            RoomValidator.rules_key(),
+            ApiConfig.EXACT_ALLOCATION_MAX_AREA,
+        )
+        return blake2b(repr(rules).encode(), digest_size=8).hexdigest()
+
+    @log_exceptions(
+        msg="exception_paint_cans_calculator_service",
+        extra={"paint_cans_pipeline": "_validate"},
+    )
+    def _validate(self, room: Room) -> Tuple[WallValidation, ...]:
+        """
+        Validates the dimensions of every wall of the room.
+
+        Args:
+            room (Room): The room to be validated.
+
+        Returns:
+            The WallValidation of each wall of the room, empty for the rooms
+            validated by `ColumnarRoomValidator`.
+
+        Raises:
+            InvalidRoomDimensionError: If the dimensions of any wall are
+                inconsistent, with the same errors raised by
+                `RoomValidator.validate_dimensions()`.
+        """
+        if len(room.walls) >= ApiConfig.COLUMNAR_VALIDATION_MIN_WALLS:
+            invalid_dimensions_values = ColumnarRoomValidator.from_rooms(
+                (room,)
+            ).invalid_dimensions_values()[0]
+            if invalid_dimensions_values:
+                raise InvalidRoomDimensionError(invalid_dimensions_values)
+            return ()
+
+        walls_validations = tuple(
+            self._wall_validation(wall, geometry)
+            for wall, geometry in zip(room.walls, room.geometry.walls)
+        )
+        for validation in walls_validations:
+            if validation.failures:
+                raise InvalidRoomDimensionError(
+                    self._format_walls_validations(walls_validations)
+                )
+        return walls_validations
+
+    @log_exceptions(
+        msg="exception_paint_cans_calculator_service",
+        extra={"paint_cans_pipeline": "calculate"},
+    )
+    def calculate(
+        self,
+        room: Room,
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> PaintCansNeeded:
+        """
+        Calculates the amount of paint cans needed to paint the room. The
+        room is not type checked, it must be a Room already validated by
+        the request schema. A room missing from the caches while an
+        identical one is being calculated waits for its result.
+
+        Args:
+            room (Room): The room to be painted.
+            allocation (AllocationStrategy): The strategy to choose the paint
+                cans, `ApiConfig.PAINT_CANS_ALLOCATION` when not given.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
+
+        Returns:
+            A PaintCansNeeded object containing the number of paint cans needed for each size.
+
+        Raises:
+            ValidationError: If the room has inconsistent dimensions, the
+                same error raised by `PaintCansController`.
+        """
+        allocation = self._allocation_strategy(allocation)
+        room_key = (
+            self._allocation_key(allocation, catalog),
+            room.canonical_key,
+        )
+        cached_response = self._cached_result(room_key)
+        if isinstance(cached_response, ValidationError):
+            raise ValidationError(
+                cached_response.raw_errors, cached_response.model
+            )
+        if cached_response is not None:
+            return cached_response
+
+        try:
+            response, _ = self._in_flight.do(
+                room_key,
+                partial(self._calculate, room, allocation, catalog, room_key),
+            )
+        except ValidationError as error:
+            raise ValidationError(error.raw_errors, error.model)
+        return response
+
+    def _calculate(
+        self,
+        room: Room,
+        allocation: AllocationStrategy,
+        catalog: Optional[CompiledPaintCanCatalog],
+        room_key: Hashable,
+    ) -> PaintCansNeeded:
+        """
+        Validates and calculates a room missing from the caches, and stores
+        its result, or the errors of its inconsistent dimensions.
+        """
+        try:
+            self._validate(room)
+        except InvalidRoomDimensionError as error:
+            try:
+                UnprocessedGeometricObject(errors=error.args[0])
+            except ValidationError as validation_error:
+                self._store_result(room_key, validation_error)
+                raise
+
+        response = self._paint_cans_needed(
+            self._paint_cans_for_free_area(
+                room.geometry.free_area, allocation, catalog
+            )
+        )
+        self._store_result(room_key, response)
+        return response
+
+    def calculate_many(
+        self,
+        rooms: Sequence[Room],
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> List[Union[PaintCansNeeded, ValidationError]]:
+        """
+        Calculates the amount of paint cans needed to paint each one of many
+        rooms at once, with the same results, and the same result cache, of
+        `calculate()`.
+
+        The rooms missing from the cache are validated at once by
+        `ColumnarRoomValidator` and their paint cans are calculated at once
+        by `PaintCansCalculator.calculate_many()`, identical rooms only
+        once. Nothing is raised for a room with inconsistent dimensions, its
+        ValidationError is returned in its place instead, and must not be
+        raised as is, since it is kept in the cache.
+
+        Args:
+            rooms (Sequence[Room]): The rooms to be painted, already
+                validated by the request schema.
+            allocation (AllocationStrategy): The strategy to choose the paint
+                cans, `ApiConfig.PAINT_CANS_ALLOCATION` when not given.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
+
+        Returns:
+            list: The PaintCansNeeded, or the ValidationError, of each room,
+            in the same order of the rooms.
+
+        Raises:
+            UnavailableAllocationError: If the catalog has no data to choose
+                the paint cans with the allocation strategy.
+        """
+        allocation = self._allocation_strategy(allocation)
+        allocation_key = self._allocation_key(allocation, catalog)
+        rooms_keys = [(allocation_key, room.canonical_key) for room in rooms]
+        results = [self._cached_result(key) for key in rooms_keys]
+
+        missing = {}
+        duplicates = []
+        for index, result in enumerate(results):
+            if result is None:
+                first_index = missing.setdefault(rooms_keys[index], index)
+                if first_index != index:
+                    duplicates.append((index, first_index))
+        missing = list(missing.values())
+        if not missing:
+            return results
+
+        invalid_dimensions_values = ColumnarRoomValidator.from_rooms(
+            [rooms[index] for index in missing]
+        ).invalid_dimensions_values()
+        valid = []
+        for index, invalid_dimensions_value in zip(
+            missing, invalid_dimensions_values
+        ):
+            if not invalid_dimensions_value:
+                valid.append(index)
+                continue
+            try:
+                UnprocessedGeometricObject(errors=invalid_dimensions_value)
+            except ValidationError as validation_error:
+                results[index] = validation_error
+
+        paint_cans_needed = PaintCansCalculator.calculate_many(
+            np.fromiter(
+                (rooms[index].geometry.free_area for index in valid),
+                np.float64,
+                len(valid),
+            ),
+            allocation,
+            catalog,
+        )
+        for index, counts in zip(valid, paint_cans_needed):
+            results[index] = self._paint_cans_needed(
+                PaintCansCalculator.paint_cans_from_counts(counts, catalog)
+            )
+
+        for index in missing:
+            self._store_result(rooms_keys[index], results[index])
+        for index, first_index in duplicates:
+            results[index] = results[first_index]
+        return results
+
+    def has_paint_cans_needed(
+        self, allocation_key: Hashable, room_key: Hashable
+    ) -> bool:
+        """
+        Checks if the result cache of the process, or the shared cache,
+        holds the PaintCansNeeded of a room, and not the errors of its
+        inconsistent dimensions. The caches are only peeked at, their
+        counters and eviction order are left as they were.
+
+        Args:
+            allocation_key (Hashable): The key of the allocation strategy
+                and the catalog, from `PaintCansCalculator.allocation_key()`.
+            room_key (Hashable): The `Room.canonical_key` of the room.
+
+        Returns:
+            bool: True if the paint cans needed of the room are cached.
+        """
+        key = (allocation_key, room_key)
+        result = self._results_cache.peek(key)
+        if result is None and self._shared_cache is not None:
+            encoded = self._shared_cache.peek(key)
+            if encoded is not None:
+                result = self.decode_result(encoded)
+        return isinstance(result, PaintCansNeeded)
+
+    def _cached_result(
+        self, room_key: Hashable
+    ) -> Union[PaintCansNeeded, ValidationError, None]:
+        """
+        Returns the result of a room from the result cache of the process,
+        or else from the shared cache, keeping it in the first one.
+        """
+        result = self._results_cache.get(room_key)
+        if result is None and self._shared_cache is not None:
+            encoded = self._shared_cache.get(room_key)
+            if encoded is not None:
+                result = self.decode_result(encoded)
+                self._results_cache.put(room_key, result)
+        return result
+
+    @staticmethod
+    def is_cacheable(result: Union[PaintCansNeeded, ValidationError]) -> bool:
+        """
+        Checks if a result is small enough to be cached. The errors of a
+        room grow with its inconsistent walls, so the errors of more than
+        `ApiConfig.CACHE_MAX_INVALID_WALLS` walls are calculated again
+        instead of being kept.
+
+        Args:
+            result: The PaintCansNeeded, or the ValidationError, of a room.
+
+        Returns:
+            bool: True for a PaintCansNeeded or the errors of few walls.
+        """
+        if not isinstance(result, ValidationError):
+            return True
+        walls = result.errors()[0]["ctx"]["walls"]
+        return len(walls) <= ApiConfig.CACHE_MAX_INVALID_WALLS
+
+    def _store_result(
+        self,
+        room_key: Hashable,
+        result: Union[PaintCansNeeded, ValidationError],
+    ) -> None:
+        """
+        Stores the result of a room in the result cache of the process and
+        in the shared cache, unless it is not `is_cacheable()`.
+        """
+        if not self.is_cacheable(result):
+            return
+        self._results_cache.put(room_key, result)
+        if self._shared_cache is not None:
+            self._shared_cache.put(room_key, self.encode_result(result))
+
+    @staticmethod
+    def encode_result(
+        result: Union[PaintCansNeeded, ValidationError]
+    ) -> bytes:
+        """
+        Encodes a result into compact MessagePack bytes, the amount of each
+        size of paint can, or the errors of each wall of an inconsistent
+        room.
+
+        Args:
+            result: The PaintCansNeeded, or the ValidationError, of a room.
+
+        Returns:
+            bytes: The encoded result.
+        """
+        if isinstance(result, ValidationError):
+            return _result_encoder.encode(
+                (_UNPROCESSABLE, result.errors()[0]["ctx"]["walls"])
+            )
+        return _result_encoder.encode(
+            (_PAINT_CANS_NEEDED, tuple(result.paint_cans.items()))
+        )
+
+    def decode_result(
+        self, encoded: bytes
+    ) -> Union[PaintCansNeeded, ValidationError]:
+        """
+        Decodes the bytes of a result encoded by `encode_result()`.
+
+        Args:
+            encoded (bytes): The encoded result.
+
+        Returns:
+            The PaintCansNeeded, or the ValidationError, of the room.
+        """
+        kind, value = _result_decoder.decode(encoded)
+        if kind == _PAINT_CANS_NEEDED:
+            return self._paint_cans_needed(dict(value))
+        try:
+            UnprocessedGeometricObject(errors=value)
+        except ValidationError as validation_error:
+            return validation_error
+
+    def export_results(self) -> List[Tuple[Hashable, bytes]]:
+        """
+        Returns the results of the result cache of the process, encoded by
+        `encode_result()`, such as for a `CacheSnapshot`.
+
+        Returns:
+            list: The key and the encoded result of each room, from the
+            least to the most recently used.
+        """
+        return [
+            (room_key, self.encode_result(result))
+            for room_key, result in self._results_cache.items()
+        ]
+
+    def import_results(
+        self,
+        entries: Iterable[Tuple[Hashable, bytes]],
+        catalogs: Iterable[Optional[CompiledPaintCanCatalog]],
+        on_failure: Optional[Callable[[Exception], None]] = None,
+    ) -> int:
+        """
+        Stores results exported by `export_results()`, in the result cache
+        and the shared cache, skipping the results of allocation strategies
+        that no longer exist and of catalogs whose values changed.
+
+        An entry that can not be imported, such as one with a malformed key
+        or result, is skipped and reported to `on_failure`, so a damaged
+        snapshot never stops the service from starting.
+
+        Args:
+            entries: The key and the encoded result of each room, from the
+                least to the most recently used, with the allocation
+                strategy as its value.
+            catalogs: The catalogs whose results are kept, None for the
+                built-in catalog.
+            on_failure: The function called with the error of each entry
+                that can not be imported, such as
+                `CacheSnapshot.import_failed()`, None to skip them silently.
+
+        Returns:
+            int: The number of results stored.
+        """
+        catalog_keys = {
+            PaintCansCalculator.paint_can_catalog(catalog).key
+            for catalog in catalogs
+        }
+        imported = 0
+        for entry in entries:
+            try:
+                ((allocation, catalog_key), room_key), encoded = entry
+                if catalog_key not in catalog_keys:
+                    continue
+                try:
+                    allocation = self._allocation_strategy(allocation)
+                except ValueError:
+                    continue
+                result = self.decode_result(encoded)
+                if not isinstance(result, (PaintCansNeeded, ValidationError)):
+                    raise ValueError("The result is not a valid result.")
+                self._store_result(
+                    ((allocation, catalog_key), room_key), result
+                )
+            except Exception as error:
+                if on_failure is not None:
+                    on_failure(error)
+                continue
+            imported += 1
+        return imported
+
+    def _paint_cans_needed(self, paint_cans: dict) -> PaintCansNeeded:
+        """
+        Returns the PaintCansNeeded of an amount of paint cans, built once
+        and shared by every room with that amount.
+        """
+        paint_cans_key = tuple(paint_cans.items())
+        response = self._paint_cans_needed_models.get(paint_cans_key)
+        if response is None:
+            response = PaintCansNeeded(paint_cans=paint_cans)
+            self._paint_cans_needed_models.put(paint_cans_key, response)
+        return response
+
+    def __repr__(self) -> str:
+        return (
+            f"PaintCansPipeline(results_cache= {self._results_cache!r},"
+            f" shared_cache= {self._shared_cache!r},"
+            f" in_flight= {self._in_flight!r})"
+        )
+
+
+register_metrics(
+    "paint_cans_needed_models",
+    PaintCansPipeline._paint_cans_needed_models.stats,
+)
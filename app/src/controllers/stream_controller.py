@@ -0,0 +1,196 @@
+from functools import partial
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+import msgspec
+import numpy as np
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.controllers.batch_controller import PaintCansBatchController
+from src.extensions.ndjson import iter_ndjson_lines
+from src.extensions.offload import run_inline_or_offload
+from src.schemas.request.room import Room
+from src.services.can_allocation import AllocationStrategy
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
+_encoder = msgspec.json.Encoder(enc_hook=str)
+
+
+class PaintCansStreamController:
+    """
+    A controller class that handles the logic for calculating the amount of
+    paint cans needed to paint each room of a stream of newline-delimited
+    JSON rooms, producing a stream of newline-delimited JSON results.
+
+    The lines are read as the chunks of the stream arrive and grouped in
+    chunks of up to `ApiConfig.STREAM_CHUNK_ROOMS` rooms or
+    `ApiConfig.STREAM_CHUNK_BYTES` bytes. Each chunk is parsed, validated
+    and calculated by `PaintCansBatchController`, and its results are
+    yielded before the next chunk is read, so the memory used does not
+    depend on the length of the stream. Chunks of more than
+    `ApiConfig.ASYNC_INLINE_MAX_WALLS` walls are calculated in the
+    threadpool. The walls of a line are counted before it is parsed, as
+    its JSON objects besides the room itself, an upper bound of the walls
+    of a valid room.
+
+    Each result is a JSON object with the number of the line of the room
+    and either `paint_cans`, `errors`, with the inconsistencies found on
+    its walls, or `detail`, with the errors of a line that is not a valid
+    room.
+
+    Attributes:
+        chunks: The chunks of bytes of the stream of rooms.
+        allocation: The AllocationStrategy used to choose the paint cans.
+        catalog: The CompiledPaintCanCatalog of the paint cans, None for the
+            built-in one.
+        decoder: A fast decoder of the line of a room, tried before Pydantic,
+            that returns None when it can not decode the line.
+
+    Methods:
+        calculate_paint_cans_needed_stream_controller(): Yields the results
+        of the rooms, as NDJSON bytes, one chunk at a time.
+
+    Raises:
+        UnavailableAllocationError: If the catalog has no data to choose the
+            paint cans with the allocation strategy.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        allocation: AllocationStrategy = None,
+        catalog: CompiledPaintCanCatalog = None,
+        decoder: Callable[[bytes], Optional[Room]] = None,
+    ):
+        self.chunks = chunks
+        self.allocation = PaintCansCalculator.allocation_strategy(allocation)
+        self.catalog = catalog
+        self.decoder = decoder
+
+        # Fails before the stream starts, while an error response can still
+        # be sent, when the catalog can not choose the cans.
+        PaintCansCalculator.calculate_many(
+            np.empty(0), self.allocation, self.catalog
+        )
+
+    @staticmethod
+    def _count_walls(line: Optional[bytes]) -> int:
+        """
+        Counts the walls of the line of a room, without parsing it, as the
+        number of JSON objects of the line besides the room.
+        """
+        return max(line.count(b"{") - 1, 1) if line is not None else 0
+
+    def _parse_line(self, line_number: int, line: Optional[bytes]):
+        """
+        Parses the line of a room.
+
+        Returns:
+            The Room of the line, or the record with the errors of a line
+            that is not a valid room.
+        """
+        if line is None:
+            return {
+                "line": line_number,
+                "detail": [
+                    {
+                        "loc": ["body", line_number],
+                        "msg": (
+                            "The line is longer than"
+                            f" {ApiConfig.STREAM_MAX_LINE_BYTES} bytes."
+                        ),
+                        "type": "value_error.line_too_long",
+                    }
+                ],
+            }
+
+        room = self.decoder(line) if self.decoder is not None else None
+        if room is not None:
+            return room
+        try:
+            return Room.parse_raw(line)
+        except ValidationError as error:
+            return {"line": line_number, "detail": error.errors()}
+
+    def _calculate_chunk(
+        self, lines: List[Tuple[int, Optional[bytes]]]
+    ) -> bytes:
+        """
+        Parses, validates and calculates the rooms of a chunk of lines.
+
+        Args:
+            lines: The number and the bytes of each line of the chunk.
+
+        Returns:
+            bytes: One NDJSON line with the result of each line, in the same
+            order of the lines.
+        """
+        parsed_lines = [
+            self._parse_line(line_number, line) for line_number, line in lines
+        ]
+        rooms = [room for room in parsed_lines if isinstance(room, Room)]
+        results = iter(
+            PaintCansBatchController(rooms, self.allocation, self.catalog)
+            .calculate_paint_cans_needed_batch_controller()
+            .results
+            if rooms
+            else ()
+        )
+
+        records = []
+        for (line_number, _), parsed_line in zip(lines, parsed_lines):
+            if isinstance(parsed_line, Room):
+                result = next(results)
+                record = (
+                    {"line": line_number, "errors": result.errors}
+                    if result.errors
+                    else {
+                        "line": line_number,
+                        "paint_cans": {
+                            str(size): amount
+                            for size, amount in result.paint_cans.items()
+                        },
+                    }
+                )
+            else:
+                record = parsed_line
+            records.append(_encoder.encode(record))
+
+        records.append(b"")
+        return b"\n".join(records)
+
+    async def calculate_paint_cans_needed_stream_controller(
+        self,
+    ) -> AsyncIterator[bytes]:
+        """
+        Calculates the amount of paint cans needed to paint each room of
+        the stream, one chunk at a time.
+
+        Yields:
+            bytes: The NDJSON results of each chunk of rooms.
+        """
+        lines = []
+        chunk_bytes = 0
+        chunk_walls = 0
+        async for line_number, line in iter_ndjson_lines(
+            self.chunks, ApiConfig.STREAM_MAX_LINE_BYTES
+        ):
+            lines.append((line_number, line))
+            chunk_bytes += len(line) if line is not None else 0
+            chunk_walls += self._count_walls(line)
+            if (
+                len(lines) >= ApiConfig.STREAM_CHUNK_ROOMS
+                or chunk_bytes >= ApiConfig.STREAM_CHUNK_BYTES
+            ):
+                yield await run_inline_or_offload(
+                    partial(self._calculate_chunk, lines), size=chunk_walls
+                )
+                lines = []
+                chunk_bytes = 0
+                chunk_walls = 0
+
+        if lines:
+            yield await run_inline_or_offload(
+                partial(self._calculate_chunk, lines), size=chunk_walls
+            )
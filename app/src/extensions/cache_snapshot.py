@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import struct
+import zlib
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import msgspec
+
+from src.extensions.logger import LOGGER_NAME
+
+_MAGIC = b"PCSN"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sH")
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+SnapshotEntries = List[Tuple[Any, bytes]]
+
+
+def _as_tuples(value: Any) -> Any:
+    """
+    Turns the lists of a decoded key back into tuples, so it is hashable.
+    """
+    if isinstance(value, list):
+        return tuple(_as_tuples(item) for item in value)
+    return value
+
+
+class CacheSnapshot:
+    """
+    A snapshot of the hottest entries of a cache in a local file, so a new
+    process starts with the cache warm instead of empty.
+
+    The file is a short header, with a magic number and the version of
+    the format, followed by the zlib compressed MessagePack of the version
+    of the entries and the entries, each a key, made of tuples, strings,
+    numbers and enums, and its encoded value. A file of another format, or
+    whose entries were built with another version, such as other rules, is
+    ignored when loaded. Decoded keys have tuples in place of lists and the
+    values of enums in place of enums.
+
+    The file is written to a temporary file that replaces it, so a process
+    that crashes or is killed while saving leaves the previous snapshot,
+    and processes that save at once leave one whole snapshot. Errors are
+    logged and never raised, a service starts and stops without its
+    snapshot.
+
+    Attributes:
+        _path (str): The path of the snapshot file.
+        _version (str): The version of the entries.
+        _export_entries (Callable): The function that returns the entries
+            to be saved, from the coldest to the hottest.
+        _lock (Lock): The lock of the saves of this process.
+        _stop_saving (Event): The event that stops the saving thread.
+        _saving_thread (Thread): The thread that saves periodically, if
+            started.
+        _logger (Logger): The logger of the failures.
+        loaded (int): The entries loaded.
+        invalidated (int): The entries ignored because of their version.
+        saved (int): The entries of the last save.
+        failures (int): The loads, imported entries and saves failed.
+
+    Methods:
+        load() -> list: Returns the entries of the snapshot file.
+        import_failed(error): Counts and logs an entry loaded that could not
+            be imported.
+        save() -> int: Saves the entries to the snapshot file.
+        start_saving(interval): Starts saving periodically.
+        stop_saving(): Stops saving periodically and saves once more.
+        stats() -> dict: Returns the counters of the snapshot.
+    """
+
+    __slots__ = (
+        "_path",
+        "_version",
+        "_export_entries",
+        "_lock",
+        "_stop_saving",
+        "_saving_thread",
+        "_logger",
+        "loaded",
+        "invalidated",
+        "saved",
+        "failures",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        version: str,
+        export_entries: Callable[[], Iterable[Tuple[Any, bytes]]],
+    ) -> None:
+        """
+        Initializes a new instance of the CacheSnapshot class.
+
+        Args:
+            path: The path of the snapshot file.
+            version: The version of the entries, entries saved with another
+                version are not loaded.
+            export_entries: The function that returns the entries to be
+                saved, from the coldest to the hottest.
+        """
+        self._path = path
+        self._version = version
+        self._export_entries = export_entries
+        self._lock = Lock()
+        self._stop_saving = Event()
+        self._saving_thread: Optional[Thread] = None
+        self._logger = logging.getLogger(f"{LOGGER_NAME}.cache_snapshot")
+        self.loaded = 0
+        self.invalidated = 0
+        self.saved = 0
+        self.failures = 0
+
+    def _log_failure(self, msg: str, error: Exception) -> None:
+        self.failures += 1
+        self._logger.warning(
+            json.dumps(
+                {
+                    "msg": msg,
+                    "path": self._path,
+                    "error": f"{type(error).__name__}: {error}",
+                }
+            )
+        )
+
+    def load(self) -> SnapshotEntries:
+        """
+        Reads the entries of the snapshot file.
+
+        Returns:
+            list: The key and the encoded value of each entry, from the
+            coldest to the hottest, empty when there is no snapshot file or
+            it has another format or version, or can not be read.
+        """
+        try:
+            with open(self._path, "rb") as snapshot_file:
+                content = snapshot_file.read()
+        except FileNotFoundError:
+            return []
+        except OSError as error:
+            self._log_failure("cache_snapshot_load_failed", error)
+            return []
+
+        try:
+            magic, format_version = _HEADER.unpack_from(content)
+            if magic != _MAGIC or format_version != _FORMAT_VERSION:
+                raise ValueError("The snapshot has an unknown format.")
+            header_size = _HEADER.size
+            body = content[header_size:]
+            version, entries = _decoder.decode(zlib.decompress(body))
+            if not isinstance(entries, list):
+                raise ValueError("The snapshot has no list of entries.")
+        except Exception as error:
+            self._log_failure("cache_snapshot_load_failed", error)
+            return []
+
+        if version != self._version:
+            self.invalidated += len(entries)
+            return []
+
+        # A malformed entry is kept as is, to be skipped by the import.
+        entries = [_as_tuples(entry) for entry in entries]
+        self.loaded += len(entries)
+        return entries
+
+    def import_failed(self, error: Exception) -> None:
+        """
+        Counts and logs an entry returned by `load()` that could not be
+        imported into the cache, such as one with a malformed value.
+
+        Args:
+            error (Exception): The error raised by the entry.
+        """
+        self._log_failure("cache_snapshot_import_failed", error)
+
+    def save(self) -> int:
+        """
+        Saves the entries exported to the snapshot file, replacing it.
+
+        Returns:
+            int: The number of entries saved, 0 when the save failed.
+        """
+        temporary_path = f"{self._path}.{os.getpid()}.tmp"
+        with self._lock:
+            try:
+                entries = list(self._export_entries())
+                content = _HEADER.pack(
+                    _MAGIC, _FORMAT_VERSION
+                ) + zlib.compress(_encoder.encode((self._version, entries)))
+                with open(temporary_path, "wb") as snapshot_file:
+                    snapshot_file.write(content)
+                os.replace(temporary_path, self._path)
+            except Exception as error:
+                self._log_failure("cache_snapshot_save_failed", error)
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    pass
+                return 0
+
+            self.saved = len(entries)
+            return self.saved
+
+    def _save_periodically(self, interval: float) -> None:
+        while not self._stop_saving.wait(interval):
+            self.save()
+
+    def start_saving(self, interval: float) -> None:
+        """
+        Starts a daemon thread that saves the snapshot every `interval`
+        seconds. Nothing is started with a non-positive interval.
+        """
+        if interval <= 0 or self._saving_thread:
+            return
+
+        self._stop_saving.clear()
+        self._saving_thread = Thread(
+            target=self._save_periodically,
+            args=(interval,),
+            name="cache-snapshot",
+            daemon=True,
+        )
+        self._saving_thread.start()
+
+    def stop_saving(self) -> None:
+        """
+        Stops the saving thread, if started, and saves the snapshot once
+        more, with the entries of the cache at shutdown.
+        """
+        if self._saving_thread is not None:
+            self._stop_saving.set()
+            self._saving_thread.join()
+            self._saving_thread = None
+        self.save()
+
+    def stats(self) -> dict:
+        """
+        Returns the entries loaded, invalidated and saved, and the number
+        of failed loads, imported entries and saves.
+        """
+        return {
+            "loaded": self.loaded,
+            "invalidated": self.invalidated,
+            "saved": self.saved,
+            "failures": self.failures,
+        }
+
+    def __repr__(self) -> str:
+        return f"CacheSnapshot(path= {self._path}, version= {self._version})"
@@ -0,0 +1,114 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from config import ApiConfig
+from src.extensions.fast_json import FastJSONRoute
+
+ETagFunction = Callable[[Request, bytes], Optional[Tuple[str, bool]]]
+
+_etag_functions: Dict[type, ETagFunction] = {}
+
+
+def register_etag(model: type, etag_function: ETagFunction) -> None:
+    """
+    Registers the function that computes the ETag of the request bodies of
+    a model.
+
+    Args:
+        model (type): The model of the request bodies.
+        etag_function (Callable): A function that computes the strong ETag,
+            quoted, of the response to a request from the request and its
+            raw body, along with True when a successful response with that
+            ETag is known to exist, such as a result kept in a cache. It
+            returns None when it can not compute the ETag, in which case the
+            request is handled without ETag.
+    """
+    _etag_functions[model] = etag_function
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks if an `If-None-Match` header lists an ETag, with the weak
+    comparison of RFC 9110, so `W/"x"` matches `"x"`. The `*` wildcard is
+    never a match, the endpoints are POST and the body can be anything, so
+    an existing representation says nothing about the one requested.
+
+    Args:
+        if_none_match (str): The value of the header, None when missing.
+        etag (str): The quoted ETag of the response.
+
+    Returns:
+        bool: True if the header lists the ETag.
+    """
+    if not if_none_match:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+class ConditionalRoute(FastJSONRoute):
+    """
+    A FastJSONRoute that supports conditional requests for the endpoints
+    whose body model has an ETag function registered.
+
+    The ETag is only computed for the requests with an `If-None-Match`
+    header, from the raw body, before it is parsed into the body model, so
+    every other request is handled as usual, without any extra work. A
+    request whose `If-None-Match` lists the ETag gets a body-less 304 Not
+    Modified without running the endpoint only when the ETag function
+    knows a successful response with that ETag exists, so a body that is
+    not valid still gets its error. Otherwise the endpoint runs, and its
+    2xx response gets the ETag and the `ApiConfig.ETAG_CACHE_CONTROL`
+    header, or is replaced by a 304 when the `If-None-Match` lists the
+    ETag. Error responses get neither. A client gets the first ETag of a
+    body by sending an `If-None-Match` that lists no ETag of its own.
+
+    The endpoints must be safe, their response must only depend on the body
+    and the values the ETag is computed from, even though they are POST.
+    Conditional requests are only supported when `ApiConfig.ETAGS` is
+    enabled.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        route_handler = super().get_route_handler()
+
+        body_params = self.dependant.body_params
+        if not ApiConfig.ETAGS or len(body_params) != 1:
+            return route_handler
+
+        etag_function = _etag_functions.get(body_params[0].type_)
+        if etag_function is None:
+            return route_handler
+
+        cache_control = ApiConfig.ETAG_CACHE_CONTROL
+
+        async def conditional_route_handler(request: Request) -> Response:
+            if_none_match = request.headers.get("if-none-match")
+            if not if_none_match:
+                return await route_handler(request)
+
+            conditional_etag = etag_function(request, await request.body())
+            if conditional_etag is None:
+                return await route_handler(request)
+
+            etag, known = conditional_etag
+            headers = {"etag": etag}
+            if cache_control:
+                headers["cache-control"] = cache_control
+            matches = etag_matches(if_none_match, etag)
+            if matches and known:
+                return Response(status_code=304, headers=headers)
+
+            response = await route_handler(request)
+            if not 200 <= response.status_code < 300:
+                return response
+            if matches:
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+            return response
+
+        return conditional_route_handler
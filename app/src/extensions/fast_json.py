@@ -0,0 +1,140 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from config import ApiConfig
+
+FastJSONDecoder = Callable[[bytes], Optional[Any]]
+FastJSONEncoder = Callable[[Any], bytes]
+
+_fast_json_decoders: Dict[type, FastJSONDecoder] = {}
+_fast_json_encoders: Dict[type, FastJSONEncoder] = {}
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def register_fast_json_decoder(model: type, decoder: FastJSONDecoder) -> None:
+    """
+    Registers the fast decoder of the request bodies of a model.
+
+    Args:
+        model (type): The model of the request bodies.
+        decoder (Callable): A function that decodes a JSON body into an
+            instance of the model, or returns None when the body can not be
+            decoded exactly as the model would validate it.
+    """
+    _fast_json_decoders[model] = decoder
+
+
+def register_fast_json_encoder(model: type, encoder: FastJSONEncoder) -> None:
+    """
+    Registers the fast encoder of the responses of a model.
+
+    Args:
+        model (type): The model of the responses.
+        encoder (Callable): A function that encodes an instance of the model
+            into the same JSON bytes returned by the FastAPI serialization.
+    """
+    _fast_json_encoders[model] = encoder
+
+
+class PreEncodedJSONResponse(Response):
+    """
+    A JSON response whose content is already encoded into bytes, so it is
+    sent as is.
+    """
+
+    media_type = JSON_MEDIA_TYPE
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+class FastJSONRoute(APIRoute):
+    """
+    An APIRoute that decodes the request body and encodes the response with
+    the fast codecs registered for the models of the endpoint, skipping the
+    Pydantic parsing of the body and the response serialization of FastAPI.
+
+    The fast path is only used when `ApiConfig.FAST_JSON` is enabled, the
+    endpoint only takes a JSON body, and maybe the request and optional
+    query params, and codecs are registered for its body and response
+    models. Query params are left to their defaults, so a request with a
+    query string is handled by the regular FastAPI handler. A body that the fast
+    decoder can not decode, invalid or not, is handled by the regular
+    FastAPI handler, so error responses are the same of the Pydantic path.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        route_handler = super().get_route_handler()
+
+        dependant = self.dependant
+        if (
+            not ApiConfig.FAST_JSON
+            or len(dependant.body_params) != 1
+            or dependant.path_params
+            or any(param.required for param in dependant.query_params)
+            or dependant.header_params
+            or dependant.cookie_params
+            or dependant.dependencies
+            or dependant.background_tasks_param_name
+        ):
+            return route_handler
+
+        body_param = dependant.body_params[0]
+        decoder = _fast_json_decoders.get(body_param.type_)
+        encoder = _fast_json_encoders.get(self.response_model)
+        if decoder is None or encoder is None:
+            return route_handler
+
+        endpoint = dependant.call
+        is_coroutine = asyncio.iscoroutinefunction(endpoint)
+        body_param_name = body_param.name
+        request_param_name = dependant.request_param_name
+        response_model = self.response_model
+        status_code = self.status_code or 200
+        query_defaults = {
+            param.name: param.default for param in dependant.query_params
+        }
+
+        async def fast_route_handler(request: Request) -> Response:
+            if request.scope.get("query_string"):
+                return await route_handler(request)
+
+            content_type = request.headers.get("content-type")
+            if (
+                content_type is not None
+                and content_type.partition(";")[0].strip().lower()
+                != JSON_MEDIA_TYPE
+            ):
+                return await route_handler(request)
+
+            body = decoder(await request.body())
+            if body is None:
+                return await route_handler(request)
+
+            values = {**query_defaults, body_param_name: body}
+            if request_param_name:
+                values[request_param_name] = request
+            if is_coroutine:
+                response = await endpoint(**values)
+            else:
+                response = await run_in_threadpool(endpoint, **values)
+
+            if isinstance(response, Response):
+                return response
+            if isinstance(response, response_model):
+                return PreEncodedJSONResponse(
+                    encoder(response), status_code=status_code
+                )
+            return JSONResponse(
+                jsonable_encoder(response), status_code=status_code
+            )
+
+        return fast_route_handler
@@ -1,10 +1,141 @@
+import asyncio
 import logging
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from threading import Lock
+from typing import Optional, TextIO
+
+from config import ApiConfig
+from src.extensions.metrics import register_metrics
+from src.extensions.request_context import current_request_errors
+
+LOGGER_NAME = "paint_mall"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    A `QueueHandler` that never blocks the thread logging a record. When the
+    bounded queue is full the record is dropped and counted instead.
+
+    Attributes:
+        dropped (int): The number of records dropped since the handler was
+            created.
+    """
+
+    def __init__(self, queue: Queue) -> None:
+        super().__init__(queue)
+        self.dropped = 0
+        self._dropped_lock = Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+_queue_handler: Optional[DroppingQueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+_queue_listener_started = False
+_logging_lock = Lock()
+
+
+def logging_metrics() -> dict:
+    """
+    Returns the metrics of the logging queue.
+
+    Returns:
+        dict: The number of records dropped and waiting in the queue.
+    """
+    if _queue_handler is None:
+        return {"dropped_records": 0, "queued_records": 0}
+    return {
+        "dropped_records": _queue_handler.dropped,
+        "queued_records": _queue_handler.queue.qsize(),
+    }
+
+
+def configure_logging(stream: Optional[TextIO] = None) -> logging.Logger:
+    """
+    Configures, once, the handler of the logger used by `log_exceptions`.
+    Calling it again does not add another handler, so it is safe to call
+    every time an application is created.
+
+    Records are put in a bounded queue by the thread that logs them and
+    written to the stream by a background `QueueListener`, so log I/O never
+    blocks the event loop or the worker threads. The listener is started
+    again if it was stopped by `shutdown_logging()`.
+
+    Args:
+        stream (TextIO, optional): The stream the records are written to,
+            used only the first time the logging is configured. Defaults to
+            sys.stderr.
+
+    Returns:
+        logging.Logger: The configured logger.
+    """
+    global _queue_handler, _queue_listener, _queue_listener_started
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(ApiConfig.LOG_LEVEL.upper())
+    logger.propagate = False
+
+    with _logging_lock:
+        if _queue_handler is None:
+            stream_handler = logging.StreamHandler(stream)
+            stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+            _queue_handler = DroppingQueueHandler(
+                Queue(maxsize=ApiConfig.LOG_QUEUE_SIZE)
+            )
+            _queue_handler.set_name(LOGGER_NAME)
+            _queue_listener = QueueListener(
+                _queue_handler.queue,
+                stream_handler,
+                respect_handler_level=True,
+            )
+            register_metrics("logging", logging_metrics)
+
+        if _queue_handler not in logger.handlers:
+            logger.addHandler(_queue_handler)
+
+        if not _queue_listener_started:
+            _queue_listener.start()
+            _queue_listener_started = True
+
+    return logger
+
+
+def shutdown_logging() -> None:
+    """
+    Stops the background listener of the logging queue, after writing every
+    record still in the queue.
+    """
+    global _queue_listener_started
+
+    with _logging_lock:
+        if _queue_listener_started:
+            _queue_listener.stop()
+            _queue_listener_started = False
 
 
 def log_exceptions(msg: str, extra: dict):
     """
     A decorator function that logs exceptions that occur in a wrapped function.
 
+    The logger is resolved once, when the function is decorated, and its
+    handler is configured once at startup by `configure_logging()`, so the
+    wrapper adds nothing but a `try` block to calls that do not raise. When
+    `ApiConfig.LOG_EXCEPTIONS` is disabled the function is returned as is.
+
+    Inside a request the exception is only recorded in the request errors,
+    which are logged as a single record when the request finishes. Outside
+    of a request it is logged right away. Coroutine functions are wrapped
+    by a coroutine function.
+
     Args:
         msg (str): A message string to include in the log message.
         extra (dict, optional): Additional information to include in the log message.
@@ -14,9 +145,7 @@ def log_exceptions(msg: str, extra: dict):
         function: A decorator function that can be applied to another function.
 
     Example:
-        import logging
-
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
 
         @log_exceptions(msg="An error occurred", extra={"reason": "unknown"})
         def my_function():
@@ -26,19 +155,37 @@ def log_exceptions(msg: str, extra: dict):
     """
 
     def decorator(func):
+        if not ApiConfig.LOG_EXCEPTIONS:
+            return func
+
+        logger = logging.getLogger(f"{LOGGER_NAME}.{func.__name__}")
+
+        def log(error: Exception) -> None:
+            request_errors = current_request_errors()
+            if request_errors is None:
+                logger.exception(msg, extra=extra)
+            else:
+                request_errors.record(error, extra)
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as error:
+                    log(error)
+                    raise
+
+            return async_wrapper
+
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            logger = logging.getLogger(func.__name__)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
             try:
                 return func(*args, **kwargs)
             except Exception as error:
-                logger.exception(msg, extra=extra, exc_info=True)
-                raise error
+                log(error)
+                raise
 
         return wrapper
 
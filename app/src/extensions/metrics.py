@@ -0,0 +1,42 @@
+from threading import Lock
+from typing import Callable, Dict
+
+_metrics_sources: Dict[str, Callable[[], dict]] = {}
+_metrics_sources_lock = Lock()
+
+
+def register_metrics(name: str, source: Callable[[], dict]) -> None:
+    """
+    Registers a source of metrics, replacing any source previously
+    registered with the same name.
+
+    Args:
+        name (str): The name the metrics are grouped under.
+        source (Callable): A function returning a dictionary with the
+            current values of the metrics.
+    """
+    with _metrics_sources_lock:
+        _metrics_sources[name] = source
+
+
+def unregister_metrics(name: str) -> None:
+    """
+    Removes a source of metrics, if registered.
+
+    Args:
+        name (str): The name the metrics are grouped under.
+    """
+    with _metrics_sources_lock:
+        _metrics_sources.pop(name, None)
+
+
+def collect_metrics() -> Dict[str, dict]:
+    """
+    Collects the current values of every registered source of metrics.
+
+    Returns:
+        dict: The metrics of each source, keyed by the source name.
+    """
+    with _metrics_sources_lock:
+        sources = list(_metrics_sources.items())
+    return {name: source() for name, source in sources}
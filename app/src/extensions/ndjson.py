@@ -0,0 +1,84 @@
+from typing import AsyncIterator, Optional, Tuple
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Splits a stream of bytes into newline-delimited lines, as the chunks
+    arrive, without ever holding more than one line and one chunk.
+
+    Blank lines are skipped, but still counted. A line longer than
+    `max_line_bytes` is discarded as it arrives and yielded as None, so a
+    single huge line can not grow the buffer without bound.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the stream, such as
+            `Request.stream()`.
+        max_line_bytes (int): The longest line kept, in bytes.
+
+    Yields:
+        A tuple with the number of the line, starting at 1, and its bytes,
+        or None when the line is longer than `max_line_bytes`.
+    """
+    buffer = bytearray()
+    line_number = 0
+    too_long = False
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line_number += 1
+            if too_long or end - start > max_line_bytes:
+                too_long = False
+                yield line_number, None
+            else:
+                line = bytes(buffer[start:end])
+                if line.strip():
+                    yield line_number, line
+            start = end + 1
+        del buffer[:start]
+
+        if len(buffer) > max_line_bytes:
+            too_long = True
+            buffer.clear()
+
+    if too_long:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, bytes(buffer)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    A StreamingResponse of newline-delimited JSON that can be sent while
+    the request body is still being read.
+
+    Starlette's StreamingResponse listens for the disconnection of the
+    client on `receive` while it streams, which would consume the body
+    messages of a request streamed at the same time. This response only
+    sends, the disconnection of the client is noticed by
+    `Request.stream()`, which raises `ClientDisconnect`.
+
+    Each chunk is sent as soon as the body iterator produces it, and the
+    next one is only produced after the server accepted the previous one,
+    so a client that reads slowly slows down the producer.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
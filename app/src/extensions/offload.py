@@ -0,0 +1,37 @@
+from typing import Callable, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+
+from config import ApiConfig
+
+T = TypeVar("T")
+
+
+async def run_inline_or_offload(
+    func: Callable[[], T],
+    size: int,
+    max_inline_size: int = ApiConfig.ASYNC_INLINE_MAX_WALLS,
+) -> T:
+    """
+    Runs a CPU bound function inline on the event loop when its payload is
+    small, and in the threadpool otherwise.
+
+    The payload is measured in walls, since the cost of validating and
+    calculating rooms grows with their walls, not with their number. A
+    small room takes microseconds, far less than the hop to a worker
+    thread, so it is cheaper to block the event loop for it. Large rooms
+    and batches would block the event loop for too long and are run in the
+    threadpool instead.
+
+    Args:
+        func (Callable): The function to be run, without arguments.
+        size (int): The size of the payload of the function, in walls.
+        max_inline_size (int, optional): The largest payload run inline.
+            Defaults to `ApiConfig.ASYNC_INLINE_MAX_WALLS`.
+
+    Returns:
+        The value returned by the function.
+    """
+    if size <= max_inline_size:
+        return func()
+    return await run_in_threadpool(func)
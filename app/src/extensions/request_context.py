@@ -0,0 +1,85 @@
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional
+
+
+class RequestErrors:
+    """
+    The errors raised while a single request was handled.
+
+    An exception that goes up through many decorated layers is stored once,
+    with the `extra` information of every layer it went through, so the
+    request can be logged as a single record.
+
+    Attributes:
+        request_id (str): The id of the request.
+        _errors (dict): The errors recorded, keyed by the id of the
+            exception object, in the order they were first recorded.
+
+    Methods:
+        record(error, extra): Records an error raised in a layer.
+        errors: The exceptions recorded, with the layers they went through.
+    """
+
+    __slots__ = ("request_id", "_errors")
+
+    def __init__(self, request_id: str) -> None:
+        self.request_id = request_id
+        self._errors: Dict[int, tuple] = {}
+
+    def record(self, error: Exception, extra: Optional[dict]) -> None:
+        """
+        Records an error raised in a layer.
+
+        Args:
+            error: The exception raised.
+            extra: The information about the layer the exception went
+                through.
+        """
+        entry = self._errors.get(id(error))
+        if entry is None:
+            entry = self._errors[id(error)] = (error, [])
+        if extra:
+            entry[1].append(extra)
+
+    @property
+    def errors(self) -> List[tuple]:
+        return list(self._errors.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._errors)
+
+
+_request_errors: ContextVar[Optional[RequestErrors]] = ContextVar(
+    "request_errors", default=None
+)
+
+
+def start_request(request_id: str) -> Token:
+    """
+    Starts collecting the errors of a request in the current context.
+
+    Args:
+        request_id: The id of the request.
+
+    Returns:
+        Token: The token to be given to `finish_request()`.
+    """
+    return _request_errors.set(RequestErrors(request_id))
+
+
+def finish_request(token: Token) -> None:
+    """
+    Stops collecting the errors of the request started with the token.
+
+    Args:
+        token: The token returned by `start_request()`.
+    """
+    _request_errors.reset(token)
+
+
+def current_request_errors() -> Optional[RequestErrors]:
+    """
+    Returns the errors of the request being handled in the current context,
+    or None outside of a request.
+    """
+    return _request_errors.get()
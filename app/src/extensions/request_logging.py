@@ -0,0 +1,213 @@
+import json
+import logging
+import traceback
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable, Tuple
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.extensions.logger import LOGGER_NAME
+from src.extensions.request_context import (
+    RequestErrors,
+    current_request_errors,
+    finish_request,
+    start_request,
+)
+from src.services.exception import (
+    InvalidRoomDimensionError,
+    UnavailableAllocationError,
+)
+
+REQUEST_ID_HEADER = "x-request-id"
+
+EXPECTED_EXCEPTIONS = (
+    InvalidRoomDimensionError,
+    UnavailableAllocationError,
+    ValidationError,
+)
+
+
+class ErrorLogSampler:
+    """
+    A rate limiter of repeated identical error records.
+
+    For each error signature, the first `burst` records of a time window
+    are logged and the following ones are only counted. The first record
+    logged in the next window reports how many were suppressed.
+
+    Attributes:
+        _window (float): The length of the time window, in seconds.
+        _burst (int): The records logged per signature and window.
+        _max_signatures (int): The maximum number of signatures tracked,
+            the least recently seen are forgotten first.
+        _clock (Callable): The clock used to measure the windows.
+        _signatures (OrderedDict): The window start, records logged and
+            records suppressed of each signature.
+
+    Methods:
+        allow(signature) -> Tuple[bool, int]: Tells if a record with the
+            signature should be logged and how many were suppressed before.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        burst: int,
+        max_signatures: int = 1024,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._window = window
+        self._burst = burst
+        self._max_signatures = max_signatures
+        self._clock = clock
+        self._signatures: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def allow(self, signature: Hashable) -> Tuple[bool, int]:
+        """
+        Tells if a record with the given signature should be logged.
+
+        Args:
+            signature: The signature of the errors of the record.
+
+        Returns:
+            A tuple with True if the record should be logged, and the number
+            of records with the same signature suppressed since the last one
+            logged.
+        """
+        now = self._clock()
+        with self._lock:
+            state = self._signatures.pop(signature, None)
+            if state is None or now - state[0] >= self._window:
+                suppressed = state[2] if state is not None else 0
+                state = [now, 0, 0]
+            else:
+                suppressed = 0
+
+            allowed = state[1] < self._burst
+            if allowed:
+                state[1] += 1
+            else:
+                state[2] += 1
+
+            self._signatures[signature] = state
+            if len(self._signatures) > self._max_signatures:
+                self._signatures.popitem(last=False)
+
+        return allowed, suppressed
+
+
+class RequestLoggingMiddleware:
+    """
+    An ASGI middleware that gives each request an id and logs, at most, one
+    structured JSON record per request with every error raised while it was
+    handled.
+
+    Expected domain errors, such as `InvalidRoomDimensionError`, are logged
+    without traceback at `ApiConfig.ERROR_LOG_LEVEL`. Unexpected errors are
+    logged at ERROR level with the traceback of the exception. Repeated
+    identical records are sampled by an `ErrorLogSampler`.
+
+    The id of the request is taken from the `X-Request-ID` header, when
+    sent, and returned in the same header of the response.
+    """
+
+    def __init__(self, app, sampler: ErrorLogSampler = None) -> None:
+        self.app = app
+        self.sampler = sampler or ErrorLogSampler(
+            window=ApiConfig.ERROR_LOG_SAMPLING_WINDOW,
+            burst=ApiConfig.ERROR_LOG_SAMPLING_BURST,
+        )
+        self.logger = logging.getLogger(f"{LOGGER_NAME}.request")
+        self.level = logging.getLevelName(ApiConfig.ERROR_LOG_LEVEL.upper())
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._request_id(scope)
+        token = start_request(request_id)
+        request_errors = current_request_errors()
+        status_code = 500
+
+        async def send_with_request_id(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception as error:
+            request_errors.record(error, {"asgi": "unhandled"})
+            raise
+        finally:
+            finish_request(token)
+            if request_errors:
+                self._log(scope, status_code, request_errors)
+
+    @staticmethod
+    def _request_id(scope) -> str:
+        for name, value in scope.get("headers", ()):
+            if name == REQUEST_ID_HEADER.encode():
+                return value.decode("latin-1")
+        return uuid4().hex
+
+    def _log(
+        self, scope, status_code: int, request_errors: RequestErrors
+    ) -> None:
+        """
+        Logs the errors of a request as a single JSON record, unless the
+        sampler suppresses it.
+        """
+        errors = [
+            {
+                "type": type(error).__name__,
+                "message": str(error),
+                "layers": layers,
+            }
+            for error, layers in request_errors.errors
+        ]
+        unexpected = [
+            (entry, error)
+            for entry, (error, _) in zip(errors, request_errors.errors)
+            if not isinstance(error, EXPECTED_EXCEPTIONS)
+        ]
+
+        level = logging.ERROR if unexpected else self.level
+        if not self.logger.isEnabledFor(level):
+            return
+
+        allowed, suppressed = self.sampler.allow(
+            (
+                scope.get("path"),
+                status_code,
+                tuple((entry["type"], entry["message"]) for entry in errors),
+            )
+        )
+        if not allowed:
+            return
+
+        for entry, error in unexpected:
+            entry["traceback"] = "".join(traceback.format_exception(error))
+
+        record = {
+            "request_id": request_errors.request_id,
+            "method": scope.get("method"),
+            "path": scope.get("path"),
+            "status_code": status_code,
+            "errors": errors,
+        }
+        if suppressed:
+            record["suppressed"] = suppressed
+
+        self.logger.log(level, json.dumps(record, default=str))
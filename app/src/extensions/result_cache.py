@@ -0,0 +1,196 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, List, Tuple
+
+
+class ResultCache:
+    """
+    A thread safe in-process cache of results, bounded in size, that evicts
+    the least recently used result first and, optionally, expires results
+    after a time to live.
+
+    Attributes:
+        _max_size (int): The maximum number of results kept. A cache with
+            a maximum size of 0 keeps nothing.
+        _ttl (float): The seconds a result is kept, 0 to keep it until it
+            is evicted.
+        _clock (Callable): The clock used to expire the results.
+        _results (OrderedDict): The expiry time and result of each key,
+            from the least to the most recently used.
+        hits (int): The lookups that found a result.
+        misses (int): The lookups that did not find a result.
+        evictions (int): The results evicted to keep the size bounded.
+        expirations (int): The results found expired.
+
+    Methods:
+        get(key, default) -> Any: Returns the result of a key.
+        peek(key, default) -> Any: Returns the result of a key, without
+            counting the lookup or marking it as used.
+        put(key, result): Stores the result of a key.
+        items() -> list: Returns the keys and results not expired.
+        clear(): Forgets every result, keeping the counters.
+        stats() -> dict: Returns the counters and the size of the cache.
+    """
+
+    __slots__ = (
+        "_max_size",
+        "_ttl",
+        "_clock",
+        "_results",
+        "_lock",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+    )
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float = 0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """
+        Initializes a new instance of the ResultCache class.
+
+        Args:
+            max_size: The maximum number of results kept.
+            ttl: The seconds a result is kept, 0 to keep it until evicted.
+            clock: The clock used to expire the results.
+
+        Raises:
+            ValueError: If the maximum size or the time to live is negative.
+        """
+        if max_size < 0 or ttl < 0:
+            raise ValueError(
+                "The maximum size and the time to live must not be negative."
+            )
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._results: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the result stored for a key, marking it as the most recently
+        used.
+
+        Args:
+            key: The key of the result.
+            default: The value returned when there is no result for the key.
+
+        Returns:
+            The result stored for the key, or the default value if there is
+            none or it has expired.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and entry[0] and self._clock() >= entry[0]:
+                del self._results[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._results.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the result stored for a key, without counting the lookup or
+        marking it as the most recently used, so checking for a result
+        leaves the counters and the eviction order as they were.
+
+        Args:
+            key: The key of the result.
+            default: The value returned when there is no result for the key.
+
+        Returns:
+            The result stored for the key, or the default value if there is
+            none or it has expired.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+        if entry is None or (entry[0] and self._clock() >= entry[0]):
+            return default
+        return entry[1]
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """
+        Stores the result of a key, evicting the least recently used results
+        when the cache is full.
+
+        Args:
+            key: The key of the result.
+            result: The result to be stored.
+        """
+        if not self._max_size:
+            return
+
+        expires_at = self._clock() + self._ttl if self._ttl else 0
+        with self._lock:
+            self._results[key] = (expires_at, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Returns the keys and results not expired, without marking them as
+        used.
+
+        Returns:
+            list: The key and result of each entry, from the least to the
+            most recently used.
+        """
+        now = self._clock() if self._ttl else 0
+        with self._lock:
+            return [
+                (key, result)
+                for key, (expires_at, result) in self._results.items()
+                if not expires_at or now < expires_at
+            ]
+
+    def clear(self) -> None:
+        """
+        Forgets every result stored, keeping the counters.
+        """
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the counters and the size of the cache.
+
+        Returns:
+            dict: The hits, misses, evictions, expirations, size and maximum
+            size of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._results),
+            "max_size": self._max_size,
+        }
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return (
+            f"ResultCache(size= {len(self._results)},"
+            f"max_size= {self._max_size}, ttl= {self._ttl})"
+        )
@@ -0,0 +1,331 @@
+import fcntl
+import mmap
+import os
+import struct
+from hashlib import blake2b
+from threading import Lock
+from typing import Hashable, Iterator, Optional
+
+import msgspec
+
+_MAGIC = b"PCRC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sIII")
+_HEADER_BYTES = 64
+_SEQUENCE = struct.Struct("<I")
+_ENTRY = struct.Struct("<16sI")
+_SLOT_HEADER_BYTES = _SEQUENCE.size + _ENTRY.size
+_MAX_READ_RETRIES = 4
+_EMPTY_DIGEST = bytes(16)
+
+_key_encoder = msgspec.msgpack.Encoder()
+
+
+class SharedResultCache:
+    """
+    A cache of encoded results shared by every process that maps the same
+    file, such as the uvicorn workers of `ApiConfig.WORKERS`, so its hit
+    rate does not depend on the number of workers and its memory is only
+    used once.
+
+    The file holds a fixed size open addressing hash table. Each key is
+    encoded with MessagePack, the same in every process unlike `hash()`,
+    hashed into a 16 bytes digest along with the namespace of the cache,
+    and probed linearly from its home slot for at most `max_probes` slots.
+    Each slot holds a sequence number, the digest of its key, the length of
+    its value and the value itself, of at most `slot_bytes` bytes minus the
+    slot header. Longer values are not stored. When every probed slot is
+    taken by another key, the home slot is overwritten, so the table never
+    grows and no slot is ever emptied again.
+
+    Reads take no lock. A writer makes the sequence of a slot odd while it
+    writes it, and even again when done, and a reader reads a slot again
+    when its sequence was odd or changed while it was read, or its length
+    is larger than the slot, for at most `_MAX_READ_RETRIES` times, after
+    which the lookup is a miss. The length is checked before the value is
+    read. Writes are serialized by
+    a lock of the process and a `flock` of the file, held for a single slot
+    write.
+
+    Every process must map the file with the same number of slots and slot
+    size. A file with a different format, number of slots or slot size is
+    reset when it is opened.
+
+    Attributes:
+        _path (str): The path of the file, on tmpfs, such as /dev/shm, to
+            keep it in memory.
+        _namespace (str): The namespace hashed with every key, such as the
+            version of the rules that built the results.
+        _slots (int): The number of slots of the table.
+        _slot_bytes (int): The size of each slot, in bytes.
+        _max_probes (int): The largest number of slots probed for a key.
+        _fd (int): The file descriptor of the file, locked by the writers.
+        _mmap (mmap): The memory map of the file.
+        _lock (Lock): The lock of the writers of this process.
+        hits (int): The lookups of this process that found a value.
+        misses (int): The lookups of this process that did not find one.
+        stores (int): The values stored by this process.
+        evictions (int): The values of other keys overwritten by this
+            process.
+        oversized (int): The values too long to be stored.
+
+    Methods:
+        get(key, default) -> Optional[bytes]: Returns the value of a key.
+        peek(key, default) -> Optional[bytes]: Returns the value of a key,
+            without counting the lookup.
+        put(key, value): Stores the value of a key.
+        close(): Unmaps and closes the file.
+        stats() -> dict: Returns the counters of this process and the size
+            of the table.
+
+    Raises:
+        ValueError: If the number of slots, the slot size or the number of
+            probes are not positive.
+    """
+
+    __slots__ = (
+        "_path",
+        "_namespace",
+        "_slots",
+        "_slot_bytes",
+        "_max_probes",
+        "_fd",
+        "_mmap",
+        "_lock",
+        "hits",
+        "misses",
+        "stores",
+        "evictions",
+        "oversized",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        slots: int,
+        slot_bytes: int,
+        namespace: str = "",
+        max_probes: int = 8,
+    ) -> None:
+        """
+        Initializes a new instance of the SharedResultCache class, creating
+        the file when it does not exist.
+
+        Args:
+            path: The path of the file shared by the processes.
+            slots: The number of slots of the table.
+            slot_bytes: The size of each slot, in bytes, header included.
+            namespace: The namespace hashed with every key.
+            max_probes: The largest number of slots probed for a key.
+
+        Raises:
+            ValueError: If the number of slots, the slot size or the number
+                of probes are not positive.
+        """
+        if slots < 1 or slot_bytes <= _SLOT_HEADER_BYTES or max_probes < 1:
+            raise ValueError(
+                "The number of slots and probes must be positive, and the"
+                f" slot size must be larger than {_SLOT_HEADER_BYTES} bytes."
+            )
+
+        self._path = path
+        self._namespace = namespace
+        self._slots = slots
+        self._slot_bytes = slot_bytes
+        self._max_probes = min(max_probes, slots)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.oversized = 0
+
+        size = _HEADER_BYTES + slots * slot_bytes
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                # The file only grows, a process that still maps a larger
+                # file must not read past its end.
+                if os.fstat(self._fd).st_size < size:
+                    os.ftruncate(self._fd, size)
+                self._mmap = mmap.mmap(self._fd, size)
+                header = _HEADER.pack(
+                    _MAGIC, _FORMAT_VERSION, slots, slot_bytes
+                )
+                if self._mmap[: _HEADER.size] != header:
+                    self._mmap[:size] = bytes(size)
+                    self._mmap[: _HEADER.size] = header
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    def _digest(self, key: Hashable) -> bytes:
+        """
+        Returns the digest of a key, the same in every process.
+        """
+        return blake2b(
+            _key_encoder.encode((self._namespace, key)), digest_size=16
+        ).digest()
+
+    def _probe(self, digest: bytes) -> Iterator[int]:
+        """
+        Yields the offsets of the slots probed for a digest.
+        """
+        home = int.from_bytes(digest[:8], "little") % self._slots
+        for probe in range(self._max_probes):
+            yield _HEADER_BYTES + (
+                (home + probe) % self._slots
+            ) * self._slot_bytes
+
+    def _lookup(self, key: Hashable) -> Optional[bytes]:
+        """
+        Returns the value stored for a key, or None, without counting the
+        lookup.
+        """
+        digest = self._digest(key)
+        buffer = self._mmap
+        capacity = self._slot_bytes - _SLOT_HEADER_BYTES
+        for offset in self._probe(digest):
+            for _ in range(_MAX_READ_RETRIES):
+                (sequence,) = _SEQUENCE.unpack_from(buffer, offset)
+                if sequence & 1:
+                    continue
+                slot_digest, length = _ENTRY.unpack_from(
+                    buffer, offset + _SEQUENCE.size
+                )
+                if (
+                    _SEQUENCE.unpack_from(buffer, offset)[0] != sequence
+                    or length > capacity
+                ):
+                    # A torn read of the header, read the slot again.
+                    continue
+                if slot_digest != digest:
+                    break
+
+                start = offset + _SLOT_HEADER_BYTES
+                end = start + length
+                value = buffer[start:end]
+                if _SEQUENCE.unpack_from(buffer, offset)[0] == sequence:
+                    return value
+            else:
+                # The slot kept changing while it was read.
+                return None
+            if slot_digest == _EMPTY_DIGEST:
+                return None
+        return None
+
+    def get(
+        self, key: Hashable, default: Optional[bytes] = None
+    ) -> Optional[bytes]:
+        """
+        Returns the value stored for a key, without taking any lock.
+
+        Args:
+            key: The key of the value, made of tuples, strings, numbers and
+                enums.
+            default: The value returned when there is no value for the key.
+
+        Returns:
+            The bytes stored for the key, or the default value if there are
+            none or they were being written.
+        """
+        value = self._lookup(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def peek(
+        self, key: Hashable, default: Optional[bytes] = None
+    ) -> Optional[bytes]:
+        """
+        Returns the value stored for a key, like `get()`, without counting
+        the lookup.
+        """
+        value = self._lookup(key)
+        return default if value is None else value
+
+    def put(self, key: Hashable, value: bytes) -> None:
+        """
+        Stores the value of a key in the slot of the key, or in the first
+        empty slot probed, or else in its home slot.
+
+        Args:
+            key: The key of the value, made of tuples, strings, numbers and
+                enums.
+            value: The bytes to be stored.
+        """
+        if len(value) > self._slot_bytes - _SLOT_HEADER_BYTES:
+            self.oversized += 1
+            return
+
+        digest = self._digest(key)
+        buffer = self._mmap
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                target = None
+                for offset in self._probe(digest):
+                    slot_digest = _ENTRY.unpack_from(
+                        buffer, offset + _SEQUENCE.size
+                    )[0]
+                    if slot_digest == digest or slot_digest == _EMPTY_DIGEST:
+                        target = offset
+                        break
+                if target is None:
+                    target = next(self._probe(digest))
+                    self.evictions += 1
+
+                (sequence,) = _SEQUENCE.unpack_from(buffer, target)
+                _SEQUENCE.pack_into(
+                    buffer, target, (sequence + 1) & 0xFFFFFFFF
+                )
+                _ENTRY.pack_into(
+                    buffer, target + _SEQUENCE.size, digest, len(value)
+                )
+                start = target + _SLOT_HEADER_BYTES
+                end = start + len(value)
+                buffer[start:end] = value
+                _SEQUENCE.pack_into(
+                    buffer, target, (sequence + 2) & 0xFFFFFFFF
+                )
+                self.stores += 1
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file, keeping it for the other processes.
+        """
+        with self._lock:
+            if not self._mmap.closed:
+                self._mmap.close()
+                os.close(self._fd)
+
+    def stats(self) -> dict:
+        """
+        Returns the counters of this process and the size of the table.
+
+        Returns:
+            dict: The hits, misses, stores, evictions and oversized values
+            of this process, and the slots and slot size of the table.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "oversized": self.oversized,
+            "slots": self._slots,
+            "slot_bytes": self._slot_bytes,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedResultCache(path= {self._path}, slots= {self._slots},"
+            f" slot_bytes= {self._slot_bytes})"
+        )
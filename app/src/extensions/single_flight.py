@@ -0,0 +1,137 @@
+from copy import copy
+from threading import Event, Lock
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    A call in flight, and its outcome once it finishes.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    A thread safe coalescer of identical calls in flight.
+
+    While a call for a key is running, the calls for the same key made from
+    other threads wait for it and get its result, or its exception, instead
+    of running the function again. Once the call finishes the key is
+    forgotten, so it does not cache anything: the next call for the key
+    runs the function again.
+
+    Each waiting call gets its own copy of the exception of the call it
+    waited for, raised from the original, so the calls never share and
+    mutate the traceback of a single exception object.
+
+    Attributes:
+        _calls (dict): The call in flight for each key.
+        _lock (Lock): The lock of the calls in flight and the counters.
+        _executed (int): The number of calls that ran the function.
+        _coalesced (int): The number of calls that waited for the result of
+            another call.
+
+    Methods:
+        do(key, func) -> Tuple[T, bool]: Runs the function, or waits for the
+            call in flight for the same key.
+        stats() -> dict: Returns the counters of the calls.
+
+    Example usage:
+        >>> single_flight = SingleFlight()
+        >>> single_flight.do("room", lambda: 42)
+        (42, False)
+    """
+
+    __slots__ = ("_calls", "_lock", "_executed", "_coalesced")
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Runs the function, unless a call for the same key is in flight, in
+        which case it waits for that call to finish.
+
+        Args:
+            key (Hashable): The key of the identical calls.
+            func (Callable): The function to be run, without arguments.
+
+        Returns:
+            A tuple with the result of the function and True when it was
+            shared with the call in flight.
+
+        Raises:
+            Exception: The exception raised by the function to the call
+                that ran it, and a copy of it, caused by it, to every call
+                that waited for it. A RuntimeError caused by it when the
+                exception can not be copied.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if shared:
+                self._coalesced += 1
+            else:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+
+        if shared:
+            call.done.wait()
+            if call.error is not None:
+                raise self._waiter_error(call.error) from call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    @staticmethod
+    def _waiter_error(error: Exception) -> Exception:
+        """
+        Returns a new exception of a waiting call for the exception of the
+        call it waited for.
+        """
+        try:
+            waiter_error = copy(error)
+        except Exception:
+            waiter_error = None
+        if waiter_error is None or waiter_error is error:
+            return RuntimeError(f"The call in flight failed: {error!r}")
+        waiter_error.__traceback__ = None
+        return waiter_error
+
+    def stats(self) -> dict:
+        """
+        Returns the counters of the calls.
+
+        Returns:
+            dict: The calls that ran the function, the calls coalesced into
+            another one and the calls in flight.
+        """
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(in_flight= {len(self._calls)})"
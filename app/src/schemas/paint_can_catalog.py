@@ -0,0 +1,79 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, conlist, constr, validator
+
+from src.services.can_allocation import check_table_units, sizes_in_units
+
+
+class PaintCanBase(BaseModel):
+    pass
+
+
+class PaintCan(PaintCanBase):
+    # """
+    # Represents a paint can sold in a catalog.
+
+    # Attributes:
+    # ----------
+    # size : float
+    #     The size of the can in liters, a multiple of 1mL.
+    # price : float, optional
+    #     The price of the can, required by the cheapest allocation.
+    # """
+
+    size: float = Field(gt=0, description="The size must be greater than zero")
+    price: Optional[float] = Field(
+        gt=0, default=None, description="The price must be greater than zero"
+    )
+
+    class Config:
+        extra = "forbid"
+
+
+class PaintCanCatalog(PaintCanBase):
+    # """
+    # Represents a catalog of paint cans of a single paint product.
+
+    # Attributes:
+    # ----------
+    # coverage_per_m2 : float
+    #     The square meters covered by a liter of the paint.
+    # cans : list
+    #     The cans sold, with distinct sizes. Either every can or none of
+    #     them has a price.
+
+    # Raises:
+    # ------
+    # ValueError : if two cans have the same size, only some have prices or
+    #     the sizes need an allocation table larger than
+    #     ApiConfig.ALLOCATION_MAX_TABLE_UNITS.
+    # """
+
+    coverage_per_m2: float = Field(
+        gt=0, description="The coverage must be greater than zero"
+    )
+    cans: conlist(PaintCan, min_items=1)
+
+    @validator("cans")
+    def validate_cans(cls, cans: List[PaintCan]) -> List[PaintCan]:
+        if len({can.size for can in cans}) != len(cans):
+            raise ValueError("The sizes of the cans must be distinct.")
+        if len({can.price is None for can in cans}) != 1:
+            raise ValueError("Either every can or none of them has a price.")
+        unit, sizes_units = sizes_in_units([can.size for can in cans])
+        check_table_units(max(sizes_units) ** 2, unit)
+        return cans
+
+    class Config:
+        extra = "forbid"
+
+
+class PaintCanCatalogs(PaintCanBase):
+    # """
+    # Represents the file of paint can catalogs, keyed by catalog id.
+    # """
+
+    catalogs: Dict[constr(min_length=1), PaintCanCatalog]
+
+    class Config:
+        extra = "forbid"
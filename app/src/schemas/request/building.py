@@ -0,0 +1,88 @@
+from typing import Any, List
+
+from pydantic import BaseModel, conlist, validator
+
+from config import ApiConfig
+from src.schemas.request.room import Room, validate_request_walls
+
+
+class FloorBase(BaseModel):
+    pass
+
+
+class Floor(FloorBase):
+    # """
+    # Represents a floor of a building, with the rooms to be painted on it.
+
+    # Parameters:
+    # -----------
+    # rooms : list
+    #     The rooms of the floor, each one represented by an instance of the
+    #     Room model. The floor must contain at least one room.
+    # """
+
+    rooms: conlist(Room, min_items=1, max_items=ApiConfig.BATCH_MAX_ROOMS)
+
+    class Config:
+        extra = "forbid"
+
+
+class BuildingBase(BaseModel):
+    pass
+
+
+class Building(BuildingBase):
+    # """
+    # Represents a building to be quoted as a whole, with its floors.
+
+    # Parameters:
+    # -----------
+    # floors : list
+    #     The floors of the building, each one represented by an instance of
+    #     the Floor model. The building must contain at least one floor and
+    #     at most ApiConfig.BATCH_MAX_ROOMS rooms and
+    #     ApiConfig.REQUEST_MAX_WALLS walls on all its floors.
+    # """
+
+    floors: conlist(Floor, min_items=1)
+
+    @validator("floors", pre=True)
+    def validate_number_walls(cls, floors: Any) -> Any:
+        if not isinstance(floors, (list, tuple)):
+            return floors
+
+        rooms = []
+        for floor in floors:
+            if isinstance(floor, Floor):
+                rooms.extend(floor.rooms)
+            elif isinstance(floor, dict) and isinstance(
+                floor.get("rooms"), (list, tuple)
+            ):
+                rooms.extend(floor["rooms"])
+        validate_request_walls(rooms)
+        return floors
+
+    @validator("floors")
+    def validate_number_rooms(cls, floors: List[Floor]) -> List[Floor]:
+        number_rooms = sum(len(floor.rooms) for floor in floors)
+        if number_rooms > ApiConfig.BATCH_MAX_ROOMS:
+            raise ValueError(
+                f"The building has {number_rooms} rooms, more than the"
+                f" maximum of {ApiConfig.BATCH_MAX_ROOMS}."
+            )
+        return floors
+
+    @property
+    def rooms(self) -> List[Room]:
+        """
+        Returns the rooms of every floor, floor by floor.
+
+        Returns:
+        --------
+        list:
+            The rooms of the building, in the order of the floors.
+        """
+        return [room for floor in self.floors for room in floor.rooms]
+
+    class Config:
+        extra = "forbid"
@@ -1,15 +1,76 @@
-from typing import NewType, Tuple
+from hashlib import blake2b
+from typing import Any, Iterable, Tuple
 
-from pydantic import BaseModel
+import msgspec
+from pydantic import BaseModel, PrivateAttr, conlist, validator
 
+from config import ApiConfig
 from src.schemas.request.exception import (
     NegativeDoorsAreaRoomError,
     NegativeWallAreaRoomError,
     NegativeWindowsAreaRoomError,
 )
+from src.schemas.room_geometry import RoomGeometry
 from src.schemas.wall import Wall
 
-Walls = NewType("Walls", Tuple[Wall, Wall, Wall, Wall])
+Walls = conlist(Wall, min_items=1, max_items=ApiConfig.ROOM_MAX_WALLS)
+
+_key_encoder = msgspec.msgpack.Encoder()
+
+
+def canonical_room_key(
+    walls_keys: Iterable[Tuple[float, float, int, int]]
+) -> bytes:
+    """
+    Digests the `Wall.canonical_key` of each wall of a room into the
+    `Room.canonical_key`, 16 bytes whatever the number of walls, so the
+    caches keyed by rooms do not grow with their walls.
+
+    Args:
+        walls_keys (Iterable): The `Wall.canonical_key` of each wall, in
+            the order of the walls.
+
+    Returns:
+        bytes: The digest of the walls.
+    """
+    walls_keys = tuple(walls_keys)
+    try:
+        packed = _key_encoder.encode(walls_keys)
+    except OverflowError:
+        packed = repr(walls_keys).encode()
+    return blake2b(packed, digest_size=16).digest()
+
+
+def validate_request_walls(rooms: Iterable[Any]) -> None:
+    """
+    Checks the total number of walls of the rooms of a request against
+    `ApiConfig.REQUEST_MAX_WALLS`, before the rooms are parsed, so the
+    cost of a request is bounded by its walls and not only by its rooms.
+
+    Args:
+        rooms (Iterable): The rooms of the request, as Room instances or
+            as the raw objects of the request body. Anything else is left
+            to the validation of the rooms.
+
+    Raises:
+        ValueError: If the rooms have more walls than the maximum.
+    """
+    number_walls = 0
+    for room in rooms:
+        if isinstance(room, Room):
+            walls = room.walls
+        elif isinstance(room, dict):
+            walls = room.get("walls")
+        else:
+            continue
+        if isinstance(walls, (list, tuple)):
+            number_walls += len(walls)
+
+    if number_walls > ApiConfig.REQUEST_MAX_WALLS:
+        raise ValueError(
+            f"The request has {number_walls} walls, more than the maximum"
+            f" of {ApiConfig.REQUEST_MAX_WALLS}."
+        )
 
 
 class RoomBase(BaseModel):
@@ -18,12 +79,14 @@ class RoomBase(BaseModel):
 
 class Room(RoomBase):
     # """
-    # Represents a room with four walls, where each wall has doors and windows
+    # Represents a room with any number of walls, where each wall has doors
+    # and windows
 
     # Parameters:
     # -----------
     # walls : tuple
-    #     The tuple that contains four walls of the room.
+    #     The tuple that contains the walls of the room, at least one and
+    #     at most ApiConfig.ROOM_MAX_WALLS walls.
     #     The walls must be represented by instances of the Wall model.
 
     # Raises:
@@ -38,7 +101,7 @@ class Room(RoomBase):
     # Attributes:
     # -----------
     # walls_area : float
-    #     The total area of all four walls of the room.
+    #     The total area of all walls of the room.
     # windows_area : float
     #     The total area of all windows in the room.
     # doors_area : float
@@ -53,22 +116,69 @@ class Room(RoomBase):
 
     walls: Walls
 
+    _geometry: RoomGeometry = PrivateAttr(default=None)
+    _canonical_key: bytes = PrivateAttr(default=None)
+
+    def __init__(__pydantic_self__, **data) -> None:
+        super().__init__(**data)
+        __pydantic_self__._geometry = RoomGeometry.from_walls(
+            __pydantic_self__.walls
+        )
+
+    @validator("walls")
+    def walls_as_tuple(cls, walls) -> Tuple[Wall, ...]:
+        return tuple(walls)
+
+    @property
+    def geometry(self) -> RoomGeometry:
+        """
+        Returns the derived measures of the room and its walls, computed
+        once when the room is validated.
+
+        Returns:
+        --------
+        RoomGeometry:
+            The areas of each wall and the totals of the room.
+        """
+        if self._geometry is None:
+            self._geometry = RoomGeometry.from_walls(self.walls)
+        return self._geometry
+
+    @property
+    def canonical_key(self) -> bytes:
+        """
+        Returns a digest of the dimensions of the walls, equal for every
+        room with walls of the same dimensions in the same order, computed
+        once for the room.
+
+        Returns:
+        --------
+        bytes:
+            The `canonical_room_key()` of the `Wall.canonical_key` of each
+            wall of the room.
+        """
+        if self._canonical_key is None:
+            self._canonical_key = canonical_room_key(
+                wall.canonical_key for wall in self.walls
+            )
+        return self._canonical_key
+
     @property
     def walls_area(self) -> float:
         """
-        Calculates the total area of all four walls in the room.
+        Calculates the total area of all walls in the room.
 
         Returns:
         --------
         float:
-            The total area of all four walls in the room.
+            The total area of all walls in the room.
 
         Raises:
         -------
         NegativeWallAreaRoomError:
             If the total area of the room walls is less than or equal to zero.
         """
-        walls_area_ = sum(wall.area for wall in self.walls)
+        walls_area_ = self.geometry.walls_area
         if walls_area_ <= 0:
             raise NegativeWallAreaRoomError(
                 f"The walls area is negative {walls_area_:.2}m2"
@@ -90,12 +200,12 @@ class Room(RoomBase):
         NegativeWindowsAreaRoomError:
             If the total area of the room windows is less than zero.
         """
-        windows_area_ = sum(wall.windows_area for wall in self.walls)
+        windows_area_ = self.geometry.windows_area
         if windows_area_ < 0:
             raise NegativeWindowsAreaRoomError(
                 f"The windows area in room is negative {windows_area_:.2}m2"
             )
-        return sum(wall.windows_area for wall in self.walls)
+        return windows_area_
 
     @property
     def doors_area(self) -> float:
@@ -112,7 +222,7 @@ class Room(RoomBase):
         NegativeDoorsAreaRoomError:
             If the total area of the room doors is less than zero.
         """
-        doors_area_ = sum(wall.doors_area for wall in self.walls)
+        doors_area_ = self.geometry.doors_area
         if doors_area_ < 0:
             raise NegativeDoorsAreaRoomError(
                 f"The door area is negative {doors_area_:.2f}m2"
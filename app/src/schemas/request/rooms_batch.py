@@ -0,0 +1,35 @@
+from typing import Any
+
+from pydantic import BaseModel, conlist, validator
+
+from config import ApiConfig
+from src.schemas.request.room import Room, validate_request_walls
+
+
+class RoomsBatchBase(BaseModel):
+    pass
+
+
+class RoomsBatch(RoomsBatchBase):
+    # """
+    # Represents a batch of rooms to be analyzed in a single request.
+
+    # Parameters:
+    # -----------
+    # rooms : list
+    #     The rooms to be analyzed, each one represented by an instance
+    #     of the Room model. The batch must contain at least one room and
+    #     at most ApiConfig.BATCH_MAX_ROOMS rooms, with at most
+    #     ApiConfig.REQUEST_MAX_WALLS walls on all of them.
+    # """
+
+    rooms: conlist(Room, min_items=1, max_items=ApiConfig.BATCH_MAX_ROOMS)
+
+    @validator("rooms", pre=True)
+    def validate_number_walls(cls, rooms: Any) -> Any:
+        if isinstance(rooms, (list, tuple)):
+            validate_request_walls(rooms)
+        return rooms
+
+    class Config:
+        extra = "forbid"
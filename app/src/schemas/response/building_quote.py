@@ -0,0 +1,97 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from .paint_cans_needed import PaintCans
+from .unprocessable_geometric_object import ErrorsDict
+
+
+class RoomQuote(BaseModel):
+    # """
+    # Represent the outcome of validating a single room of a building.
+
+    # Attributes:
+    # ----------
+    # free_area: The area of the walls of the room free from windows and
+    # doors, set when the room dimensions are consistent.
+    # errors: The inconsistencies found for each wall of the room, set
+    # when the room dimensions are invalid.
+    # """
+
+    free_area: Optional[float] = None
+    errors: Optional[ErrorsDict] = None
+
+    class Config:
+        extra = "forbid"
+        frozen = True
+
+
+class FloorQuote(BaseModel):
+    # """
+    # Represent the quote of a floor of a building.
+
+    # Attributes:
+    # ----------
+    # rooms: One result for each room of the floor, in the same order the
+    # rooms were sent.
+    # free_area: The free area of all consistent rooms of the floor.
+    # paint_cans: The amount of paint cans needed for each can size to
+    # paint the free area of the floor, bought together.
+    # """
+
+    rooms: List[RoomQuote]
+    free_area: float
+    paint_cans: PaintCans
+
+    class Config:
+        extra = "forbid"
+        frozen = True
+
+
+class BuildingQuote(BaseModel):
+    # """
+    # Represent the quote of a whole building.
+
+    # Attributes:
+    # ----------
+    # floors: The quote of each floor, in the same order the floors were
+    # sent.
+    # free_area: The free area of all consistent rooms of the building.
+    # paint_cans: The amount of paint cans needed for each can size to
+    # paint the free area of the building, bought together.
+    # """
+
+    floors: List[FloorQuote]
+    free_area: float
+    paint_cans: PaintCans
+
+    class Config:
+        extra = "forbid"
+        frozen = True
+        schema_extra = {
+            "example": {
+                "floors": [
+                    {
+                        "rooms": [
+                            {"free_area": 125.84},
+                            {
+                                "errors": {
+                                    "Wall_1": [
+                                        "Wall is 2.10m shorter than the door.",
+                                    ]
+                                }
+                            },
+                        ],
+                        "free_area": 125.84,
+                        "paint_cans": {
+                            "18.0": 1,
+                            "3.6": 1,
+                            "2.5": 1,
+                            "0.5": 3,
+                        },
+                    }
+                ],
+                "free_area": 125.84,
+                "paint_cans": {"18.0": 1, "3.6": 1, "2.5": 1, "0.5": 3},
+            }
+        }
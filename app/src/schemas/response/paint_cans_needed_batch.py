@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from .paint_cans_needed import PaintCans
+from .unprocessable_geometric_object import ErrorsDict
+
+
+class RoomPaintCansResult(BaseModel):
+    # """
+    # Represent the outcome of analyzing a single room of a batch.
+
+    # Attributes:
+    # ----------
+    # paint_cans: The amount of paint cans needed for each can size, set
+    # when the room dimensions are consistent.
+    # errors: The inconsistencies found for each wall of the room, set
+    # when the room dimensions are invalid.
+    # """
+
+    paint_cans: Optional[PaintCans] = None
+    errors: Optional[ErrorsDict] = None
+
+    class Config:
+        extra = "forbid"
+        frozen = True
+
+
+class PaintCansNeededBatch(BaseModel):
+    # """
+    # Represent the outcome of analyzing a batch of rooms.
+
+    # Attributes:
+    # ----------
+    # results: One result for each room of the batch, in the same order
+    # the rooms were sent.
+    # """
+
+    results: List[RoomPaintCansResult]
+
+    class Config:
+        extra = "forbid"
+        frozen = True
+        schema_extra = {
+            "example": {
+                "results": [
+                    {"paint_cans": {"18.0": 1, "3.6": 2, "2.5": 0, "0.5": 2}},
+                    {
+                        "errors": {
+                            "Wall_1": [
+                                "Wall is 2.10m shorter than the door.",
+                            ]
+                        }
+                    },
+                ]
+            }
+        }
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+from src.schemas.door import DEFAULT_DOOR
+from src.schemas.wall import Wall
+from src.schemas.window import DEFAULT_WINDOW
+
+
+@dataclass(slots=True, frozen=True)
+class WallGeometry:
+    """A dataclass with the derived measures of a wall, computed once.
+
+    The measures are computed with the same operations of the `Wall`
+    properties, so they have the same values, but without the checks of
+    negative areas, which can not happen for a validated wall.
+
+    Attributes:
+        area (float): The area of the wall.
+        windows_area (float): The area of the windows of the wall.
+        doors_area (float): The area of the doors of the wall.
+        openings_area (float): The area of the windows and doors.
+        openings_width (float): The width of the windows and doors.
+        free_area (float): The area of the wall free from windows and doors.
+
+    Example usage:
+        >>> WallGeometry.from_wall(Wall(width=4, height=2.5)).area
+        10.0
+    """
+
+    area: float
+    windows_area: float
+    doors_area: float
+    openings_area: float
+    openings_width: float
+    free_area: float
+
+    @classmethod
+    def from_wall(cls, wall: Wall) -> "WallGeometry":
+        area = wall.width * wall.height
+        windows_area = DEFAULT_WINDOW.area * wall.number_windows
+        doors_area = DEFAULT_DOOR.area * wall.number_doors
+        openings_area = windows_area + doors_area
+        return cls(
+            area=area,
+            windows_area=windows_area,
+            doors_area=doors_area,
+            openings_area=openings_area,
+            openings_width=(
+                wall.number_windows * DEFAULT_WINDOW.width
+                + wall.number_doors * DEFAULT_DOOR.width
+            ),
+            free_area=area - openings_area,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RoomGeometry:
+    """A dataclass with the derived measures of a room, computed in a single
+    pass over its walls when the room is validated.
+
+    The totals are summed in the order of the walls, so they have the same
+    values of the `Room` properties.
+
+    Attributes:
+        walls (tuple): The WallGeometry of each wall of the room.
+        walls_area (float): The total area of the walls.
+        windows_area (float): The total area of the windows.
+        doors_area (float): The total area of the doors.
+        free_area (float): The total area of the walls free from windows and
+            doors.
+    """
+
+    walls: Tuple[WallGeometry, ...]
+    walls_area: float
+    windows_area: float
+    doors_area: float
+    free_area: float
+
+    @classmethod
+    def from_walls(cls, walls: Sequence[Wall]) -> "RoomGeometry":
+        walls_geometries = []
+        walls_area = windows_area = doors_area = 0
+        for wall in walls:
+            wall_geometry = WallGeometry.from_wall(wall)
+            walls_geometries.append(wall_geometry)
+            walls_area += wall_geometry.area
+            windows_area += wall_geometry.windows_area
+            doors_area += wall_geometry.doors_area
+
+        return cls(
+            walls=tuple(walls_geometries),
+            walls_area=walls_area,
+            windows_area=windows_area,
+            doors_area=doors_area,
+            free_area=walls_area - (windows_area + doors_area),
+        )
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from pydantic import BaseModel, Field
 
 from src.schemas.door import DEFAULT_DOOR, Door
@@ -55,6 +57,23 @@ class Wall(WallBase):
         description="The amount of windows must be equal or greater than zero",
     )
 
+    @property
+    def canonical_key(self) -> Tuple[float, float, int, int]:
+        """
+        Returns the dimensions of the wall in a canonical form, equal for
+        every wall with the same dimensions.
+
+        Returns:
+        -------
+        tuple : the width, height, number of doors and number of windows.
+        """
+        return (
+            float(self.width),
+            float(self.height),
+            int(self.number_doors),
+            int(self.number_windows),
+        )
+
     @property
     def area(self):
         """
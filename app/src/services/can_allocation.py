@@ -0,0 +1,659 @@
+import math
+from bisect import bisect_left
+from enum import Enum
+from typing import Mapping, Sequence, Tuple
+
+import numpy as np
+
+from config import ApiConfig
+
+
+class AllocationStrategy(str, Enum):
+    """
+    The strategies to choose the paint cans that cover an area.
+
+    GREEDY prefers the largest possible cans and adds an extra can of the
+    smallest size for the area left. EXACT minimises the paint left over,
+    then the number of cans. CHEAPEST minimises the price of the cans, then
+    the paint left over and the number of cans.
+    """
+
+    GREEDY = "greedy"
+    EXACT = "exact"
+    CHEAPEST = "cheapest"
+
+
+def sizes_in_units(
+    sizes_in_liters: Sequence[float],
+) -> Tuple[float, Tuple[int, ...]]:
+    """
+    Converts the paint can sizes from liters into integer multiples of the
+    volume unit of the sizes, the greatest common divisor of the sizes in
+    milliliters. Every purchase adds up to a multiple of the unit, so needed
+    volumes rounded up to the unit lose nothing. The unit of the sizes
+    0.5L, 2.5L, 3.6L and 18L is 0.1L.
+
+    Returns:
+        The volume unit, in milliliters, and each size in units.
+
+    Raises:
+        ValueError: If a size is not a positive multiple of 1mL.
+    """
+    sizes_milliliters = [round(size * 1000) for size in sizes_in_liters]
+    if any(
+        milliliters <= 0 or not math.isclose(milliliters, size * 1000)
+        for size, milliliters in zip(sizes_in_liters, sizes_milliliters)
+    ):
+        raise ValueError(
+            "The paint can sizes must be positive multiples of 1mL."
+        )
+
+    unit = math.gcd(*sizes_milliliters)
+    return unit, tuple(
+        milliliters // unit for milliliters in sizes_milliliters
+    )
+
+
+def check_table_units(table_units: int, unit: int) -> None:
+    """
+    Checks the size of an allocation table against
+    `ApiConfig.ALLOCATION_MAX_TABLE_UNITS`, before it is built. The table
+    grows with the square of the largest size in units, so sizes whose
+    common divisor is tiny, such as 0.946L and 3.785L, whose unit is 1mL,
+    would take minutes and gigabytes to compile.
+
+    Args:
+        table_units: The number of volumes of the table.
+        unit: The volume unit of the sizes, in milliliters.
+
+    Raises:
+        ValueError: If the table has more volumes than the maximum.
+    """
+    if table_units > ApiConfig.ALLOCATION_MAX_TABLE_UNITS:
+        raise ValueError(
+            f"The paint can sizes need an allocation table of {table_units}"
+            f" volumes of {unit}mL, more than the maximum of"
+            f" {ApiConfig.ALLOCATION_MAX_TABLE_UNITS}. The sizes must have a"
+            " larger common divisor, or a smaller largest size."
+        )
+
+
+def units_per_m2(unit: int, coverage_per_m2: float) -> float:
+    """
+    Returns the volume units of paint needed per square meter, for a unit
+    in milliliters.
+    """
+    return 1000 / (coverage_per_m2 * unit)
+
+
+def units_needed(free_area: float, units_per_m2: float) -> int:
+    """
+    Converts an area into the volume units of paint needed to cover it,
+    rounded up. The product is rounded first so floating point noise does
+    not add a unit.
+    """
+    return max(math.ceil(round(free_area * units_per_m2, 6)), 0)
+
+
+def units_needed_many(
+    free_areas: np.ndarray, units_per_m2: float
+) -> np.ndarray:
+    """
+    Converts many areas into the volume units of paint needed to cover each
+    one, with the same rounding of `units_needed()`.
+    """
+    return np.maximum(
+        np.ceil(
+            np.round(
+                np.asarray(free_areas, dtype=np.float64) * units_per_m2,
+                6,
+            )
+        ).astype(np.int64),
+        0,
+    )
+
+
+class GreedyPaintCansAllocator:
+    """
+    A solver of the paint cans that cover an area giving preference to the
+    largest possible cans, with an extra can of the smallest size if any
+    area is left without paint coverage.
+
+    The remaining area is updated with the same floating point operations,
+    in the same order, by `paint_cans()` and `counts_many()`, so each row of
+    `counts_many()` is bit-identical to the dictionary of the same area.
+
+    Attributes:
+        _sizes (tuple): The paint can sizes in liters, from the largest.
+        _coverage_per_m2 (float): The square meters covered by a liter of
+            paint.
+        _smallest_index (int): The index of the smallest size.
+
+    Methods:
+        paint_cans(free_area) -> dict: The paint cans dictionary for an
+            area.
+        counts_many(free_areas) -> np.ndarray: The cans of each size for
+            many areas.
+
+    Raises:
+        ValueError: If there are no sizes or a size is not positive.
+    """
+
+    __slots__ = ("_sizes", "_coverage_per_m2", "_smallest_index")
+
+    def __init__(
+        self, sizes_in_liters: Sequence[float], coverage_per_m2: float
+    ) -> None:
+        """
+        Initializes a new instance of the GreedyPaintCansAllocator class.
+
+        Args:
+            sizes_in_liters: The paint can sizes, in liters.
+            coverage_per_m2: The square meters covered by a liter of paint.
+
+        Raises:
+            ValueError: If there are no sizes or a size is not positive.
+        """
+        if not sizes_in_liters or min(sizes_in_liters) <= 0:
+            raise ValueError("The paint can sizes must be greater than zero.")
+
+        self._sizes = tuple(sorted(sizes_in_liters, reverse=True))
+        self._coverage_per_m2 = coverage_per_m2
+        self._smallest_index = len(self._sizes) - 1
+
+    def paint_cans(self, free_area: float) -> dict:
+        """
+        Returns the paint cans that cover an area.
+
+        Args:
+            free_area: The area to be painted, in square meters.
+
+        Returns:
+            A dictionary with the number of cans of each size in liters,
+            from the largest to the smallest size.
+        """
+        coverage_per_m2 = self._coverage_per_m2
+        paint_cans_needed = {}
+
+        for size in self._sizes:
+            paint_cans_needed[size] = int(free_area / coverage_per_m2 / size)
+
+            free_area -= paint_cans_needed[size] * coverage_per_m2 * size
+
+        if free_area > 0:
+            extra_can = 1
+            paint_cans_needed[self._sizes[-1]] += extra_can
+
+        return paint_cans_needed
+
+    def counts_many(self, free_areas: np.ndarray) -> np.ndarray:
+        """
+        Returns the cans of each size that cover each one of many areas.
+
+        Args:
+            free_areas: The areas to be painted, in square meters.
+
+        Returns:
+            np.ndarray: An integer matrix with one row per area and one
+            column per size, from the largest to the smallest size.
+        """
+        coverage_per_m2 = self._coverage_per_m2
+
+        remaining_area = np.array(free_areas, dtype=np.float64, ndmin=1)
+        paint_cans_needed = np.empty(
+            (remaining_area.shape[0], len(self._sizes)), dtype=np.int64
+        )
+
+        for column, size in enumerate(self._sizes):
+            cans = np.trunc(remaining_area / coverage_per_m2 / size)
+            paint_cans_needed[:, column] = cans
+            remaining_area -= cans * coverage_per_m2 * size
+
+        paint_cans_needed[:, self._smallest_index] += remaining_area > 0
+
+        return paint_cans_needed
+
+    def __repr__(self) -> str:
+        return (
+            f"GreedyPaintCansAllocator(sizes= {self._sizes},"
+            f"coverage_per_m2= {self._coverage_per_m2})"
+        )
+
+
+class ExactPaintCansAllocator:
+    """
+    An exact solver of the paint cans that cover an area with the least
+    paint left over and, among those, the fewest cans.
+
+    Volumes are handled in integer multiples of the volume unit of the
+    sizes, deciliters for the built-in sizes. The fewest cans that add up
+    to each volume are found once by dynamic programming, up to the volume
+    needed by a maximum area, and the best covering volume for each needed
+    volume is stored in a table, so each query is a lookup.
+
+    Volumes above the table are reduced by full cans of the largest size.
+    Among any L cans of the other sizes, L being the largest size in
+    units, some add up to a multiple of L and fewer cans of the largest
+    size replace them. So, above L * L units, an optimal choice always
+    contains a can of the largest size, and the table is never smaller.
+
+    Attributes:
+        _sizes (tuple): The paint can sizes in liters, from the largest.
+        _sizes_units (np.ndarray): The paint can sizes in volume units.
+        _units_per_m2 (float): The volume units of paint per square meter.
+        _max_units (int): The largest needed volume in the table.
+        _counts (np.ndarray): The cans of each size, in the order of
+            `_sizes`, chosen for each needed volume.
+
+    Methods:
+        counts(free_area) -> Tuple[int, ...]: The cans of each size for an
+            area.
+        counts_many(free_areas) -> np.ndarray: The cans of each size for
+            many areas.
+        paint_cans(free_area) -> dict: The paint cans dictionary for an
+            area.
+
+    Raises:
+        ValueError: If a size is not a positive multiple of 1mL, the
+            maximum area is not positive or the table is too large.
+    """
+
+    __slots__ = (
+        "_sizes",
+        "_sizes_units",
+        "_units_per_m2",
+        "_max_units",
+        "_counts",
+    )
+
+    def __init__(
+        self,
+        sizes_in_liters: Sequence[float],
+        coverage_per_m2: float,
+        max_area: float,
+    ) -> None:
+        """
+        Initializes a new instance of the ExactPaintCansAllocator class and
+        precomputes its table.
+
+        Args:
+            sizes_in_liters: The paint can sizes, in liters.
+            coverage_per_m2: The square meters covered by a liter of paint.
+            max_area: The largest area, in square meters, solved by the
+                table without reductions.
+
+        Raises:
+            ValueError: If a size is not a positive multiple of 1mL, the
+                maximum area is not positive or the table is too large.
+        """
+        sizes = tuple(sorted(sizes_in_liters, reverse=True))
+        unit, sizes_units = sizes_in_units(sizes)
+        if max_area <= 0:
+            raise ValueError("The maximum area must be greater than zero.")
+
+        self._sizes = sizes
+        self._sizes_units = np.array(sizes_units, dtype=np.int64)
+        self._units_per_m2 = units_per_m2(unit, coverage_per_m2)
+        self._max_units = max(self._to_units(max_area), sizes_units[0] ** 2)
+        check_table_units(self._max_units, unit)
+        self._counts = self._build_table(sizes_units)
+
+    def _to_units(self, free_area: float) -> int:
+        return units_needed(free_area, self._units_per_m2)
+
+    def _build_table(self, sizes_units: Sequence[int]) -> np.ndarray:
+        """
+        Finds, for every needed volume up to the maximum, the cans of each
+        size that cover it with the least volume left over and the fewest
+        cans. Ties are broken in favor of the largest sizes.
+        """
+        max_total = self._max_units + min(sizes_units)
+        unreachable = max_total + 1
+
+        fewest_cans = [unreachable] * (max_total + 1)
+        last_size = [-1] * (max_total + 1)
+        fewest_cans[0] = 0
+        for total in range(1, max_total + 1):
+            for index, size in enumerate(sizes_units):
+                if size <= total and fewest_cans[total - size] + 1 < (
+                    fewest_cans[total]
+                ):
+                    fewest_cans[total] = fewest_cans[total - size] + 1
+                    last_size[total] = index
+
+        counts_by_total = np.zeros(
+            (max_total + 1, len(sizes_units)), dtype=np.int64
+        )
+        for total in range(1, max_total + 1):
+            if last_size[total] >= 0:
+                counts_by_total[total] = counts_by_total[
+                    total - sizes_units[last_size[total]]
+                ]
+                counts_by_total[total, last_size[total]] += 1
+
+        best_totals = np.empty(self._max_units + 1, dtype=np.int64)
+        best_total = max_total
+        while fewest_cans[best_total] == unreachable:
+            best_total -= 1
+        for needed in range(max_total, -1, -1):
+            if fewest_cans[needed] != unreachable:
+                best_total = needed
+            if needed <= self._max_units:
+                best_totals[needed] = best_total
+
+        return counts_by_total[best_totals]
+
+    def counts(self, free_area: float) -> Tuple[int, ...]:
+        """
+        Returns the cans of each size, from the largest, that cover an area.
+
+        Args:
+            free_area: The area to be painted, in square meters.
+
+        Returns:
+            The number of cans of each size, in the order of the sizes from
+            the largest to the smallest.
+        """
+        needed = self._to_units(free_area)
+        largest_cans = 0
+        if needed > self._max_units:
+            largest_cans = -(
+                -(needed - self._max_units) // int(self._sizes_units[0])
+            )
+            needed -= largest_cans * int(self._sizes_units[0])
+
+        counts = self._counts[needed].tolist()
+        counts[0] += largest_cans
+        return tuple(counts)
+
+    def counts_many(self, free_areas: np.ndarray) -> np.ndarray:
+        """
+        Returns the cans of each size that cover each one of many areas.
+
+        Args:
+            free_areas: The areas to be painted, in square meters.
+
+        Returns:
+            np.ndarray: An integer matrix with one row per area and one
+            column per size, from the largest to the smallest size.
+        """
+        needed = units_needed_many(free_areas, self._units_per_m2)
+        largest_size = self._sizes_units[0]
+        largest_cans = np.maximum(
+            -((self._max_units - needed) // largest_size), 0
+        )
+        counts = self._counts[needed - largest_cans * largest_size]
+        counts[:, 0] += largest_cans
+        return counts
+
+    def paint_cans(self, free_area: float) -> dict:
+        """
+        Returns the paint cans that cover an area.
+
+        Args:
+            free_area: The area to be painted, in square meters.
+
+        Returns:
+            A dictionary with the number of cans of each size in liters,
+            from the largest to the smallest size.
+        """
+        return dict(zip(self._sizes, self.counts(free_area)))
+
+    def __repr__(self) -> str:
+        return (
+            f"ExactPaintCansAllocator(sizes= {self._sizes},"
+            f"max_units= {self._max_units})"
+        )
+
+
+class CheapestPaintCansAllocator:
+    """
+    A solver of the cheapest paint cans that cover an area. Among the
+    purchases with the same price, the one with the least paint left over
+    and then the fewest cans is chosen.
+
+    Volumes are handled in integer multiples of the volume unit of the
+    sizes, deciliters for the built-in sizes, and prices in integer cents.
+    The cheapest cans that add up to each volume are found once by dynamic
+    programming, up to the volume needed by a maximum area. Only the volumes
+    cheaper than every larger volume can be the best purchase, so they are
+    kept as a sorted table of breakpoints: the best purchase for a needed
+    volume is the one of the first breakpoint not below it, found by a
+    binary search.
+
+    Volumes above the table are reduced by cans of the size with the lowest
+    price per liter, R units. Among any R cans of the other sizes, some
+    add up to a multiple of R and cans of size R replace them for less. So,
+    above R * L units, L being the largest size, a cheapest purchase
+    contains a can of size R, and the table is never smaller.
+
+    Attributes:
+        _prices (tuple): The size and price of each paint can, from the
+            largest size.
+        _units_per_m2 (float): The volume units of paint per square meter.
+        _max_units (int): The largest needed volume in the table.
+        _reduction_index (int): The index of the size with the lowest price
+            per liter.
+        _reduction_units (int): The size with the lowest price per liter,
+            in volume units.
+        _breakpoints (list): The volumes, in units, of the best
+            purchases, sorted.
+        _counts (np.ndarray): The cans of each size, from the largest, of
+            the purchase of each breakpoint.
+
+    Methods:
+        counts(free_area) -> Tuple[int, ...]: The cans of each size for an
+            area.
+        counts_many(free_areas) -> np.ndarray: The cans of each size for
+            many areas.
+        paint_cans(free_area) -> dict: The paint cans dictionary for an
+            area.
+
+    Raises:
+        ValueError: If a size is not a positive multiple of 1mL, a price is
+            not positive, the maximum area is not positive or the table is
+            too large.
+    """
+
+    __slots__ = (
+        "_prices",
+        "_units_per_m2",
+        "_max_units",
+        "_reduction_index",
+        "_reduction_units",
+        "_breakpoints",
+        "_counts",
+    )
+
+    def __init__(
+        self,
+        prices: Mapping[float, float],
+        coverage_per_m2: float,
+        max_area: float,
+    ) -> None:
+        """
+        Initializes a new instance of the CheapestPaintCansAllocator class
+        and precomputes its breakpoints.
+
+        Args:
+            prices: The price of each paint can size, in liters.
+            coverage_per_m2: The square meters covered by a liter of paint.
+            max_area: The largest area, in square meters, solved by the
+                table without reductions.
+
+        Raises:
+            ValueError: If a size is not a positive multiple of 1mL, a
+                price is not positive, the maximum area is not positive or
+                the table is too large.
+        """
+        self._prices = tuple(sorted(prices.items(), reverse=True))
+        if not self._prices or any(price <= 0 for _, price in self._prices):
+            raise ValueError("The paint can prices must be greater than zero.")
+        if max_area <= 0:
+            raise ValueError("The maximum area must be greater than zero.")
+
+        unit, sizes_units = sizes_in_units([size for size, _ in self._prices])
+        prices_cents = [round(price * 100) for _, price in self._prices]
+
+        self._units_per_m2 = units_per_m2(unit, coverage_per_m2)
+        self._reduction_index = min(
+            range(len(sizes_units)),
+            key=lambda index: (
+                prices_cents[index] / sizes_units[index],
+                -sizes_units[index],
+            ),
+        )
+        self._reduction_units = sizes_units[self._reduction_index]
+        self._max_units = max(
+            units_needed(max_area, self._units_per_m2),
+            self._reduction_units * sizes_units[0],
+        )
+        check_table_units(self._max_units, unit)
+        self._breakpoints, self._counts = self._build_breakpoints(
+            sizes_units, prices_cents
+        )
+
+    @property
+    def prices(self) -> Tuple[Tuple[float, float], ...]:
+        return self._prices
+
+    def _build_breakpoints(
+        self, sizes_units: Sequence[int], prices_cents: Sequence[int]
+    ) -> Tuple[list, np.ndarray]:
+        """
+        Finds the cheapest purchase of every volume up to the maximum and
+        keeps the volumes cheaper than every larger one. Ties are broken in
+        favor of the fewest cans and then of the largest sizes.
+        """
+        max_total = self._max_units + max(sizes_units)
+
+        best = [None] * (max_total + 1)
+        last_size = [-1] * (max_total + 1)
+        best[0] = (0, 0)
+        for total in range(1, max_total + 1):
+            for index, size in enumerate(sizes_units):
+                if size > total or best[total - size] is None:
+                    continue
+                cost, cans = best[total - size]
+                candidate = (cost + prices_cents[index], cans + 1)
+                if best[total] is None or candidate < best[total]:
+                    best[total] = candidate
+                    last_size[total] = index
+
+        breakpoints = []
+        cheapest = None
+        for total in range(max_total, -1, -1):
+            if best[total] is not None and (
+                cheapest is None or best[total][0] <= cheapest
+            ):
+                cheapest = best[total][0]
+                breakpoints.append(total)
+        breakpoints.reverse()
+
+        counts_by_total = np.zeros(
+            (max_total + 1, len(sizes_units)), dtype=np.int64
+        )
+        for total in range(1, max_total + 1):
+            if last_size[total] >= 0:
+                counts_by_total[total] = counts_by_total[
+                    total - sizes_units[last_size[total]]
+                ]
+                counts_by_total[total, last_size[total]] += 1
+
+        return breakpoints, counts_by_total[breakpoints]
+
+    def _reduce(self, needed: int) -> Tuple[int, int]:
+        """
+        Returns the cans of the size with the lowest price per liter taken
+        out of a volume above the table, and the volume left.
+        """
+        if needed <= self._max_units:
+            return 0, needed
+        reduction_cans = -(
+            -(needed - self._max_units) // self._reduction_units
+        )
+        return reduction_cans, needed - (
+            reduction_cans * self._reduction_units
+        )
+
+    def counts(self, free_area: float) -> Tuple[int, ...]:
+        """
+        Returns the cans of each size, from the largest, of the cheapest
+        purchase that covers an area.
+
+        Args:
+            free_area: The area to be painted, in square meters.
+
+        Returns:
+            The number of cans of each size, in the order of the sizes from
+            the largest to the smallest.
+        """
+        reduction_cans, needed = self._reduce(
+            units_needed(free_area, self._units_per_m2)
+        )
+        counts = self._counts[bisect_left(self._breakpoints, needed)].tolist()
+        counts[self._reduction_index] += reduction_cans
+        return tuple(counts)
+
+    def counts_many(self, free_areas: np.ndarray) -> np.ndarray:
+        """
+        Returns the cans of each size of the cheapest purchase that covers
+        each one of many areas.
+
+        Args:
+            free_areas: The areas to be painted, in square meters.
+
+        Returns:
+            np.ndarray: An integer matrix with one row per area and one
+            column per size, from the largest to the smallest size.
+        """
+        needed = units_needed_many(free_areas, self._units_per_m2)
+        reduction_cans = np.maximum(
+            -((self._max_units - needed) // self._reduction_units),
+            0,
+        )
+        counts = self._counts[
+            np.searchsorted(
+                self._breakpoints,
+                needed - reduction_cans * self._reduction_units,
+                "left",
+            )
+        ]
+        counts[:, self._reduction_index] += reduction_cans
+        return counts
+
+    def paint_cans(self, free_area: float) -> dict:
+        """
+        Returns the cheapest paint cans that cover an area.
+
+        Args:
+            free_area: The area to be painted, in square meters.
+
+        Returns:
+            A dictionary with the number of cans of each size in liters,
+            from the largest to the smallest size.
+        """
+        return dict(
+            zip((size for size, _ in self._prices), self.counts(free_area))
+        )
+
+    def price(self, paint_cans: Mapping[float, int]) -> float:
+        """
+        Returns the price of the given paint cans.
+
+        Args:
+            paint_cans: The number of cans of each size in liters.
+
+        Returns:
+            The total price of the cans, rounded to cents.
+        """
+        prices = dict(self._prices)
+        return round(
+            sum(prices[size] * cans for size, cans in paint_cans.items()), 2
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CheapestPaintCansAllocator(prices= {dict(self._prices)},"
+            f"breakpoints= {len(self._breakpoints)})"
+        )
@@ -0,0 +1,319 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from src.schemas.door import DEFAULT_DOOR
+from src.schemas.request.room import Room
+from src.schemas.window import DEFAULT_WINDOW
+from src.services.room_validator import RoomValidator
+from src.services.validation_result import WallRule
+
+
+class ColumnarRoomValidator:
+    """
+    Class `ColumnarRoomValidator` validates the dimensions of many rooms at
+    once. The width, height, number of doors and number of windows of every
+    wall are loaded into NumPy arrays and each rule of `RoomValidator` is
+    checked for all walls as a single array mask.
+
+    The errors reported are the same `Wall_i` dictionaries built by
+    `RoomValidator.validate_dimensions()`, messages are only formatted for
+    the walls that actually failed a rule.
+
+    Usage:
+    - Instantiate the class with `ColumnarRoomValidator.from_rooms(rooms)`.
+    - Call `invalid_dimensions_values()` to get, for each room, a dictionary
+      with the errors of its walls. An empty dictionary means the room
+      dimensions are consistent.
+
+    Attributes:
+        _widths (np.ndarray): The width of each wall.
+        _heights (np.ndarray): The height of each wall.
+        _number_doors (np.ndarray): The number of doors of each wall.
+        _number_windows (np.ndarray): The number of windows of each wall.
+        _room_offsets (np.ndarray): The index of the first wall of each room,
+            followed by the total number of walls.
+
+    Methods:
+        from_rooms(rooms) -> ColumnarRoomValidator:
+            Loads the walls of the given rooms into the columnar arrays.
+
+        failures() -> np.ndarray:
+            Returns a boolean matrix with one row per wall and one column per
+            rule, True where the wall fails the rule.
+
+        invalid_dimensions_values() -> List[Dict[str, List[str]]]:
+            Returns the errors of the walls of each room.
+
+        validate_dimensions() -> np.ndarray:
+            Returns a boolean array, True for each room with consistent
+            dimensions.
+    """
+
+    __slots__ = (
+        "_widths",
+        "_heights",
+        "_number_doors",
+        "_number_windows",
+        "_room_offsets",
+    )
+
+    def __init__(
+        self,
+        widths: np.ndarray,
+        heights: np.ndarray,
+        number_doors: np.ndarray,
+        number_windows: np.ndarray,
+        room_offsets: np.ndarray,
+    ) -> None:
+        """
+        Initializes a new instance of the ColumnarRoomValidator class.
+
+        Args:
+            widths: The width of each wall.
+            heights: The height of each wall.
+            number_doors: The number of doors of each wall.
+            number_windows: The number of windows of each wall.
+            room_offsets: The index of the first wall of each room, followed
+                by the total number of walls.
+
+        Raises:
+            ValueError: If the columns do not have the same length or the
+                room offsets do not cover all walls.
+        """
+        self._widths = np.asarray(widths, dtype=np.float64)
+        self._heights = np.asarray(heights, dtype=np.float64)
+        self._number_doors = np.asarray(number_doors, dtype=np.int64)
+        self._number_windows = np.asarray(number_windows, dtype=np.int64)
+        self._room_offsets = np.asarray(room_offsets, dtype=np.int64)
+
+        number_walls = self._widths.shape[0]
+        if not (
+            self._heights.shape[0]
+            == self._number_doors.shape[0]
+            == self._number_windows.shape[0]
+            == number_walls
+        ):
+            raise ValueError("All wall columns must have the same length.")
+        if (
+            self._room_offsets.shape[0] == 0
+            or self._room_offsets[0] != 0
+            or self._room_offsets[-1] != number_walls
+        ):
+            raise ValueError("The room offsets must cover all walls.")
+
+    @classmethod
+    def from_rooms(cls, rooms: Sequence[Room]) -> "ColumnarRoomValidator":
+        """
+        Loads the walls of the given rooms into columnar arrays.
+
+        Args:
+            rooms: The rooms to be validated.
+
+        Returns:
+            A ColumnarRoomValidator instance holding the walls of all rooms.
+
+        Raises:
+            TypeError: If any of the rooms is not an instance of the Room
+                class.
+        """
+        if not all(isinstance(room, Room) for room in rooms):
+            raise TypeError(
+                "The rooms argument must be a sequence of instances of the"
+                " Room class."
+            )
+
+        walls = [wall for room in rooms for wall in room.walls]
+        room_offsets = np.zeros(len(rooms) + 1, dtype=np.int64)
+        np.cumsum([len(room.walls) for room in rooms], out=room_offsets[1:])
+
+        return cls(
+            widths=np.fromiter(
+                (wall.width for wall in walls), np.float64, len(walls)
+            ),
+            heights=np.fromiter(
+                (wall.height for wall in walls), np.float64, len(walls)
+            ),
+            number_doors=np.fromiter(
+                (wall.number_doors for wall in walls), np.int64, len(walls)
+            ),
+            number_windows=np.fromiter(
+                (wall.number_windows for wall in walls), np.int64, len(walls)
+            ),
+            room_offsets=room_offsets,
+        )
+
+    @property
+    def _walls_area(self) -> np.ndarray:
+        return self._widths * self._heights
+
+    @property
+    def _openings_area(self) -> np.ndarray:
+        return (
+            DEFAULT_WINDOW.area * self._number_windows
+            + DEFAULT_DOOR.area * self._number_doors
+        )
+
+    @property
+    def _openings_width(self) -> np.ndarray:
+        return (
+            self._number_windows * DEFAULT_WINDOW.width
+            + self._number_doors * DEFAULT_DOOR.width
+        )
+
+    @property
+    def _min_wall_height_for_door(self) -> float:
+        return (
+            DEFAULT_DOOR.height
+            + RoomValidator._MIN_DIFFERENCE_WALL_HEIGHT_TALLER_THAN_DOOR_METER
+        )
+
+    def failures(self) -> np.ndarray:
+        """
+        Checks every rule for every wall as array masks.
+
+        Returns:
+            np.ndarray: A boolean matrix with one row per wall and one column
+            per rule, indexed by `WallRule`. True where the wall fails the
+            rule.
+        """
+        walls_area = self._walls_area
+        has_doors = self._number_doors > 0
+        has_windows = self._number_windows > 0
+        has_openings = has_doors | has_windows
+
+        failures = np.empty((walls_area.shape[0], len(WallRule)), bool)
+        failures[:, WallRule.AREA_OUT_OF_RANGE] = ~(
+            (RoomValidator._MIN_WALL_AREA <= walls_area)
+            & (walls_area <= RoomValidator._MAX_WALL_AREA)
+        )
+        failures[:, WallRule.INSUFFICIENT_FREE_AREA] = has_openings & ~(
+            walls_area * RoomValidator._MIN_WALL_FREE_AREA_RATE
+            >= self._openings_area
+        )
+        failures[:, WallRule.NOT_TALLER_THAN_DOOR] = has_doors & ~(
+            self._heights >= self._min_wall_height_for_door
+        )
+        failures[:, WallRule.NOT_TALLER_THAN_WINDOW] = has_windows & ~(
+            self._heights >= DEFAULT_WINDOW.height
+        )
+        failures[:, WallRule.NOT_WIDER_THAN_DOORS_WINDOWS] = has_openings & ~(
+            self._widths >= self._openings_width
+        )
+        return failures
+
+    def _wall_error_messages(
+        self, index: int, wall_failures: np.ndarray
+    ) -> List[str]:
+        """
+        Formats the error messages of the rules failed by a single wall.
+
+        Args:
+            index: The index of the wall in the columnar arrays.
+            wall_failures: The row of `failures()` for the wall.
+
+        Returns:
+            List[str]: The error messages, in the order of `WallRule`.
+        """
+        width = float(self._widths[index])
+        height = float(self._heights[index])
+        number_doors = int(self._number_doors[index])
+        number_windows = int(self._number_windows[index])
+        wall_area = width * height
+
+        failures = {
+            WallRule.AREA_OUT_OF_RANGE: (
+                wall_area,
+                RoomValidator._MIN_WALL_AREA,
+                RoomValidator._MAX_WALL_AREA,
+            ),
+            WallRule.INSUFFICIENT_FREE_AREA: (
+                wall_area * RoomValidator._MIN_WALL_FREE_AREA_RATE,
+                DEFAULT_WINDOW.area * number_windows
+                + DEFAULT_DOOR.area * number_doors,
+            ),
+            WallRule.NOT_TALLER_THAN_DOOR: (
+                self._min_wall_height_for_door - height,
+            ),
+            WallRule.NOT_TALLER_THAN_WINDOW: (DEFAULT_WINDOW.height - height,),
+            WallRule.NOT_WIDER_THAN_DOORS_WINDOWS: (
+                number_windows * DEFAULT_WINDOW.width
+                + number_doors * DEFAULT_DOOR.width
+                - width,
+            ),
+        }
+        messages = [
+            RoomValidator.format_failure(rule, params)
+            for rule, params in failures.items()
+            if wall_failures[rule]
+        ]
+        return messages
+
+    def invalid_dimensions_values(self) -> List[Dict[str, List[str]]]:
+        """
+        Validates the dimensions of every room.
+
+        Returns:
+            List[Dict[str, List[str]]]: One dictionary per room with the
+            same format returned by `RoomValidator.validate_dimensions()`
+            errors:
+            {
+                "Wall_1": ["error_1", "error_2", ...],
+                ...
+            }
+            The dictionary is empty when the room dimensions are consistent.
+        """
+        failures = self.failures()
+        invalid_dimensions_values = [
+            {} for _ in range(self._room_offsets.shape[0] - 1)
+        ]
+
+        failed_walls = np.flatnonzero(failures.any(axis=1))
+        rooms = np.searchsorted(self._room_offsets, failed_walls, "right") - 1
+        for index, room in zip(failed_walls.tolist(), rooms.tolist()):
+            wall_number = index - int(self._room_offsets[room]) + 1
+            invalid_dimensions_values[room][
+                f"Wall_{wall_number}"
+            ] = self._wall_error_messages(index, failures[index])
+
+        return invalid_dimensions_values
+
+    def validate_dimensions(self) -> np.ndarray:
+        """
+        Validates the dimensions of every room.
+
+        Returns:
+            np.ndarray: A boolean array with one item per room, True when the
+            room dimensions are consistent.
+        """
+        failed_walls = np.concatenate(
+            ([0], np.cumsum(self.failures().any(axis=1)))
+        )
+        return failed_walls[self._room_offsets[1:]] == (
+            failed_walls[self._room_offsets[:-1]]
+        )
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the ColumnarRoomValidator instance.
+
+        Returns:
+            str: A string containing information about the instance.
+        """
+        return f"""
+        Columnar Room Validator:
+            rooms: {self._room_offsets.shape[0] - 1}
+            walls: {self._widths.shape[0]}
+        """
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the ColumnarRoomValidator instance.
+
+        Returns:
+            str: A string containing information about the instance.
+        """
+        return (
+            f"ColumnarRoomValidator(rooms= {self._room_offsets.shape[0] - 1},"
+            f"walls= {self._widths.shape[0]})"
+        )
@@ -46,3 +46,20 @@ class WallNotWiderThanDoorWindowError(ValueError):
 
 
 # ------------------------------- PAINT CANS NEEDED CALCULATOR------------------
+
+
+class UnknownPaintCanCatalogError(KeyError):
+    """
+    Raised when a paint can catalog is selected by an id that is not loaded.
+    """
+
+    pass
+
+
+class UnavailableAllocationError(ValueError):
+    """
+    Raised when an allocation strategy needs data that the paint can
+    catalog does not have, such as the CHEAPEST strategy without prices.
+    """
+
+    pass
@@ -0,0 +1,522 @@
+import json
+import logging
+import os
+from threading import Event, Lock, Thread
+from types import MappingProxyType
+from typing import Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.extensions.logger import LOGGER_NAME
+from src.schemas.paint_can_catalog import PaintCanCatalog, PaintCanCatalogs
+from src.services.can_allocation import (
+    AllocationStrategy,
+    CheapestPaintCansAllocator,
+    ExactPaintCansAllocator,
+    GreedyPaintCansAllocator,
+)
+from src.services.exception import (
+    UnavailableAllocationError,
+    UnknownPaintCanCatalogError,
+)
+
+DEFAULT_CATALOG_ID = "default"
+
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+
+class CompiledPaintCanCatalog:
+    """
+    A paint can catalog compiled into the allocators of every strategy, so
+    the paint cans of a room are looked up in tables built once, when the
+    catalog is compiled.
+
+    Attributes:
+        _id (str): The id of the catalog.
+        _sizes (tuple): The paint can sizes in liters, from the largest.
+        _coverage_per_m2 (float): The square meters covered by a liter of
+            paint.
+        _prices (tuple): The size and price of each can, from the largest
+            size. The prices are None when the catalog has no prices.
+        _allocators (dict): The allocator of each strategy available.
+
+    Methods:
+        compile(catalog_id, catalog, max_area) -> CompiledPaintCanCatalog:
+            Compiles a catalog loaded from a file.
+        with_prices(prices) -> CompiledPaintCanCatalog: The same catalog
+            with other prices, reusing the allocators that do not use them.
+        paint_cans(free_area, allocation) -> dict: The paint cans that cover
+            an area.
+        counts_many(free_areas, allocation) -> np.ndarray: The cans of each
+            size that cover many areas.
+        paint_cans_from_counts(counts) -> dict: The paint cans dictionary of
+            a row of counts_many.
+
+    Raises:
+        ValueError: If a size is not a positive multiple of 1mL, a price or
+            the coverage are not positive.
+    """
+
+    __slots__ = ("_id", "_sizes", "_coverage_per_m2", "_prices", "_allocators")
+
+    def __init__(
+        self,
+        catalog_id: str,
+        sizes_in_liters: Sequence[float],
+        coverage_per_m2: float,
+        max_area: float,
+        prices: Optional[Mapping[float, float]] = None,
+        allocators: Optional[Mapping[AllocationStrategy, object]] = None,
+    ) -> None:
+        """
+        Initializes a new instance of the CompiledPaintCanCatalog class and
+        builds the allocators not given.
+
+        Args:
+            catalog_id: The id of the catalog.
+            sizes_in_liters: The paint can sizes, in liters.
+            coverage_per_m2: The square meters covered by a liter of paint.
+            max_area: The largest area, in square meters, solved by the
+                allocation tables without reductions.
+            prices: The price of each paint can size, if the catalog has
+                prices.
+            allocators: Allocators already built for this catalog, reused
+                instead of building them again.
+
+        Raises:
+            ValueError: If a size is not a positive multiple of 1mL, a
+                price or the coverage are not positive, or the prices do not
+                match the sizes.
+        """
+        if coverage_per_m2 <= 0:
+            raise ValueError("The coverage must be greater than zero.")
+
+        sizes = tuple(sorted(sizes_in_liters, reverse=True))
+        if prices is not None and set(prices) != set(sizes):
+            raise ValueError(
+                "The catalog must have one price for each paint can size."
+            )
+        self._id = catalog_id
+        self._sizes = sizes
+        self._coverage_per_m2 = coverage_per_m2
+        self._prices = (
+            None
+            if prices is None
+            else tuple((size, prices[size]) for size in sizes)
+        )
+
+        allocators = dict(allocators or {})
+        if AllocationStrategy.GREEDY not in allocators:
+            allocators[AllocationStrategy.GREEDY] = GreedyPaintCansAllocator(
+                sizes, coverage_per_m2
+            )
+        if AllocationStrategy.EXACT not in allocators:
+            allocators[AllocationStrategy.EXACT] = ExactPaintCansAllocator(
+                sizes, coverage_per_m2, max_area
+            )
+        allocators.pop(AllocationStrategy.CHEAPEST, None)
+        if prices is not None:
+            allocators[
+                AllocationStrategy.CHEAPEST
+            ] = CheapestPaintCansAllocator(
+                dict(self._prices), coverage_per_m2, max_area
+            )
+        self._allocators = MappingProxyType(allocators)
+
+    @classmethod
+    def compile(
+        cls, catalog_id: str, catalog: PaintCanCatalog, max_area: float
+    ) -> "CompiledPaintCanCatalog":
+        """
+        Compiles a catalog loaded from a file.
+
+        Args:
+            catalog_id: The id of the catalog.
+            catalog: The catalog validated by the PaintCanCatalog schema.
+            max_area: The largest area solved by the allocation tables
+                without reductions.
+
+        Returns:
+            The compiled catalog.
+
+        Raises:
+            ValueError: If a size is not a positive multiple of 1mL.
+        """
+        prices = None
+        if catalog.cans[0].price is not None:
+            prices = {can.size: can.price for can in catalog.cans}
+
+        return cls(
+            catalog_id,
+            [can.size for can in catalog.cans],
+            catalog.coverage_per_m2,
+            max_area,
+            prices,
+        )
+
+    def with_prices(
+        self, prices: Mapping[float, float], max_area: float
+    ) -> "CompiledPaintCanCatalog":
+        """
+        Returns the same catalog with other prices. Only the allocator of
+        the CHEAPEST strategy is built again.
+
+        Args:
+            prices: The price of each paint can size, in liters.
+            max_area: The largest area solved by the allocation table of the
+                CHEAPEST strategy without reductions.
+
+        Raises:
+            ValueError: If the prices do not match the sizes of the catalog
+                or any price is not positive.
+        """
+        return type(self)(
+            self._id,
+            self.sizes,
+            self._coverage_per_m2,
+            max_area,
+            prices,
+            self._allocators,
+        )
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def sizes(self) -> Tuple[float, ...]:
+        return self._sizes
+
+    @property
+    def prices(self) -> Optional[Tuple[Tuple[float, float], ...]]:
+        return self._prices
+
+    @property
+    def key(self) -> Hashable:
+        """
+        Returns a key that changes with every value of the catalog, so the
+        results of a catalog are never mistaken for another one, or for an
+        older version of the same catalog.
+        """
+        return self._id, self._coverage_per_m2, self.sizes, self._prices
+
+    def _allocator(self, allocation: AllocationStrategy):
+        allocator = self._allocators.get(allocation)
+        if allocator is None:
+            raise UnavailableAllocationError(
+                f"The {allocation.value} allocation is not available for the"
+                f" '{self._id}' paint can catalog."
+            )
+        return allocator
+
+    def paint_cans(
+        self, free_area: float, allocation: AllocationStrategy
+    ) -> dict:
+        """
+        Returns the paint cans that cover an area.
+
+        Args:
+            free_area: The area to be painted, in square meters.
+            allocation: The strategy to choose the paint cans.
+
+        Returns:
+            A dictionary with the number of cans of each size in liters,
+            from the largest to the smallest size.
+
+        Raises:
+            UnavailableAllocationError: If the catalog has no data for the
+                allocation strategy.
+        """
+        return self._allocator(allocation).paint_cans(free_area)
+
+    def counts_many(
+        self, free_areas: np.ndarray, allocation: AllocationStrategy
+    ) -> np.ndarray:
+        """
+        Returns the cans of each size that cover each one of many areas.
+
+        Args:
+            free_areas: The areas to be painted, in square meters.
+            allocation: The strategy to choose the paint cans.
+
+        Returns:
+            np.ndarray: An integer matrix with one row per area and one
+            column per size, from the largest to the smallest size.
+
+        Raises:
+            UnavailableAllocationError: If the catalog has no data for the
+                allocation strategy.
+        """
+        return self._allocator(allocation).counts_many(
+            np.array(free_areas, dtype=np.float64, ndmin=1)
+        )
+
+    def paint_cans_from_counts(self, counts: np.ndarray) -> dict:
+        """
+        Builds the paint cans dictionary from a row of `counts_many()`.
+        """
+        return dict(zip(self.sizes, counts.tolist()))
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledPaintCanCatalog(id= {self._id},"
+            f"sizes= {self.sizes},"
+            f"coverage_per_m2= {self._coverage_per_m2})"
+        )
+
+
+def load_paint_can_catalogs(path: str) -> Dict[str, PaintCanCatalog]:
+    """
+    Loads and validates the paint can catalogs of a JSON or YAML file. YAML
+    files need the optional PyYAML package.
+
+    Args:
+        path: The path of the file, read as YAML when it ends with .yaml or
+            .yml and as JSON otherwise.
+
+    Returns:
+        The catalogs of the file, keyed by catalog id.
+
+    Raises:
+        OSError: If the file can not be read.
+        ValueError: If the file is not valid JSON or YAML, or its catalogs
+            are not valid.
+        ImportError: If the file is YAML and PyYAML is not installed.
+    """
+    with open(path, "rb") as catalogs_file:
+        content = catalogs_file.read()
+
+    if path.lower().endswith(_YAML_SUFFIXES):
+        try:
+            import yaml
+        except ImportError as error:
+            raise ImportError(
+                "PyYAML is required to load YAML paint can catalogs."
+            ) from error
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as error:
+            raise ValueError(str(error)) from error
+    else:
+        data = json.loads(content)
+
+    return PaintCanCatalogs.parse_obj(data).catalogs
+
+
+class PaintCanCatalogRegistry:
+    """
+    The paint can catalogs loaded from `ApiConfig.PAINT_CAN_CATALOGS_FILE`,
+    compiled and ready to be selected by id.
+
+    The catalogs are compiled when the file is loaded, by `create_api()` and
+    by a polling thread that reloads the file when its modification time
+    changes, never on the request path. The compiled catalogs are replaced
+    at once, with a single assignment, so a request in progress keeps using
+    the catalogs it selected. A file that fails to load is logged and the
+    catalogs already loaded are kept.
+
+    The built-in catalog of `PaintCansCalculator` is selected by
+    `DEFAULT_CATALOG_ID`, unless the file defines a catalog with that id.
+
+    Attributes:
+        _path (str): The path of the catalogs file, if any.
+        _default_id (str): The id of the catalog selected by default.
+        _max_area (float): The largest area solved by the allocation tables
+            without reductions.
+        _catalogs (Mapping): The compiled catalogs, keyed by id.
+        _modified (tuple): The modification time and size of the file last
+            loaded.
+
+    Methods:
+        get(catalog_id) -> CompiledPaintCanCatalog: Selects a catalog.
+        catalogs() -> tuple: The compiled catalogs loaded.
+        reload() -> bool: Loads the file again.
+        reload_if_changed() -> bool: Loads the file if it changed.
+        start_polling(interval): Starts the polling thread.
+        stop_polling(): Stops the polling thread.
+        stats() -> dict: The counters of the registry.
+    """
+
+    __slots__ = (
+        "_path",
+        "_default_id",
+        "_max_area",
+        "_catalogs",
+        "_modified",
+        "_reload_lock",
+        "_reloads",
+        "_failures",
+        "_stop_polling",
+        "_polling_thread",
+        "_logger",
+    )
+
+    def __init__(
+        self,
+        path: Optional[str],
+        max_area: float,
+        default_id: str = DEFAULT_CATALOG_ID,
+    ) -> None:
+        """
+        Initializes a new instance of the PaintCanCatalogRegistry class and
+        loads the catalogs file, if given.
+
+        Args:
+            path: The path of the catalogs file, if any.
+            max_area: The largest area solved by the allocation tables
+                without reductions.
+            default_id: The id of the catalog selected by default.
+        """
+        self._path = path
+        self._default_id = default_id
+        self._max_area = max_area
+        self._catalogs: Mapping[
+            str, CompiledPaintCanCatalog
+        ] = MappingProxyType({})
+        self._modified = None
+        self._reload_lock = Lock()
+        self._reloads = 0
+        self._failures = 0
+        self._stop_polling = Event()
+        self._polling_thread: Optional[Thread] = None
+        self._logger = logging.getLogger(f"{LOGGER_NAME}.catalogs")
+
+        if path:
+            self.reload()
+
+    def get(
+        self, catalog_id: Optional[str] = None
+    ) -> Optional[CompiledPaintCanCatalog]:
+        """
+        Selects a compiled catalog by id.
+
+        Args:
+            catalog_id: The id of the catalog, the default one when not
+                given.
+
+        Returns:
+            The compiled catalog, or None for the built-in catalog of
+            `PaintCansCalculator`.
+
+        Raises:
+            UnknownPaintCanCatalogError: If no catalog has the id.
+        """
+        catalog_id = catalog_id or self._default_id
+        catalog = self._catalogs.get(catalog_id)
+        if catalog is None and catalog_id != DEFAULT_CATALOG_ID:
+            raise UnknownPaintCanCatalogError(catalog_id)
+        return catalog
+
+    def catalogs(self) -> Tuple[CompiledPaintCanCatalog, ...]:
+        """
+        Returns the compiled catalogs loaded, without the built-in one.
+        """
+        return tuple(self._catalogs.values())
+
+    def _file_modified(self) -> Optional[Tuple[int, int]]:
+        try:
+            file_stat = os.stat(self._path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def reload(self) -> bool:
+        """
+        Loads and compiles the catalogs file and swaps the compiled catalogs
+        in. On failure, the error is logged and the catalogs already loaded
+        are kept.
+
+        Returns:
+            True if the catalogs were replaced.
+        """
+        with self._reload_lock:
+            modified = self._file_modified()
+            try:
+                catalogs = {
+                    catalog_id: CompiledPaintCanCatalog.compile(
+                        catalog_id, catalog, self._max_area
+                    )
+                    for catalog_id, catalog in load_paint_can_catalogs(
+                        self._path
+                    ).items()
+                }
+            except Exception as error:
+                self._modified = modified
+                self._failures += 1
+                self._logger.warning(
+                    json.dumps(
+                        {
+                            "msg": "paint_can_catalogs_reload_failed",
+                            "path": self._path,
+                            "error": f"{type(error).__name__}: {error}",
+                        }
+                    )
+                )
+                return False
+
+            self._catalogs = MappingProxyType(catalogs)
+            self._modified = modified
+            self._reloads += 1
+            return True
+
+    def reload_if_changed(self) -> bool:
+        """
+        Loads the catalogs file again if its modification time or size
+        changed since it was last loaded.
+
+        Returns:
+            True if the catalogs were replaced.
+        """
+        if not self._path or self._file_modified() == self._modified:
+            return False
+        return self.reload()
+
+    def _poll(self, interval: float) -> None:
+        while not self._stop_polling.wait(interval):
+            self.reload_if_changed()
+
+    def start_polling(self, interval: float) -> None:
+        """
+        Starts a daemon thread that reloads the catalogs file when it
+        changes, checked every `interval` seconds. Nothing is started
+        without a catalogs file or with a non-positive interval.
+        """
+        if not self._path or interval <= 0 or self._polling_thread:
+            return
+
+        self._stop_polling.clear()
+        self._polling_thread = Thread(
+            target=self._poll,
+            args=(interval,),
+            name="paint-can-catalogs",
+            daemon=True,
+        )
+        self._polling_thread.start()
+
+    def stop_polling(self) -> None:
+        """
+        Stops the polling thread, if started.
+        """
+        if self._polling_thread is None:
+            return
+
+        self._stop_polling.set()
+        self._polling_thread.join()
+        self._polling_thread = None
+
+    def stats(self) -> dict:
+        """
+        Returns the ids of the catalogs loaded and the number of reloads and
+        failed reloads of the catalogs file.
+        """
+        return {
+            "catalogs": sorted(self._catalogs),
+            "reloads": self._reloads,
+            "failures": self._failures,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"PaintCanCatalogRegistry(path= {self._path},"
+            f"catalogs= {sorted(self._catalogs)})"
+        )
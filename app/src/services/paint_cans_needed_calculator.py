@@ -1,7 +1,17 @@
+from typing import Hashable, Mapping
+
+import numpy as np
+
+from config import ApiConfig
 from src.extensions.logger import log_exceptions
 from src.schemas.request.room import Room
 from src.schemas.response.paint_cans_needed import PaintCans
+from src.services.can_allocation import AllocationStrategy
 from src.services.interfaces.paint_cans_interface import PaintCansInterface
+from src.services.paint_can_catalog import (
+    DEFAULT_CATALOG_ID,
+    CompiledPaintCanCatalog,
+)
 
 
 class PaintCansCalculator(PaintCansInterface):
@@ -21,47 +31,169 @@ class PaintCansCalculator(PaintCansInterface):
     - The method returns a dictionary that contains the number of paint cans
     required for each size.
 
+    The cans are chosen by the `AllocationStrategy` given to the instance,
+    or `ApiConfig.PAINT_CANS_ALLOCATION` by default: GREEDY prefers the
+    largest possible cans, EXACT leaves the least paint over with the
+    fewest cans, and CHEAPEST buys the cheapest cans at the prices of the
+    catalog. They are sold by a `CompiledPaintCanCatalog`, the built-in
+    `_default_catalog` unless another one is given, whose tables answer the
+    EXACT and CHEAPEST strategies with lookups.
+
     Class-level Attributes:
         _PAINT_COVERAGE_PER_M2 (int): The amount of paint coverage in square meters per liter of paint.
         _PAINT_CAN_SIZES_IN_LITERS (tuple): A tuple of valid paint can sizes in liters.
+        _PAINT_CAN_PRICES (dict): The price of each paint can size, overridden by `ApiConfig.PAINT_CAN_PRICES`.
+        _default_catalog (CompiledPaintCanCatalog): The built-in catalog, compiled once and again when the
+            prices change.
 
     Attributes:
         _room (Room): The room whose room area will be painted.
+        _allocation (AllocationStrategy): The strategy to choose the paint cans.
+        _catalog (CompiledPaintCanCatalog): The catalog of the paint cans, None for the built-in one.
 
     Methods:
         calculate_paint_cans_needed: Calculates the number of paint cans needed to cover the room area.
+        paint_cans_for_free_area: Calculates the number of paint cans needed to cover a free area.
+        calculate_many: Calculates the number of paint cans needed to cover each one of many free areas.
+        paint_cans_from_counts: Builds the paint cans dictionary from a row returned by calculate_many.
+        set_paint_can_prices: Replaces the prices of the built-in catalog.
+        allocation_key: The key of the results of an allocation strategy and catalog.
 
     Raises:
         TypeError: If the room argument is not an instance of the Room class.
+        ValueError: If the allocation is not an AllocationStrategy value.
+        UnavailableAllocationError: If the catalog has no data for the allocation strategy.
     """
 
-    __slots__ = "_room"
+    __slots__ = ("_room", "_allocation", "_catalog")
 
     _PAINT_COVERAGE_PER_M2 = 5
     _PAINT_CAN_SIZES_IN_LITERS = (0.5, 2.5, 3.6, 18)
 
-    def __init__(self, room: Room) -> None:
+    _PAINT_CAN_PRICES = ApiConfig.PAINT_CAN_PRICES or {
+        0.5: 12.9,
+        2.5: 49.9,
+        3.6: 64.9,
+        18: 259.9,
+    }
+
+    _default_catalog = CompiledPaintCanCatalog(
+        DEFAULT_CATALOG_ID,
+        _PAINT_CAN_SIZES_IN_LITERS,
+        _PAINT_COVERAGE_PER_M2,
+        ApiConfig.EXACT_ALLOCATION_MAX_AREA,
+        _PAINT_CAN_PRICES,
+    )
+
+    def __init__(
+        self,
+        room: Room,
+        allocation: AllocationStrategy | str = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> None:
         """
         Initializes a new instance of the PaintCansCalculator class.
 
         Args:
             room (Room): The room whose room area will be painted.
+            allocation (AllocationStrategy): The strategy to choose the paint
+                cans, `ApiConfig.PAINT_CANS_ALLOCATION` when not given.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
 
         Raises:
             TypeError: If the room argument is not an instance of the Room class.
+            ValueError: If the allocation is not an AllocationStrategy value.
         """
 
         self._room = room
+        self._allocation = self.allocation_strategy(allocation)
+        self._catalog = catalog
 
         if not isinstance(room, Room):
             raise TypeError(
                 "The room argument must be an instance of the Room class."
             )
 
+    @staticmethod
+    def allocation_strategy(
+        allocation: AllocationStrategy | str = None,
+    ) -> AllocationStrategy:
+        """
+        Returns the allocation strategy given, or the one configured by
+        `ApiConfig.PAINT_CANS_ALLOCATION` when none is given.
+
+        Raises:
+            ValueError: If the allocation is not an AllocationStrategy value.
+        """
+        return AllocationStrategy(
+            allocation or ApiConfig.PAINT_CANS_ALLOCATION
+        )
+
+    @property
+    def allocation(self) -> AllocationStrategy:
+        return self._allocation
+
+    @classmethod
+    def paint_can_catalog(
+        cls, catalog: CompiledPaintCanCatalog = None
+    ) -> CompiledPaintCanCatalog:
+        """
+        Returns the catalog given, or the built-in one when none is given.
+        """
+        return catalog or cls._default_catalog
+
+    @classmethod
+    def allocation_key(
+        cls,
+        allocation: AllocationStrategy | str = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> Hashable:
+        """
+        Returns the key that tells apart the results of an allocation
+        strategy and catalog. It holds every value of the catalog, so the
+        results of a catalog are not reused after its sizes, coverage or
+        prices change.
+
+        Raises:
+            ValueError: If the allocation is not an AllocationStrategy value.
+        """
+        return (
+            cls.allocation_strategy(allocation),
+            cls.paint_can_catalog(catalog).key,
+        )
+
+    @classmethod
+    def set_paint_can_prices(cls, prices: Mapping[float, float]) -> None:
+        """
+        Replaces the prices of the built-in catalog. Only the CHEAPEST
+        allocation is compiled again, and only when the prices change. The
+        new catalog is swapped in at once, so calculations in progress use
+        either the old or the new prices.
+
+        Args:
+            prices: The price of each paint can size, in liters.
+
+        Raises:
+            ValueError: If the catalog does not have exactly one price for
+                each paint can size or any price is not positive.
+        """
+        default_catalog = cls._default_catalog
+        if set(prices) == set(default_catalog.sizes) and (
+            default_catalog.prices
+            == tuple((size, prices[size]) for size in default_catalog.sizes)
+        ):
+            return
+
+        cls._default_catalog = default_catalog.with_prices(
+            prices, ApiConfig.EXACT_ALLOCATION_MAX_AREA
+        )
+
     @property
     def room_free_area(self) -> float:
         """
         Calculates the total area of the room that is free from any doors or windows.
+        It is taken from `Room.geometry`, computed once when the room is validated.
 
         Returns:
             float: The total area of the room that is free from any doors or windows.
@@ -75,9 +207,7 @@ class PaintCansCalculator(PaintCansInterface):
 
         """
         try:
-            valid_room_free_area = self._room.walls_area - (
-                self._room.windows_area + self._room.doors_area
-            )
+            valid_room_free_area = self._room.geometry.free_area
         except Exception:
             raise
 
@@ -89,7 +219,8 @@ class PaintCansCalculator(PaintCansInterface):
     )
     def calculate_paint_cans_needed(self) -> PaintCans:
         """
-        Calculates the amount of paint cans needed to paint a room, giving preference
+        Calculates the amount of paint cans needed to paint a room, with the
+        allocation strategy of the instance. The GREEDY strategy gives preference
         to the largest possible cans. Ensures that there is no area without paint
         coverage by adding an extra can of the smallest size if necessary.
 
@@ -114,34 +245,118 @@ class PaintCansCalculator(PaintCansInterface):
 
         """
 
-        room_free_area = self.room_free_area
-        paint_cans_needed = {}
-
         try:
-            for size in PaintCansCalculator._PAINT_CAN_SIZES_IN_LITERS[::-1]:
-                paint_cans_needed[size] = int(
-                    room_free_area
-                    / PaintCansCalculator._PAINT_COVERAGE_PER_M2
-                    / size
-                )
-
-                room_free_area -= (
-                    paint_cans_needed[size]
-                    * PaintCansCalculator._PAINT_COVERAGE_PER_M2
-                    * size
-                )
-
-            if room_free_area > 0:
-                extra_can = 1
-                paint_cans_needed[
-                    min(PaintCansCalculator._PAINT_CAN_SIZES_IN_LITERS)
-                ] += extra_can
-
+            paint_cans_needed = self.paint_cans_for_free_area(
+                self.room_free_area, self._allocation, self._catalog
+            )
         except Exception:
             raise
 
         return paint_cans_needed
 
+    @classmethod
+    def paint_cans_for_free_area(
+        cls,
+        free_area: float,
+        allocation: AllocationStrategy | str = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> PaintCans:
+        """
+        Calculates the amount of paint cans needed to paint a free area.
+
+        The GREEDY strategy gives preference to the largest possible cans
+        and adds an extra can of the smallest size if any area is left
+        without coverage. The EXACT strategy looks up the cans that leave the
+        least paint over and, among those, the fewest cans. The CHEAPEST
+        strategy looks up the cheapest cans at the prices of the catalog.
+
+        Args:
+            free_area (float): The area to be painted, in square meters.
+            allocation (AllocationStrategy): The strategy to choose the paint
+                cans, `ApiConfig.PAINT_CANS_ALLOCATION` when not given.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
+
+        Returns:
+            A dictionary containing the amount of paint cans needed for each size of
+            paint can.
+
+        Raises:
+            ValueError: If the allocation is not an AllocationStrategy value.
+            UnavailableAllocationError: If the catalog has no data for the
+                allocation strategy.
+        """
+        return cls.paint_can_catalog(catalog).paint_cans(
+            free_area, cls.allocation_strategy(allocation)
+        )
+
+    @classmethod
+    def calculate_many(
+        cls,
+        free_areas: np.ndarray,
+        allocation: AllocationStrategy | str = None,
+        catalog: CompiledPaintCanCatalog = None,
+    ) -> np.ndarray:
+        """
+        Calculates the amount of paint cans needed to paint each one of many
+        free areas at once, with the same rules of
+        `calculate_paint_cans_needed()`.
+
+        With the GREEDY strategy, the remaining area is updated with the
+        same floating point operations, in the same order, as the scalar
+        path, so each row is bit-identical to the dictionary it returns for
+        the same free area. The EXACT and CHEAPEST strategies look up the
+        rows in the tables of the catalog.
+
+        Args:
+            free_areas (np.ndarray): The free area, in square meters, of each
+                room.
+            allocation (AllocationStrategy): The strategy to choose the paint
+                cans, `ApiConfig.PAINT_CANS_ALLOCATION` when not given.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
+
+        Returns:
+            np.ndarray: An integer matrix with one row per free area and one
+            column per paint can size, ordered from the largest to the
+            smallest size of the catalog.
+
+        Raises:
+            ValueError: If the allocation is not an AllocationStrategy value.
+            UnavailableAllocationError: If the catalog has no data for the
+                allocation strategy.
+
+        Example:
+        >>> PaintCansCalculator.calculate_many(np.array([125.84, 10.0]))
+        array([[1, 1, 1, 3],
+               [0, 0, 0, 4]])
+        >>> PaintCansCalculator.calculate_many(np.array([125.84]), "exact")
+        array([[1, 2, 0, 0]])
+        """
+        return cls.paint_can_catalog(catalog).counts_many(
+            free_areas, cls.allocation_strategy(allocation)
+        )
+
+    @classmethod
+    def paint_cans_from_counts(
+        cls, counts: np.ndarray, catalog: CompiledPaintCanCatalog = None
+    ) -> PaintCans:
+        """
+        Builds the paint cans dictionary returned by
+        `calculate_paint_cans_needed()` from a row of `calculate_many()`.
+
+        Args:
+            counts (np.ndarray): The amount of paint cans of each size,
+                ordered from the largest to the smallest size.
+            catalog (CompiledPaintCanCatalog): The catalog of the paint cans,
+                the built-in one when not given.
+
+        Returns:
+            A dictionary containing the amount of paint cans needed for each
+            size of paint can.
+        """
+        return cls.paint_can_catalog(catalog).paint_cans_from_counts(counts)
+
     def __str__(self) -> str:
         """
         Returns a human-readable string representation of this PaintCansCalculator object.
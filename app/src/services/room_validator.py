@@ -1,9 +1,14 @@
-from itertools import product
-from typing import Callable, Iterator, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from config import ApiConfig
 from src.extensions.logger import log_exceptions
+from src.extensions.metrics import register_metrics
+from src.extensions.result_cache import ResultCache
+from src.schemas.door import DEFAULT_DOOR
 from src.schemas.request.room import Room
+from src.schemas.room_geometry import WallGeometry
 from src.schemas.wall import Wall
+from src.schemas.window import DEFAULT_WINDOW
 from src.services.exception import (
     InsufficientWallFreeAreaError,
     InvalidRoomDimensionError,
@@ -12,6 +17,11 @@ from src.services.exception import (
     WallNotTallerThanWindowError,
     WallNotWiderThanDoorWindowError,
 )
+from src.services.validation_result import (
+    RoomValidationResult,
+    WallRule,
+    WallValidation,
+)
 
 from .interfaces.geometric_validator_interface import (
     GeometricValidatorInterface,
@@ -39,14 +49,29 @@ class RoomValidator(GeometricValidatorInterface):
         _MIN_WALL_FREE_AREA_RATE (float): The minimum allowable ratio of free wall area to total wall area.
         _MIN_DIFFERENCE_WALL_HEIGHT_TALLER_THAN_DOOR_METER (float): The minimum allowable difference between wall free area
             and door + window area
+        _WALL_RULES (tuple): The code of each rule and the name of the method that checks it.
+        _walls_validations (ResultCache): The bounded memo of the WallValidation of each wall.
 
     Attributes:
         room (Room): The room to be validated.
 
     Methods:
-        _validate_dimensions_looper() -> Iterator[Tuple[int, Wall, Callable, Tuple]]:
-            Creates a generator to assistant the validate_dimensions() iterating each
-            function validator
+        collect_failures(result: RoomValidationResult | None) -> RoomValidationResult:
+            Checks every rule for every wall and stores the failures in a
+            preallocated result, without raising exceptions.
+
+        wall_validation(wall: Wall) -> WallValidation:
+            Checks every rule for a single wall, once per wall dimensions.
+
+        rules_key() -> Tuple:
+            Returns the values of the rules, which change with them.
+
+        format_invalid_dimensions_values(result: RoomValidationResult) -> Dict[str, List[str]]:
+            Builds the dictionary of error messages of each wall from a result.
+
+        format_walls_validations(walls_validations) -> Dict[str, List[str]]:
+            Builds the dictionary of error messages of each wall from the
+            validations of the walls.
 
         validate_dimensions() -> Dict[str, str]:
             Validates the dimensions of the room by checking the wall area range,
@@ -79,6 +104,40 @@ class RoomValidator(GeometricValidatorInterface):
     _MIN_WALL_FREE_AREA_RATE = 0.5
     _MIN_DIFFERENCE_WALL_HEIGHT_TALLER_THAN_DOOR_METER = 0.3
 
+    _WALL_RULES = (
+        (WallRule.AREA_OUT_OF_RANGE, "_wall_area_failure"),
+        (WallRule.INSUFFICIENT_FREE_AREA, "_wall_free_area_failure"),
+        (WallRule.NOT_TALLER_THAN_DOOR, "_wall_taller_than_door_failure"),
+        (WallRule.NOT_TALLER_THAN_WINDOW, "_wall_taller_than_window_failure"),
+        (
+            WallRule.NOT_WIDER_THAN_DOORS_WINDOWS,
+            "_wall_wider_than_openings_failure",
+        ),
+    )
+
+    _walls_validations = ResultCache(max_size=ApiConfig.WALL_CACHE_SIZE)
+
+    _FAILURE_MESSAGES = {
+        WallRule.AREA_OUT_OF_RANGE: (
+            "The wall area, {0:.2f}m2, is out of range between {1}m2 and"
+            " {2}m2."
+        ),
+        WallRule.INSUFFICIENT_FREE_AREA: (
+            "The wall free area, {0:.2f}m2, must be >= of the total area of"
+            " windows + doors, {1:.2f}m2."
+        ),
+        WallRule.NOT_TALLER_THAN_DOOR: (
+            "Wall is {0:.2f}m shorter than the door."
+        ),
+        WallRule.NOT_TALLER_THAN_WINDOW: (
+            "Wall is {0:.2f}m shorter than the window."
+        ),
+        WallRule.NOT_WIDER_THAN_DOORS_WINDOWS: (
+            "Wall is {0:.2f}m narrower than the width of amount of window(s)"
+            " + doors."
+        ),
+    }
+
     def __init__(self, room: Room) -> None:
         """
         Initializes a new instance of the RoomValidator class.
@@ -110,6 +169,9 @@ class RoomValidator(GeometricValidatorInterface):
         - wall_taller_than_window
         - wall_wider_than_amount_doors_windows
 
+        The rules are checked by `collect_failures()`, this method only turns
+        the failures found into an `InvalidRoomDimensionError`.
+
         Returns:
             If all validations pass, returns True. Otherwise, returns a dictionary containing details of the failed
             validations. The dictionary has the following format:
@@ -124,25 +186,11 @@ class RoomValidator(GeometricValidatorInterface):
             InvalidRoomDimensionError: If any of the validation methods fail.
         """
         try:
-            invalid_dimensions_values = {}
-            for item in self._validate_dimensions_looper():
-                try:
-                    index, wall, method, args = [*item]
-                    method(wall, *args)
-
-                except (
-                    WallAreaOutOfRangeError,
-                    InsufficientWallFreeAreaError,
-                    WallNotTallerThanDoorError,
-                    WallNotTallerThanWindowError,
-                    WallNotWiderThanDoorWindowError,
-                ) as error:
-                    invalid_dimensions_values.setdefault(
-                        f"Wall_{index+1}", []
-                    ).append(error.args[0])
-
-            if invalid_dimensions_values:
-                raise InvalidRoomDimensionError(invalid_dimensions_values)
+            result = self.collect_failures()
+            if not result.is_valid:
+                raise InvalidRoomDimensionError(
+                    self.format_invalid_dimensions_values(result)
+                )
         except InvalidRoomDimensionError:
             raise
         except Exception:
@@ -151,39 +199,256 @@ class RoomValidator(GeometricValidatorInterface):
 
     @log_exceptions(
         msg="exception_paint_cans_calculator_service",
-        extra={"room_validator": "_validate_dimensions_looper"},
+        extra={"room_validator": "collect_failures"},
     )
-    def _validate_dimensions_looper(
-        self,
-    ) -> Iterator[Tuple[int, Wall, Callable, Tuple]]:
+    def collect_failures(
+        self, result: Optional[RoomValidationResult] = None
+    ) -> RoomValidationResult:
         """
-        This is a private method that loops through the validation methods and their
-        arguments and returns a generator that yields a tuple containing the index of
-        the wall being validated, the wall itself, the validation method to be used,
-        and the arguments to be passed to the validation method.
+        Checks every rule for every wall of the room and stores the failures
+        in a preallocated result. Unlike `validate_dimensions()`, no
+        exception is raised when the dimensions are invalid.
+
+        Args:
+            result (RoomValidationResult, optional): A result to be cleared
+                and reused. Must have capacity for the walls of the room.
+                Defaults to a new result.
 
         Returns:
-            An iterator that yields a tuple containing the index of the wall being
-            validated, the wall itself, the validation method to be used, and the
-            arguments to be passed to the validation method.
-        """
-        validation_methods = {
-            self.wall_area_within_given_area_range: (),
-            self.wall_free_area_to_paint: (),
-            self.wall_taller_than_door: (),
-            self.wall_taller_than_window: (),
-            self.wall_wider_than_amount_doors_windows: (),
-        }
+            RoomValidationResult: The failures found, empty when the
+            dimensions are consistent.
+
+        Example:
+            >>> validator = RoomValidator(room)
+            >>> validator.collect_failures().is_valid
+            True
+        """
+        walls = self._room.walls
+        if result is None:
+            result = RoomValidationResult(len(walls))
+        else:
+            result.clear()
+
         try:
-            for index_wall, method_args in product(
-                enumerate(self._room.walls), validation_methods.items()
+            for index, (wall, geometry) in enumerate(
+                zip(walls, self._room.geometry.walls)
             ):
-                index, wall = index_wall[0], index_wall[1]
-                method, args = method_args[0], method_args[1]
-
-                yield (index, wall, method, args)
+                for rule, params in self.wall_validation(
+                    wall, geometry
+                ).failures:
+                    result.add(index, rule, params)
         except Exception:
             raise
+        return result
+
+    @classmethod
+    def wall_validation(
+        cls, wall: Wall, geometry: Optional[WallGeometry] = None
+    ) -> WallValidation:
+        """
+        Checks every rule for a single wall. The outcome only depends on the
+        dimensions of the wall, so it is kept in a bounded memo keyed by
+        `Wall.canonical_key` and walls seen before skip the rules entirely.
+
+        Args:
+            wall (Wall): The wall to be checked.
+            geometry (WallGeometry, optional): The measures of the wall,
+                taken from `Room.geometry`. Computed from the wall when not
+                given.
+
+        Returns:
+            WallValidation: The failures of the wall and its areas.
+        """
+        wall_key = wall.canonical_key
+        validation = cls._walls_validations.get(wall_key)
+        if validation is None:
+            if geometry is None:
+                geometry = WallGeometry.from_wall(wall)
+
+            failures = []
+            for rule, check in cls._WALL_RULES:
+                params = getattr(cls, check)(wall, geometry)
+                if params is not None:
+                    failures.append((rule, params))
+
+            validation = WallValidation(
+                failures=tuple(failures),
+                area=geometry.area,
+                windows_area=geometry.windows_area,
+                doors_area=geometry.doors_area,
+            )
+            cls._walls_validations.put(wall_key, validation)
+        return validation
+
+    @classmethod
+    def rules_key(cls) -> Tuple:
+        """
+        Returns a key that changes with every value the rules depend on,
+        the limits, the error messages and the dimensions of the default
+        door and window, so the results of older rules are never mistaken
+        for the ones of the current rules.
+
+        Returns:
+            tuple: The values of the rules.
+        """
+        return (
+            cls._MIN_WALL_AREA,
+            cls._MAX_WALL_AREA,
+            cls._MIN_WALL_FREE_AREA_RATE,
+            cls._MIN_DIFFERENCE_WALL_HEIGHT_TALLER_THAN_DOOR_METER,
+            tuple(
+                (rule.value, cls._FAILURE_MESSAGES[rule])
+                for rule, _ in cls._WALL_RULES
+            ),
+            (DEFAULT_DOOR.width, DEFAULT_DOOR.height),
+            (DEFAULT_WINDOW.width, DEFAULT_WINDOW.height),
+        )
+
+    @classmethod
+    def format_failure(cls, rule: WallRule, params: Tuple) -> str:
+        """
+        Builds the error message of a failure of a rule.
+
+        Args:
+            rule (WallRule): The code of the failed rule.
+            params (tuple): The numeric params of the failure.
+
+        Returns:
+            str: The error message.
+        """
+        return cls._FAILURE_MESSAGES[rule].format(*params)
+
+    @classmethod
+    def format_invalid_dimensions_values(
+        cls, result: RoomValidationResult
+    ) -> Dict[str, List[str]]:
+        """
+        Builds the dictionary of error messages of each wall from the
+        failures of a result.
+
+        Args:
+            result (RoomValidationResult): The failures of a room.
+
+        Returns:
+            A dictionary with the following format:
+            {
+                "Wall_1": ["error_1", "error_2", ...],
+                ...
+                "Wall_n": ["error_1", "error_2", ...]
+            }
+        """
+        invalid_dimensions_values = {}
+        for index, rule, params in result:
+            invalid_dimensions_values.setdefault(f"Wall_{index+1}", []).append(
+                cls.format_failure(rule, params)
+            )
+        return invalid_dimensions_values
+
+    @classmethod
+    def format_walls_validations(
+        cls, walls_validations: Sequence[WallValidation]
+    ) -> Dict[str, List[str]]:
+        """
+        Builds the dictionary of error messages of each wall from the
+        validations of the walls of a room.
+
+        Args:
+            walls_validations: The WallValidation of each wall of the room.
+
+        Returns:
+            The same dictionary built by `format_invalid_dimensions_values()`,
+            empty when every wall is consistent.
+        """
+        return {
+            f"Wall_{index+1}": [
+                cls.format_failure(rule, params)
+                for rule, params in validation.failures
+            ]
+            for index, validation in enumerate(walls_validations)
+            if validation.failures
+        }
+
+    @staticmethod
+    def _wall_area_failure(
+        wall: Wall, geometry: WallGeometry
+    ) -> Optional[Tuple]:
+        """
+        Returns the params of the failure of the area range rule, or None if
+        the wall area is within the allowable range.
+        """
+        wall_area = geometry.area
+        if (
+            RoomValidator._MIN_WALL_AREA
+            <= wall_area
+            <= RoomValidator._MAX_WALL_AREA
+        ):
+            return None
+        return (
+            wall_area,
+            RoomValidator._MIN_WALL_AREA,
+            RoomValidator._MAX_WALL_AREA,
+        )
+
+    @staticmethod
+    def _wall_free_area_failure(
+        wall: Wall, geometry: WallGeometry
+    ) -> Optional[Tuple]:
+        """
+        Returns the params of the failure of the free area rule, or None if
+        the wall has enough free area to paint.
+        """
+        if not (wall.number_windows or wall.number_doors):
+            return None
+        min_wall_area = geometry.area * RoomValidator._MIN_WALL_FREE_AREA_RATE
+        total_area_doors_windows = geometry.openings_area
+        if min_wall_area >= total_area_doors_windows:
+            return None
+        return (min_wall_area, total_area_doors_windows)
+
+    @staticmethod
+    def _wall_taller_than_door_failure(
+        wall: Wall, geometry: WallGeometry
+    ) -> Optional[Tuple]:
+        """
+        Returns the params of the failure of the door height rule, or None
+        if the wall is taller enough than the door.
+        """
+        if not wall.number_doors:
+            return None
+        min_wall_height = (
+            wall.door.height
+            + RoomValidator._MIN_DIFFERENCE_WALL_HEIGHT_TALLER_THAN_DOOR_METER
+        )
+        if wall.height >= min_wall_height:
+            return None
+        return (min_wall_height - wall.height,)
+
+    @staticmethod
+    def _wall_taller_than_window_failure(
+        wall: Wall, geometry: WallGeometry
+    ) -> Optional[Tuple]:
+        """
+        Returns the params of the failure of the window height rule, or None
+        if the wall is taller than the window.
+        """
+        if not wall.number_windows or wall.height >= wall.window.height:
+            return None
+        return (wall.window.height - wall.height,)
+
+    @staticmethod
+    def _wall_wider_than_openings_failure(
+        wall: Wall, geometry: WallGeometry
+    ) -> Optional[Tuple]:
+        """
+        Returns the params of the failure of the openings width rule, or
+        None if the wall is wider than its doors and windows.
+        """
+        if not (wall.number_windows or wall.number_doors):
+            return None
+        total_door_window_width = geometry.openings_width
+        if wall.width >= total_door_window_width:
+            return None
+        return (total_door_window_width - wall.width,)
 
     @log_exceptions(
         msg="exception_paint_cans_calculator_service",
@@ -209,22 +474,18 @@ class RoomValidator(GeometricValidatorInterface):
         True
         """
         try:
-            wall_area_in_valid_range = (
-                RoomValidator._MIN_WALL_AREA
-                <= wall.area
-                <= RoomValidator._MAX_WALL_AREA
+            failure = RoomValidator._wall_area_failure(
+                wall, WallGeometry.from_wall(wall)
             )
-            if not wall_area_in_valid_range:
+            if failure is not None:
                 raise WallAreaOutOfRangeError(
-                    f"The wall area, {wall.area:.2f}m2, is out of "
-                    f"range between {RoomValidator._MIN_WALL_AREA}m2 "
-                    f"and {RoomValidator._MAX_WALL_AREA}m2."
+                    self.format_failure(WallRule.AREA_OUT_OF_RANGE, failure)
                 )
         except WallAreaOutOfRangeError:
             raise
         except Exception:
             raise
-        return wall_area_in_valid_range
+        return True
 
     @log_exceptions(
         msg="exception_paint_cans_calculator_service",
@@ -251,24 +512,20 @@ class RoomValidator(GeometricValidatorInterface):
         assert validator.wall_free_area_to_paint(wall, window, door) is True
         """
         try:
-            if wall.number_windows or wall.number_doors:
-                min_wall_area = wall.area * self._MIN_WALL_FREE_AREA_RATE
-                total_area_doors_windows = wall.windows_area + wall.doors_area
-                validate_result = min_wall_area >= total_area_doors_windows
-
-                if not validate_result:
-                    raise InsufficientWallFreeAreaError(
-                        f"The wall free area,"
-                        f" {min_wall_area:.2f}"
-                        f"m2, must be >= of the total area of"
-                        f" windows + doors, {total_area_doors_windows:.2f}m2."
+            failure = RoomValidator._wall_free_area_failure(
+                wall, WallGeometry.from_wall(wall)
+            )
+            if failure is not None:
+                raise InsufficientWallFreeAreaError(
+                    self.format_failure(
+                        WallRule.INSUFFICIENT_FREE_AREA, failure
                     )
-            validate_result = True
+                )
         except InsufficientWallFreeAreaError:
             raise
         except Exception:
             raise
-        return validate_result
+        return True
 
     @log_exceptions(
         msg="exception_paint_cans_calculator_service",
@@ -299,26 +556,18 @@ class RoomValidator(GeometricValidatorInterface):
         """
 
         try:
-            if wall.number_doors:
-                min_wall_height = (
-                    wall.door.height
-                    + RoomValidator._MIN_DIFFERENCE_WALL_HEIGHT_TALLER_THAN_DOOR_METER
+            failure = RoomValidator._wall_taller_than_door_failure(
+                wall, WallGeometry.from_wall(wall)
+            )
+            if failure is not None:
+                raise WallNotTallerThanDoorError(
+                    self.format_failure(WallRule.NOT_TALLER_THAN_DOOR, failure)
                 )
-                validate_result = wall.height >= min_wall_height
-
-                if not validate_result:
-                    difference_height_door_wall = min_wall_height - wall.height
-                    raise WallNotTallerThanDoorError(
-                        f"Wall is "
-                        f"{difference_height_door_wall:.2f}"
-                        f"m shorter than the door."
-                    )
-            validate_result = True
         except WallNotTallerThanDoorError:
             raise
         except Exception:
             raise
-        return validate_result
+        return True
 
     @log_exceptions(
         msg="exception_paint_cans_calculator_service",
@@ -348,23 +597,20 @@ class RoomValidator(GeometricValidatorInterface):
         "Wall is 1.00m shorter than the window."
         """
         try:
-            if wall.number_windows:
-                validate_result = wall.height >= wall.window.height
-
-                if not validate_result:
-                    difference_height_window_wall = (
-                        wall.window.height - wall.height
-                    )
-                    raise WallNotTallerThanWindowError(
-                        f"Wall is {difference_height_window_wall:.2f}m"
-                        f" shorter than the window."
+            failure = RoomValidator._wall_taller_than_window_failure(
+                wall, WallGeometry.from_wall(wall)
+            )
+            if failure is not None:
+                raise WallNotTallerThanWindowError(
+                    self.format_failure(
+                        WallRule.NOT_TALLER_THAN_WINDOW, failure
                     )
-            validate_result = True
+                )
         except WallNotTallerThanWindowError:
             raise
         except Exception:
             raise
-        return validate_result
+        return True
 
     @log_exceptions(
         msg="exception_paint_cans_calculator_service",
@@ -391,25 +637,20 @@ class RoomValidator(GeometricValidatorInterface):
             True
         """
         try:
-            if wall.number_windows or wall.number_doors:
-                total_window_width = wall.number_windows * wall.window.width
-                total_door_width = wall.number_doors * wall.door.width
-
-                total_door_window_width = total_window_width + total_door_width
-                validate_result = wall.width >= total_door_window_width
-
-                if not validate_result:
-                    raise WallNotWiderThanDoorWindowError(
-                        f"Wall is {(total_door_window_width - wall.width):.2f}m"
-                        f" narrower than the width of amount of window(s) + doors."
+            failure = RoomValidator._wall_wider_than_openings_failure(
+                wall, WallGeometry.from_wall(wall)
+            )
+            if failure is not None:
+                raise WallNotWiderThanDoorWindowError(
+                    self.format_failure(
+                        WallRule.NOT_WIDER_THAN_DOORS_WINDOWS, failure
                     )
-
-            validate_result = True
+                )
         except WallNotWiderThanDoorWindowError:
             raise
         except Exception:
             raise
-        return validate_result
+        return True
 
     def __str__(self) -> str:
         """
@@ -439,3 +680,8 @@ class RoomValidator(GeometricValidatorInterface):
             f"windows area= {self._room.windows_area:.2f} m²,"
             f"doors area= {self._room.doors_area:.2f} m²,"
         )
+
+
+register_metrics(
+    "wall_validation_cache", RoomValidator._walls_validations.stats
+)
@@ -0,0 +1,132 @@
+from enum import IntEnum
+from typing import Iterator, NamedTuple, Tuple
+
+
+class WallRule(IntEnum):
+    """
+    Codes of the rules a wall must satisfy to have consistent dimensions,
+    in the same order they are checked by `RoomValidator`.
+    """
+
+    AREA_OUT_OF_RANGE = 0
+    INSUFFICIENT_FREE_AREA = 1
+    NOT_TALLER_THAN_DOOR = 2
+    NOT_TALLER_THAN_WINDOW = 3
+    NOT_WIDER_THAN_DOORS_WINDOWS = 4
+
+
+class WallValidation(NamedTuple):
+    """
+    The outcome of checking every rule for a single wall, and the areas the
+    wall contributes to its room. It only depends on the dimensions of the
+    wall, so it is shared by every wall with the same dimensions.
+
+    Attributes:
+        failures: The code and numeric params of each rule failed by the
+            wall, in the order of `WallRule`.
+        area: The area of the wall.
+        windows_area: The area of the windows of the wall.
+        doors_area: The area of the doors of the wall.
+    """
+
+    failures: Tuple[Tuple[WallRule, Tuple], ...]
+    area: float
+    windows_area: float
+    doors_area: float
+
+
+class RoomValidationResult:
+    """
+    A preallocated accumulator of the rules failed by the walls of a room.
+
+    Each failure is stored as the index of the wall, the code of the rule
+    and the numeric params needed to describe it, so no exception or
+    message is built while the rules are checked. The slots are allocated
+    once, for the case where every wall fails every rule, and can be reused
+    after `clear()`.
+
+    Attributes:
+        _walls (list): The index of the wall of each failure.
+        _rules (list): The code of the rule of each failure.
+        _params (list): The numeric params of each failure.
+        _size (int): The number of failures stored.
+
+    Methods:
+        add(wall_index, rule, params): Stores a failure.
+        clear(): Forgets all failures, keeping the allocated slots.
+        is_valid: True if no failure was stored.
+
+    Raises:
+        ValueError: If the number of walls is negative.
+    """
+
+    __slots__ = ("_walls", "_rules", "_params", "_size")
+
+    def __init__(self, number_walls: int) -> None:
+        """
+        Initializes a new instance of the RoomValidationResult class.
+
+        Args:
+            number_walls: The number of walls of the room, used to allocate
+                one slot for each wall and rule.
+
+        Raises:
+            ValueError: If the number of walls is negative.
+        """
+        if number_walls < 0:
+            raise ValueError("The number of walls must not be negative.")
+
+        capacity = number_walls * len(WallRule)
+        self._walls = [0] * capacity
+        self._rules = [WallRule.AREA_OUT_OF_RANGE] * capacity
+        self._params = [()] * capacity
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._walls)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self._size
+
+    def add(self, wall_index: int, rule: WallRule, params: Tuple) -> None:
+        """
+        Stores a failure of a rule by a wall.
+
+        Args:
+            wall_index: The index of the wall in the room, starting at 0.
+            rule: The code of the failed rule.
+            params: The numeric params describing the failure.
+
+        Raises:
+            IndexError: If all slots are already in use.
+        """
+        size = self._size
+        self._walls[size] = wall_index
+        self._rules[size] = rule
+        self._params[size] = params
+        self._size = size + 1
+
+    def clear(self) -> None:
+        """
+        Forgets all failures stored, keeping the allocated slots.
+        """
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[int, WallRule, Tuple]]:
+        """
+        Iterates over the failures stored, in the order they were added.
+
+        Yields:
+            A tuple with the index of the wall, the code of the rule and the
+            numeric params of each failure.
+        """
+        for index in range(self._size):
+            yield self._walls[index], self._rules[index], self._params[index]
+
+    def __repr__(self) -> str:
+        return f"RoomValidationResult(failures= {list(self)})"
@@ -261,11 +261,64 @@ def json_response_expected_fail_to_process_dimensions3():
     return {
         "detail": [
             {
-                "loc": ["body", "walls"],
-                "msg": "wrong tuple length 3, expected 4",
-                "type": "value_error.tuple.length",
-                "ctx": {"actual_length": 3, "expected_length": 4},
-            }
+                "loc": ["body", "walls", 0, "width"],
+                "msg": "ensure this value is greater than 0",
+                "type": "value_error.number.not_gt",
+                "ctx": {"limit_value": 0},
+            },
+            {
+                "loc": ["body", "walls", 0, "height"],
+                "msg": "ensure this value is greater than 0",
+                "type": "value_error.number.not_gt",
+                "ctx": {"limit_value": 0},
+            },
+            {
+                "loc": ["body", "walls", 0, "number_doors"],
+                "msg": "value is not a valid integer",
+                "type": "type_error.integer",
+            },
+            {
+                "loc": ["body", "walls", 0, "number_windows"],
+                "msg": "value is not a valid integer",
+                "type": "type_error.integer",
+            },
+            {
+                "loc": ["body", "walls", 1, "width"],
+                "msg": "value is not a valid float",
+                "type": "type_error.float",
+            },
+        ]
+    }
+
+
+# BATCH SUBSESSION
+@pytest.fixture(scope="function")
+def valid_request_payload_rooms_batch(
+    valid_request_payload_walls_dimensions,
+    invalid_request_payload_walls_dimensions,
+):
+    return {
+        "rooms": [
+            valid_request_payload_walls_dimensions,
+            invalid_request_payload_walls_dimensions,
+            valid_request_payload_walls_dimensions,
+        ]
+    }
+
+
+@pytest.fixture(scope="function")
+def json_response_successful_rooms_batch(
+    json_response_successful, json_response_expected_fail_to_process_dimensions
+):
+    return {
+        "results": [
+            json_response_successful,
+            {
+                "errors": json_response_expected_fail_to_process_dimensions[0][
+                    "ctx"
+                ]["walls"]
+            },
+            json_response_successful,
         ]
     }
 
@@ -0,0 +1,87 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from config import ApiConfig
+from src.api.resources.paint_cans_calculator.room_analyzer_paint_cans import (
+    register_post_paint_cans_needed_view,
+)
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.fast_json import FastJSONRoute
+from src.extensions.result_cache import ResultCache
+from src.services.paint_can_catalog import PaintCanCatalogRegistry
+
+PATH = "/api/v1/paint_mall/paint_cans_needed"
+
+
+def build_api(fast_json: bool) -> FastAPI:
+    api = FastAPI()
+    api.state.paint_cans_pipeline = PaintCansPipeline(
+        results_cache=ResultCache(max_size=ApiConfig.RESULT_CACHE_SIZE)
+    )
+    api.state.paint_cans_micro_batcher = None
+    api.state.paint_can_catalogs = PaintCanCatalogRegistry(
+        path=None, max_area=ApiConfig.EXACT_ALLOCATION_MAX_AREA
+    )
+    with patch.object(ApiConfig, "FAST_JSON", fast_json):
+        router = APIRouter(prefix="/api/v1", route_class=FastJSONRoute)
+        register_post_paint_cans_needed_view(router)
+        api.include_router(router)
+    return api
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"walls": [{"width": 7, "height": 5, "number_doors": 1}] * 4},
+        {"walls": [{"width": 7.5, "height": 2.5, "number_windows": 1}] * 4},
+        {"walls": [{"width": 0.1, "height": 0.1, "number_doors": 3}] * 4},
+        {"walls": [{"width": "7", "height": 5, "number_doors": "1"}] * 4},
+        {"walls": [{"width": -7, "height": 5}] * 4},
+        {"walls": [{"width": 7, "height": 5}] * 3},
+        {"walls": [{"width": 7, "height": 5, "number_doors": 1}] * 300},
+        {"walls": [{"width": 0.1, "height": 0.1, "number_doors": 3}] * 300},
+        {"walls": []},
+        {
+            "walls": [{"width": 7, "height": 5}]
+            * (ApiConfig.ROOM_MAX_WALLS + 1)
+        },
+        {"walls": [{"width": 7, "height": 5, "color": "red"}] * 4},
+        {"walls": [{"width": True, "height": 5}] * 4},
+    ],
+)
+def test_fast_json_same_responses_of_pydantic_path(body):
+    """
+    Tests if the fast JSON path returns the same status and bytes returned
+    by the Pydantic path, for valid, inconsistent and invalid rooms.
+    """
+    content = json.dumps(body)
+    with TestClient(build_api(fast_json=True)) as client:
+        fast_response = client.post(PATH, content=content)
+    with TestClient(build_api(fast_json=False)) as client:
+        pydantic_response = client.post(PATH, content=content)
+
+    assert fast_response.status_code == pydantic_response.status_code
+    assert fast_response.content == pydantic_response.content
+    assert fast_response.headers["content-type"] == (
+        pydantic_response.headers["content-type"]
+    )
+
+
+def test_fast_json_skips_pydantic_parsing():
+    """
+    Tests if a valid room decoded by the fast JSON path is not validated by
+    Pydantic.
+    """
+    body = {"walls": [{"width": 7, "height": 5, "number_doors": 1}] * 4}
+
+    with TestClient(build_api(fast_json=True)) as client, patch(
+        "src.schemas.request.room.Room.validate",
+        side_effect=AssertionError("validated by Pydantic"),
+    ):
+        response = client.post(PATH, json=body)
+
+    assert response.status_code == 200
@@ -0,0 +1,18 @@
+from fastapi.testclient import TestClient
+
+from src.api.factory import create_api
+
+
+def test_get_metrics_reports_logging_queue():
+    """
+    Tests if the metrics endpoint reports the records dropped and queued by
+    the logging pipeline.
+    """
+    with TestClient(create_api()) as client:
+        response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert set(response.json()["logging"]) == {
+        "dropped_records",
+        "queued_records",
+    }
@@ -0,0 +1,131 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from config import ApiConfig
+from src.api import create_api
+from src.api.resources.paint_cans_calculator.etags import (
+    paint_cans_needed_etag,
+)
+
+PATH = "/api/v1/paint_mall/paint_cans_needed"
+
+CATALOGS = {
+    "catalogs": {
+        "eu": {
+            "coverage_per_m2": 8,
+            "cans": [
+                {"size": 0.75, "price": 9.5},
+                {"size": 2.5, "price": 24},
+                {"size": 10, "price": 80},
+            ],
+        },
+        "basic": {"coverage_per_m2": 5, "cans": [{"size": 1}, {"size": 5}]},
+    }
+}
+
+
+@pytest.fixture(scope="function")
+def catalogs_client(tmp_path):
+    path = tmp_path / "catalogs.json"
+    path.write_text(json.dumps(CATALOGS))
+    with patch.object(ApiConfig, "PAINT_CAN_CATALOGS_FILE", str(path)):
+        api = create_api()
+    with TestClient(api) as client:
+        yield client
+
+
+def test_select_catalog(
+    catalogs_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the paint cans are sold by the catalog selected, single and in
+    batches, and by the built-in catalog by default.
+    """
+    default = catalogs_client.post(
+        PATH, json=valid_request_payload_walls_dimensions
+    )
+    eu = catalogs_client.post(
+        PATH,
+        params={"catalog": "eu"},
+        json=valid_request_payload_walls_dimensions,
+    )
+    eu_batch = catalogs_client.post(
+        f"{PATH}/batch",
+        params={"catalog": "eu"},
+        json={"rooms": [valid_request_payload_walls_dimensions]},
+    )
+
+    assert default.status_code == eu.status_code == 200
+    assert set(default.json()["paint_cans"]) == {"18.0", "3.6", "2.5", "0.5"}
+    assert set(eu.json()["paint_cans"]) == {"10.0", "2.5", "0.75"}
+    assert eu_batch.json()["results"] == [eu.json()]
+
+
+def test_unknown_catalog(
+    catalogs_client, valid_request_payload_walls_dimensions
+):
+    response = catalogs_client.post(
+        PATH,
+        params={"catalog": "br"},
+        json=valid_request_payload_walls_dimensions,
+    )
+
+    assert response.status_code == 404
+    assert response.json() == {
+        "detail": "The paint can catalog 'br' was not found."
+    }
+
+
+def test_cheapest_allocation_without_prices(
+    catalogs_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the cheapest allocation of a catalog without prices is an
+    unprocessable entity.
+    """
+    response = catalogs_client.post(
+        PATH,
+        params={"catalog": "basic", "allocation": "cheapest"},
+        json=valid_request_payload_walls_dimensions,
+    )
+
+    assert response.status_code == 422
+    assert "basic" in response.json()["detail"]
+
+
+def test_cheapest_allocation_without_prices_with_etag(
+    catalogs_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if an allocation the catalog can not serve is an unprocessable
+    entity even when the If-None-Match lists the ETag of its request.
+    """
+    params = {"catalog": "basic", "allocation": "cheapest"}
+    request = SimpleNamespace(query_params=params, app=catalogs_client.app)
+    etag, known = paint_cans_needed_etag(
+        request, json.dumps(valid_request_payload_walls_dimensions).encode()
+    )
+
+    response = catalogs_client.post(
+        PATH,
+        params=params,
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": etag},
+    )
+
+    assert not known
+    assert response.status_code == 422
+    assert "etag" not in response.headers
+
+
+def test_catalog_metrics(catalogs_client):
+    response = catalogs_client.get("/api/v1/metrics")
+
+    assert response.json()["paint_can_catalogs"]["catalogs"] == [
+        "basic",
+        "eu",
+    ]
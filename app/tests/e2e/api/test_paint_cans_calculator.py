@@ -1,3 +1,15 @@
+from unittest.mock import patch
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.testclient import TestClient
+
+from config import ApiConfig
+from src.api import create_api
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.schemas.wall import Wall
+from src.services.room_validator import RoomValidator
+
+
 def test_expected_sucess_response_paint_cans_calculator(
     api_client,
     valid_request_payload_walls_dimensions,
@@ -56,3 +68,290 @@ def test_expected_unprocessable_entity_response_paint_cans_calculator3(
     assert (
         response.json() == json_response_expected_fail_to_process_dimensions3
     )
+
+
+def test_exact_allocation_paint_cans_calculator(
+    api_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the exact allocation is selected by the query param, and the
+    greedy allocation is still returned without it.
+    """
+    greedy = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=valid_request_payload_walls_dimensions,
+    )
+    exact = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        params={"allocation": "exact"},
+        json=valid_request_payload_walls_dimensions,
+    )
+
+    assert exact.status_code == 200
+    assert greedy.json() != exact.json()
+    assert sum(
+        float(size) * cans for size, cans in exact.json()["paint_cans"].items()
+    ) <= sum(
+        float(size) * cans
+        for size, cans in greedy.json()["paint_cans"].items()
+    )
+
+
+def test_invalid_allocation_paint_cans_calculator(
+    api_client, valid_request_payload_walls_dimensions
+):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        params={"allocation": "largest"},
+        json=valid_request_payload_walls_dimensions,
+    )
+
+    assert response.status_code == 422
+
+
+def test_cheapest_allocation_paint_cans_calculator_batch(
+    api_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the cheapest allocation of a batch room is the same of the
+    single room endpoint.
+    """
+    single = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        params={"allocation": "cheapest"},
+        json=valid_request_payload_walls_dimensions,
+    )
+    batch = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed/batch",
+        params={"allocation": "cheapest"},
+        json={"rooms": [valid_request_payload_walls_dimensions]},
+    )
+
+    assert single.status_code == batch.status_code == 200
+    assert batch.json()["results"] == [single.json()]
+
+
+def test_expected_sucess_response_micro_batched(
+    valid_request_payload_walls_dimensions,
+    json_response_successful,
+):
+    """
+    Tests if the single room endpoint returns the same response with the
+    micro-batcher enabled, and reports its metrics.
+    """
+    with patch.object(ApiConfig, "MICRO_BATCH_WINDOW", 0.001):
+        api = create_api()
+
+    with TestClient(api) as client:
+        response = client.post(
+            "/api/v1/paint_mall/paint_cans_needed",
+            json=valid_request_payload_walls_dimensions,
+        )
+        metrics = client.get("/api/v1/metrics").json()
+
+    assert response.status_code == 200
+    assert response.json() == json_response_successful
+    assert metrics["paint_cans_micro_batcher"]["requests"] == 1
+
+
+def test_conditional_request_paint_cans_calculator(
+    api_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the response to a conditional request has a strong ETag, a
+    request with the same room and a matching If-None-Match gets a
+    body-less 304 without building the walls, validating or calculating the
+    room, and an unconditional request gets no ETag.
+    """
+    unconditional = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=valid_request_payload_walls_dimensions,
+    )
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": '"other"'},
+    )
+    etag = response.headers["etag"]
+
+    assert unconditional.status_code == 200
+    assert "etag" not in unconditional.headers
+
+    assert response.status_code == 200
+    assert etag.startswith('"') and etag.endswith('"')
+    assert response.headers["cache-control"] == ApiConfig.ETAG_CACHE_CONTROL
+
+    with patch.object(Wall, "construct") as construct, patch.object(
+        RoomValidator, "wall_validation"
+    ) as wall_validation, patch.object(
+        PaintCansPipeline, "calculate"
+    ) as calculate:
+        not_modified = api_client.post(
+            "/api/v1/paint_mall/paint_cans_needed",
+            json=valid_request_payload_walls_dimensions,
+            headers={"if-none-match": f'"other", W/{etag}'},
+        )
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert not construct.called and not wall_validation.called
+    assert not calculate.called
+
+    modified = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": '"other"'},
+    )
+    assert modified.status_code == 200
+    assert modified.headers["etag"] == etag
+
+
+def test_etag_changes_with_room_and_allocation_paint_cans_calculator(
+    api_client,
+    valid_request_payload_walls_dimensions,
+    invalid_request_payload_walls_dimensions,
+):
+    """
+    Tests if the ETag changes with the room and the allocation, and error
+    responses have no ETag.
+    """
+    url = "/api/v1/paint_mall/paint_cans_needed"
+    room = valid_request_payload_walls_dimensions
+    other_room = {
+        "walls": [{**room["walls"][0], "width": 6.0}, *room["walls"][1:]]
+    }
+    headers = {"if-none-match": '"other"'}
+    greedy = api_client.post(url, json=room, headers=headers)
+    exact = api_client.post(
+        url, params={"allocation": "exact"}, json=room, headers=headers
+    )
+    other = api_client.post(url, json=other_room, headers=headers)
+    invalid = api_client.post(
+        url, json=invalid_request_payload_walls_dimensions, headers=headers
+    )
+
+    assert greedy.status_code == exact.status_code == other.status_code == 200
+    assert (
+        len(
+            {
+                greedy.headers["etag"],
+                exact.headers["etag"],
+                other.headers["etag"],
+            }
+        )
+        == 3
+    )
+    assert invalid.status_code == 422
+    assert "etag" not in invalid.headers
+
+
+def test_etag_of_unknown_result_paint_cans_calculator(
+    api_client,
+    valid_request_payload_walls_dimensions,
+    invalid_request_payload_walls_dimensions,
+):
+    """
+    Tests if a matching If-None-Match is only answered with a 304 before
+    running the endpoint for a room already calculated, so a room with
+    inconsistent dimensions still gets its 422, and if `*` never matches.
+    """
+    url = "/api/v1/paint_mall/paint_cans_needed"
+    response = api_client.post(
+        url,
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": '"other"'},
+    )
+    etag = response.headers["etag"]
+    api_client.app.state.results_cache.clear()
+
+    with patch.object(
+        PaintCansPipeline,
+        "calculate",
+        wraps=PaintCansPipeline.calculate,
+        autospec=True,
+    ) as calculate:
+        not_modified = api_client.post(
+            url,
+            json=valid_request_payload_walls_dimensions,
+            headers={"if-none-match": etag},
+        )
+    wildcard = api_client.post(
+        url,
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": "*"},
+    )
+    invalid = api_client.post(
+        url,
+        json=invalid_request_payload_walls_dimensions,
+        headers={"if-none-match": "*"},
+    )
+
+    assert calculate.call_count == 1
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert wildcard.status_code == 200
+    assert wildcard.json() == response.json()
+    assert invalid.status_code == 422
+    assert "etag" not in invalid.headers
+
+
+def test_conditional_request_keeps_result_cache_metrics(
+    api_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if checking for the result of a conditional request does not
+    count as a lookup of the result cache, and unconditional requests do
+    not compute any ETag.
+    """
+    url = "/api/v1/paint_mall/paint_cans_needed"
+    with patch(
+        "src.api.resources.paint_cans_calculator.etags.decode_room_key"
+    ) as decode_room_key:
+        for _ in range(3):
+            api_client.post(url, json=valid_request_payload_walls_dimensions)
+    assert not decode_room_key.called
+    stats = api_client.app.state.results_cache.stats()
+
+    conditional = api_client.post(
+        url,
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": '"other"'},
+    )
+    etag = conditional.headers["etag"]
+    api_client.post(
+        url,
+        json=valid_request_payload_walls_dimensions,
+        headers={"if-none-match": etag},
+    )
+
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert api_client.app.state.results_cache.stats()["hits"] == 3
+    assert api_client.app.state.results_cache.stats()["misses"] == 1
+
+
+def test_large_room_offloaded_paint_cans_calculator(
+    api_client, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if a room with more walls than `ApiConfig.ASYNC_INLINE_MAX_WALLS`
+    is calculated in the threadpool, and a small room inline.
+    """
+    walls = valid_request_payload_walls_dimensions["walls"]
+    large_room = {"walls": walls * (ApiConfig.ASYNC_INLINE_MAX_WALLS // 4 + 1)}
+    large_room["walls"][0] = {**walls[0], "width": 6.5}
+
+    with patch(
+        "src.extensions.offload.run_in_threadpool", wraps=run_in_threadpool
+    ) as offloaded:
+        small = api_client.post(
+            "/api/v1/paint_mall/paint_cans_needed",
+            json=valid_request_payload_walls_dimensions,
+        )
+        assert not offloaded.called
+        large = api_client.post(
+            "/api/v1/paint_mall/paint_cans_needed", json=large_room
+        )
+
+    assert small.status_code == large.status_code == 200
+    assert offloaded.call_count == 1
@@ -0,0 +1,65 @@
+from config import ApiConfig
+
+
+def test_expected_sucess_response_paint_cans_calculator_batch(
+    api_client,
+    valid_request_payload_rooms_batch,
+    json_response_successful_rooms_batch,
+):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed/batch",
+        json=valid_request_payload_rooms_batch,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == json_response_successful_rooms_batch
+
+
+def test_expected_unprocessable_entity_response_empty_batch(api_client):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed/batch",
+        json={"rooms": []},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "rooms"]
+
+
+def test_expected_unprocessable_entity_response_oversized_batch(
+    api_client, valid_request_payload_walls_dimensions
+):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed/batch",
+        json={
+            "rooms": [valid_request_payload_walls_dimensions]
+            * (ApiConfig.BATCH_MAX_ROOMS + 1)
+        },
+    )
+
+    assert response.status_code == 422
+
+
+def test_expected_unprocessable_entity_response_invalid_wall_in_batch(
+    api_client,
+    valid_request_payload_walls_dimensions,
+    invalid_request_payload_walls_dimensions_2,
+):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed/batch",
+        json={
+            "rooms": [
+                valid_request_payload_walls_dimensions,
+                invalid_request_payload_walls_dimensions_2,
+            ]
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == [
+        "body",
+        "rooms",
+        1,
+        "walls",
+        0,
+        "width",
+    ]
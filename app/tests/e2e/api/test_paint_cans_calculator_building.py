@@ -0,0 +1,77 @@
+PATH = "/api/v1/paint_mall/paint_cans_needed/building"
+
+
+def test_expected_sucess_response_building_quote(
+    api_client,
+    valid_request_payload_walls_dimensions,
+    invalid_request_payload_walls_dimensions,
+):
+    response = api_client.post(
+        PATH,
+        json={
+            "floors": [
+                {
+                    "rooms": [
+                        valid_request_payload_walls_dimensions,
+                        invalid_request_payload_walls_dimensions,
+                    ]
+                },
+                {"rooms": [valid_request_payload_walls_dimensions]},
+            ]
+        },
+    )
+    room_response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=valid_request_payload_walls_dimensions,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    first_floor, second_floor = body["floors"]
+    assert set(first_floor["rooms"][0]) == {"free_area"}
+    assert set(first_floor["rooms"][1]) == {"errors"}
+    assert second_floor["rooms"] == [first_floor["rooms"][0]]
+    assert first_floor["paint_cans"] == room_response.json()["paint_cans"]
+    assert second_floor["paint_cans"] == room_response.json()["paint_cans"]
+    assert body["free_area"] == round(
+        first_floor["free_area"] + second_floor["free_area"], 2
+    )
+
+
+def test_expected_unprocessable_entity_response_empty_building(api_client):
+    response = api_client.post(PATH, json={"floors": []})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "floors"]
+
+
+def test_expected_unprocessable_entity_response_invalid_wall_in_building(
+    api_client, invalid_request_payload_walls_dimensions_2
+):
+    response = api_client.post(
+        PATH,
+        json={
+            "floors": [{"rooms": [invalid_request_payload_walls_dimensions_2]}]
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:5] == [
+        "body",
+        "floors",
+        0,
+        "rooms",
+        0,
+    ]
+
+
+def test_expected_not_found_response_unknown_catalog(
+    api_client, valid_request_payload_walls_dimensions
+):
+    response = api_client.post(
+        PATH,
+        params={"catalog": "unknown"},
+        json={"floors": [{"rooms": [valid_request_payload_walls_dimensions]}]},
+    )
+
+    assert response.status_code == 404
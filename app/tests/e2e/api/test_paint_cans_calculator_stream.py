@@ -0,0 +1,55 @@
+import json
+
+PATH = "/api/v1/paint_mall/paint_cans_needed/stream"
+
+
+def test_expected_sucess_response_stream(
+    api_client,
+    valid_request_payload_walls_dimensions,
+    invalid_request_payload_walls_dimensions,
+    json_response_successful_rooms_batch,
+    valid_request_payload_rooms_batch,
+):
+    content = b"\n".join(
+        json.dumps(room).encode()
+        for room in valid_request_payload_rooms_batch["rooms"]
+    )
+    response = api_client.post(
+        PATH,
+        content=content,
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.content.splitlines()] == [
+        {"line": line_number, **result}
+        for line_number, result in enumerate(
+            json_response_successful_rooms_batch["results"], start=1
+        )
+    ]
+
+
+def test_expected_validation_errors_in_stream(api_client):
+    response = api_client.post(PATH, content=b'not json\n{"walls": []}\n')
+
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.content.splitlines()]
+    assert [record["line"] for record in records] == [1, 2]
+    assert records[0]["detail"][0]["type"] == "value_error.jsondecode"
+    assert records[1]["detail"][0]["loc"] == ["walls"]
+
+
+def test_expected_empty_stream(api_client):
+    response = api_client.post(PATH, content=b"")
+
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_expected_not_found_response_unknown_catalog(api_client):
+    response = api_client.post(
+        PATH, params={"catalog": "unknown"}, content=b""
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,55 @@
+import json
+import logging
+
+import pytest
+
+from src.extensions.logger import LOGGER_NAME
+
+
+@pytest.fixture(scope="function")
+def request_log_records(api):
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger(f"{LOGGER_NAME}.request")
+    logger.addHandler(handler)
+    yield records
+    logger.removeHandler(handler)
+
+
+def test_invalid_room_logs_a_single_record(
+    api_client,
+    request_log_records,
+    invalid_request_payload_walls_dimensions,
+):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=invalid_request_payload_walls_dimensions,
+        headers={"X-Request-ID": "request-id"},
+    )
+
+    assert response.status_code == 422
+    assert response.headers["x-request-id"] == "request-id"
+    assert len(request_log_records) == 1
+
+    record = json.loads(request_log_records[0].getMessage())
+    assert request_log_records[0].levelno == logging.WARNING
+    assert record["request_id"] == "request-id"
+    assert record["status_code"] == 422
+    assert record["errors"][0]["type"] == "InvalidRoomDimensionError"
+    assert all("traceback" not in error for error in record["errors"])
+
+
+def test_valid_room_does_not_log(
+    api_client,
+    request_log_records,
+    valid_request_payload_walls_dimensions,
+):
+    response = api_client.post(
+        "/api/v1/paint_mall/paint_cans_needed",
+        json=valid_request_payload_walls_dimensions,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["x-request-id"]
+    assert request_log_records == []
@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import anyio
+import pytest
+from fastapi.concurrency import run_in_threadpool
+
+from src.controllers.batch_controller import PaintCansBatchController
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed_batch import (
+    PaintCansNeededBatch,
+    RoomPaintCansResult,
+)
+
+
+def test_init_with_invalid_rooms(valid_room):
+    """
+    Test if a TypeError is raised when any of the rooms is not an instance
+    of the Room class.
+    """
+    with pytest.raises(TypeError):
+        PaintCansBatchController([Room(**valid_room), "not a room"])
+
+
+def test_calculate_paint_cans_needed_batch_controller(
+    valid_room,
+    invalid_room_dimensions,
+    expected_return_calculate_paint_cans_needed,
+    expected_fail_to_process_dimensions,
+):
+    """
+    Test if the function returns one result per room, in the same order,
+    with the paint cans needed for valid rooms and the wall errors for
+    invalid rooms.
+    """
+    controller = PaintCansBatchController(
+        [Room(**valid_room), Room(**invalid_room_dimensions)]
+    )
+
+    assert (
+        controller.calculate_paint_cans_needed_batch_controller()
+        == PaintCansNeededBatch(
+            results=[
+                RoomPaintCansResult(
+                    paint_cans=expected_return_calculate_paint_cans_needed
+                ),
+                RoomPaintCansResult(
+                    errors=expected_fail_to_process_dimensions
+                ),
+            ]
+        )
+    )
+
+
+def test_calculate_paint_cans_needed_batch_controller_async(
+    valid_room, invalid_room_dimensions
+):
+    """
+    Test if the async calculation returns the same results of the sync
+    calculation, for batches run inline and offloaded.
+    """
+    rooms = [Room(**valid_room), Room(**invalid_room_dimensions)] * 40
+    small_batch = PaintCansBatchController(rooms[:2])
+    large_batch = PaintCansBatchController(rooms)
+
+    assert anyio.run(
+        small_batch.calculate_paint_cans_needed_batch_controller_async
+    ) == (small_batch.calculate_paint_cans_needed_batch_controller())
+    assert anyio.run(
+        large_batch.calculate_paint_cans_needed_batch_controller_async
+    ) == (large_batch.calculate_paint_cans_needed_batch_controller())
+
+
+def test_calculate_paint_cans_needed_batch_controller_async_counts_walls(
+    valid_room,
+):
+    """
+    Test if a batch of few rooms, with more walls than
+    `ApiConfig.ASYNC_INLINE_MAX_WALLS` over all rooms, is offloaded to the
+    threadpool.
+    """
+    large_room = Room(walls=valid_room["walls"] * 40)
+    controller = PaintCansBatchController([large_room] * 2)
+
+    with patch(
+        "src.extensions.offload.run_in_threadpool", wraps=run_in_threadpool
+    ) as offloaded:
+        anyio.run(
+            controller.calculate_paint_cans_needed_batch_controller_async
+        )
+
+    assert offloaded.called
@@ -0,0 +1,117 @@
+import anyio
+import pytest
+
+from src.controllers.building_controller import BuildingQuoteController
+from src.controllers.main_controller import PaintCansController
+from src.schemas.request.building import Building
+from src.schemas.request.room import Room
+from src.schemas.response.building_quote import RoomQuote
+from src.services.can_allocation import AllocationStrategy
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
+
+def test_init_with_invalid_building(valid_room):
+    """
+    Test if a TypeError is raised when the building is not an instance of
+    the Building class.
+    """
+    with pytest.raises(TypeError):
+        BuildingQuoteController({"floors": [{"rooms": [valid_room]}]})
+
+
+def test_calculate_building_quote_controller(
+    valid_room, invalid_room_dimensions, expected_fail_to_process_dimensions
+):
+    """
+    Test if the quote reports each room, in the same order, and buys the
+    paint cans of each floor and of the building on the pooled free area
+    of its consistent rooms.
+    """
+    building = Building(
+        floors=[
+            {"rooms": [valid_room, invalid_room_dimensions]},
+            {"rooms": [valid_room, valid_room]},
+        ]
+    )
+    free_area = Room(**valid_room).geometry.free_area
+
+    quote = BuildingQuoteController(
+        building
+    ).calculate_building_quote_controller()
+
+    assert [floor.rooms for floor in quote.floors] == [
+        [
+            RoomQuote(free_area=round(free_area, 2)),
+            RoomQuote(errors=expected_fail_to_process_dimensions),
+        ],
+        [RoomQuote(free_area=round(free_area, 2))] * 2,
+    ]
+    assert [floor.free_area for floor in quote.floors] == [
+        round(free_area, 2),
+        round(free_area + free_area, 2),
+    ]
+    assert quote.free_area == round(free_area * 3, 2)
+    assert [floor.paint_cans for floor in quote.floors] == [
+        PaintCansCalculator.paint_cans_for_free_area(free_area),
+        PaintCansCalculator.paint_cans_for_free_area(free_area + free_area),
+    ]
+    assert quote.paint_cans == PaintCansCalculator.paint_cans_for_free_area(
+        free_area * 3
+    )
+
+
+def test_calculate_building_quote_controller_pools_leftovers(valid_room):
+    """
+    Test if the building is quoted for less paint than its rooms quoted one
+    by one, because the paint left over in a room covers the others.
+    """
+    room = Room(**valid_room)
+    building = Building(floors=[{"rooms": [valid_room] * 3}])
+    room_paint_cans = PaintCansController(
+        room
+    ).calculate_paint_cans_needed_controller()
+
+    quote = BuildingQuoteController(
+        building
+    ).calculate_building_quote_controller()
+
+    def liters(paint_cans):
+        return sum(size * number for size, number in paint_cans.items())
+
+    assert liters(quote.paint_cans) < 3 * liters(room_paint_cans.paint_cans)
+
+
+def test_calculate_building_quote_controller_allocation(valid_room):
+    """
+    Test if the paint cans of the building are chosen with the given
+    allocation strategy.
+    """
+    building = Building(floors=[{"rooms": [valid_room] * 2}])
+    free_area = Room(**valid_room).geometry.free_area * 2
+
+    quote = BuildingQuoteController(
+        building, AllocationStrategy.EXACT
+    ).calculate_building_quote_controller()
+
+    assert quote.paint_cans == PaintCansCalculator.paint_cans_for_free_area(
+        free_area, AllocationStrategy.EXACT
+    )
+
+
+def test_calculate_building_quote_controller_async(
+    valid_room, invalid_room_dimensions
+):
+    """
+    Test if the async quote returns the same quote of the sync quote, for
+    buildings run inline and offloaded.
+    """
+    small_building = Building(floors=[{"rooms": [valid_room]}])
+    large_building = Building(
+        floors=[{"rooms": [valid_room, invalid_room_dimensions] * 40}] * 2
+    )
+
+    for building in (small_building, large_building):
+        controller = BuildingQuoteController(building)
+        assert anyio.run(
+            controller.calculate_building_quote_controller_async
+        ) == (controller.calculate_building_quote_controller())
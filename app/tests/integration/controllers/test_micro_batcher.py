@@ -0,0 +1,131 @@
+import asyncio
+from time import perf_counter
+
+import anyio
+import pytest
+from pydantic import ValidationError
+
+from src.controllers.micro_batcher import PaintCansMicroBatcher
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.result_cache import ResultCache
+from src.schemas.request.room import Room
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import UnavailableAllocationError
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+
+
+def _pipeline():
+    return PaintCansPipeline(ResultCache(max_size=0))
+
+
+def _calculate_concurrently(micro_batcher, rooms, *args):
+    async def calculate(room):
+        try:
+            return await micro_batcher.calculate(room, *args)
+        except Exception as error:
+            return error
+
+    async def run():
+        return await asyncio.gather(*(calculate(room) for room in rooms))
+
+    return anyio.run(run)
+
+
+@pytest.mark.parametrize(
+    "pipeline, window, max_size, error",
+    [
+        ({}, 0.001, 8, TypeError),
+        (_pipeline(), -1, 8, ValueError),
+        (_pipeline(), 0.001, 0, ValueError),
+    ],
+)
+def test_init_with_invalid_arguments(pipeline, window, max_size, error):
+    """
+    Test if an error is raised for an invalid pipeline, window or max size.
+    """
+    with pytest.raises(error):
+        PaintCansMicroBatcher(pipeline, window, max_size)
+
+
+def test_calculate_concurrent_rooms_in_one_batch(
+    valid_room, invalid_room_dimensions
+):
+    """
+    Test if concurrent rooms are calculated in a single batch, with the same
+    results and errors of the pipeline.
+    """
+    pipeline = _pipeline()
+    micro_batcher = PaintCansMicroBatcher(pipeline, window=0.01, max_size=64)
+    rooms = [Room(**valid_room), Room(**invalid_room_dimensions)] * 5
+
+    results = _calculate_concurrently(micro_batcher, rooms)
+
+    with pytest.raises(ValidationError) as expected_error:
+        pipeline.calculate(rooms[1])
+    assert results[::2] == [pipeline.calculate(rooms[0])] * 5
+    assert all(isinstance(error, ValidationError) for error in results[1::2])
+    assert results[1].errors() == expected_error.value.errors()
+    assert results[1] is not results[3]
+    assert micro_batcher.stats() == {
+        "requests": 10,
+        "batches": 1,
+        "mean_batch_size": 10.0,
+    }
+
+
+def test_calculate_full_batch_before_the_window(valid_room):
+    """
+    Test if a batch is calculated as soon as it reaches the max size,
+    without waiting for the window.
+    """
+    micro_batcher = PaintCansMicroBatcher(_pipeline(), window=60, max_size=4)
+
+    start = perf_counter()
+    _calculate_concurrently(micro_batcher, [Room(**valid_room)] * 8)
+
+    assert perf_counter() - start < 1
+    assert micro_batcher.stats()["batches"] == 2
+
+
+def test_calculate_batches_by_allocation(valid_room):
+    """
+    Test if rooms with different allocation strategies are calculated in
+    different batches.
+    """
+    pipeline = _pipeline()
+    micro_batcher = PaintCansMicroBatcher(pipeline, window=0.01, max_size=64)
+    room = Room(**valid_room)
+
+    async def run():
+        return await asyncio.gather(
+            micro_batcher.calculate(room, AllocationStrategy.GREEDY),
+            micro_batcher.calculate(room, AllocationStrategy.EXACT),
+        )
+
+    assert anyio.run(run) == [
+        pipeline.calculate(room, AllocationStrategy.GREEDY),
+        pipeline.calculate(room, AllocationStrategy.EXACT),
+    ]
+    assert micro_batcher.stats()["batches"] == 2
+
+
+def test_calculate_raises_batch_errors_in_every_request(valid_room):
+    """
+    Test if an error raised for a whole batch is raised in every request of
+    the batch.
+    """
+    micro_batcher = PaintCansMicroBatcher(
+        _pipeline(), window=0.01, max_size=64
+    )
+    catalog = CompiledPaintCanCatalog("basic", (5, 1), 5, max_area=100)
+
+    results = _calculate_concurrently(
+        micro_batcher,
+        [Room(**valid_room)] * 3,
+        AllocationStrategy.CHEAPEST,
+        catalog,
+    )
+
+    assert all(
+        isinstance(error, UnavailableAllocationError) for error in results
+    )
@@ -0,0 +1,422 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.controllers.main_controller import PaintCansController
+from src.controllers.paint_cans_needed_coordinator import (
+    PaintCansNeededCoordinator,
+)
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.result_cache import ResultCache
+from src.extensions.shared_result_cache import SharedResultCache
+from src.extensions.single_flight import SingleFlight
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+from src.services.room_validator import RoomValidator
+
+
+def test_init_with_invalid_results_cache():
+    """
+    Test if a TypeError is raised when the results cache is not an instance
+    of the ResultCache class.
+    """
+    with pytest.raises(TypeError):
+        PaintCansPipeline(results_cache={})
+    with pytest.raises(TypeError):
+        PaintCansPipeline(ResultCache(max_size=0), in_flight={})
+
+
+def test_calculate(valid_room, expected_return_calculate_paint_cans_needed):
+    """
+    Test if the pipeline returns the paint cans needed to paint a valid
+    room.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+
+    assert pipeline.calculate(Room(**valid_room)) == PaintCansNeeded(
+        paint_cans=expected_return_calculate_paint_cans_needed
+    )
+
+
+def test_calculate_caches_results(valid_room, invalid_room_dimensions):
+    """
+    Test if the result of a room, successful or not, is calculated once and
+    returned from the result cache for rooms with the same dimensions.
+    """
+    results_cache = ResultCache(max_size=2)
+    pipeline = PaintCansPipeline(results_cache)
+
+    first = pipeline.calculate(Room(**valid_room))
+    second = pipeline.calculate(Room(**valid_room))
+    with pytest.raises(ValidationError) as first_error:
+        pipeline.calculate(Room(**invalid_room_dimensions))
+    with pytest.raises(ValidationError) as second_error:
+        pipeline.calculate(Room(**invalid_room_dimensions))
+
+    assert second is first
+    assert second_error.value is not first_error.value
+    assert second_error.value.errors() == first_error.value.errors()
+    assert results_cache.stats()["hits"] == 2
+    assert results_cache.stats()["misses"] == 2
+
+
+def test_calculate_does_not_cache_errors_of_many_walls(
+    valid_room, invalid_room_dimensions
+):
+    """
+    Test if the errors of a room with more inconsistent walls than the
+    maximum are not cached, while its successful results are.
+    """
+    results_cache = ResultCache(max_size=2)
+    pipeline = PaintCansPipeline(results_cache)
+
+    with patch.object(ApiConfig, "CACHE_MAX_INVALID_WALLS", 2):
+        pipeline.calculate(Room(**valid_room))
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                pipeline.calculate(Room(**invalid_room_dimensions))
+
+    assert len(results_cache) == 1
+    assert results_cache.stats()["misses"] == 3
+
+
+def test_calculate_with_invalid_room(invalid_room_dimensions):
+    """
+    Test if the pipeline raises the same ValidationError raised by the
+    controller for a room with inconsistent dimensions, cached or not.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=1))
+    room = Room(**invalid_room_dimensions)
+
+    with pytest.raises(ValidationError) as expected_error:
+        PaintCansController(room).calculate_paint_cans_needed_controller()
+    for _ in range(2):
+        with pytest.raises(ValidationError) as error:
+            pipeline.calculate(room)
+        assert error.value.errors() == expected_error.value.errors()
+
+
+def test_calculate_does_not_build_per_request_objects(valid_room):
+    """
+    Test if the pipeline calculates a room without building validators,
+    calculators or coordinators.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+    room = Room(**valid_room)
+    expected = PaintCansController(
+        room
+    ).calculate_paint_cans_needed_controller()
+
+    with patch.object(
+        RoomValidator, "__init__", side_effect=AssertionError
+    ), patch.object(
+        PaintCansCalculator, "__init__", side_effect=AssertionError
+    ), patch.object(
+        PaintCansNeededCoordinator, "__init__", side_effect=AssertionError
+    ):
+        assert pipeline.calculate(room) == expected
+
+
+def test_calculate_from_many_threads(valid_room, invalid_room_dimensions):
+    """
+    Test if a single pipeline gives the same results when called from many
+    threads at once.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=1))
+    rooms = [Room(**valid_room), Room(**invalid_room_dimensions)] * 100
+
+    def calculate(room):
+        try:
+            return pipeline.calculate(room)
+        except ValidationError as error:
+            return error.errors()
+
+    expected = [calculate(room) for room in rooms[:2]]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(calculate, rooms))
+
+    assert results == expected * 100
+
+
+def test_calculate_interns_paint_cans_needed(valid_room):
+    """
+    Test if rooms with different dimensions that need the same amount of
+    paint cans share the same PaintCansNeeded.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+    room = Room(**valid_room)
+    walls = [wall.dict() for wall in room.walls]
+    walls[0]["width"] += 0.01
+
+    assert room.canonical_key != Room(walls=walls).canonical_key
+    assert pipeline.calculate(Room(walls=walls)) is pipeline.calculate(room)
+
+
+@pytest.mark.parametrize("number_walls", [1, 3, 257])
+def test_calculate_rooms_with_many_walls(
+    number_walls, valid_room, invalid_room_dimensions
+):
+    """
+    Test if the pipeline gives the same results of the controller for rooms
+    with any number of walls, validating the largest ones by columns.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+    valid = Room(walls=valid_room["walls"][:1] * number_walls)
+    invalid = Room(walls=invalid_room_dimensions["walls"][:1] * number_walls)
+
+    with patch.object(ApiConfig, "COLUMNAR_VALIDATION_MIN_WALLS", 256):
+        assert (
+            pipeline.calculate(valid)
+            == PaintCansController(
+                valid
+            ).calculate_paint_cans_needed_controller()
+        )
+        with pytest.raises(ValidationError) as expected_error:
+            PaintCansController(
+                invalid
+            ).calculate_paint_cans_needed_controller()
+        with patch.object(
+            ColumnarRoomValidator,
+            "from_rooms",
+            wraps=ColumnarRoomValidator.from_rooms,
+        ) as from_rooms, pytest.raises(ValidationError) as error:
+            pipeline.calculate(invalid)
+
+    assert error.value.errors() == expected_error.value.errors()
+    assert from_rooms.called == (number_walls >= 256)
+
+
+def test_calculate_many(valid_room, invalid_room_dimensions):
+    """
+    Test if the pipeline calculates many rooms at once with the same
+    results of calculate(), returning the errors of inconsistent rooms
+    instead of raising them, and caching every result.
+    """
+    results_cache = ResultCache(max_size=8)
+    pipeline = PaintCansPipeline(results_cache)
+    rooms = [
+        Room(**valid_room),
+        Room(**invalid_room_dimensions),
+        Room(walls=valid_room["walls"][:2]),
+    ]
+
+    results = pipeline.calculate_many(rooms)
+
+    assert results[0] == pipeline.calculate(rooms[0])
+    assert results[2] == pipeline.calculate(rooms[2])
+    with pytest.raises(ValidationError) as error:
+        PaintCansPipeline(ResultCache(max_size=0)).calculate(rooms[1])
+    assert results[1].errors() == error.value.errors()
+    assert len(results_cache) == 3
+    assert pipeline.calculate_many(rooms) == results
+
+
+def test_calculate_many_calculates_identical_rooms_once(valid_room):
+    """
+    Test if identical rooms of the same call are validated and calculated
+    only once.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+    rooms = [Room(**valid_room)] * 4
+
+    with patch.object(
+        ColumnarRoomValidator,
+        "from_rooms",
+        wraps=ColumnarRoomValidator.from_rooms,
+    ) as from_rooms:
+        results = pipeline.calculate_many(rooms)
+
+    assert len(from_rooms.call_args.args[0]) == 1
+    assert results == [pipeline.calculate(rooms[0])] * 4
+
+
+def test_calculate_shares_results_through_shared_cache(
+    tmp_path, valid_room, invalid_room_dimensions
+):
+    """
+    Test if a pipeline gets the results calculated by another pipeline,
+    as another worker would, from the shared cache, without calculating
+    them again.
+    """
+    path = str(tmp_path / "results")
+    writer = PaintCansPipeline(
+        ResultCache(max_size=0), SharedResultCache(path, 64, 1024)
+    )
+    room = Room(**valid_room)
+    invalid_room = Room(**invalid_room_dimensions)
+
+    expected = writer.calculate(room)
+    with pytest.raises(ValidationError) as expected_error:
+        writer.calculate(invalid_room)
+
+    with patch.object(
+        ColumnarRoomValidator, "from_rooms"
+    ) as from_rooms, patch.object(
+        RoomValidator, "wall_validation"
+    ) as wall_validation, patch.object(
+        PaintCansCalculator, "paint_cans_for_free_area"
+    ) as paint_cans_for_free_area:
+        reader = PaintCansPipeline(
+            ResultCache(max_size=0), SharedResultCache(path, 64, 1024)
+        )
+        assert reader.calculate(room) == expected
+        with pytest.raises(ValidationError) as error:
+            reader.calculate(invalid_room)
+        assert reader.calculate_many([room]) == [expected]
+
+    assert error.value.errors() == expected_error.value.errors()
+    assert not from_rooms.called
+    assert not wall_validation.called
+    assert not paint_cans_for_free_area.called
+
+
+def test_encode_result_round_trip(valid_room, invalid_room_dimensions):
+    """
+    Test if the results decoded are equal to the results encoded.
+    """
+    pipeline = PaintCansPipeline(ResultCache(max_size=0))
+    paint_cans_needed = pipeline.calculate(Room(**valid_room))
+    validation_error = pipeline.calculate_many(
+        [Room(**invalid_room_dimensions)]
+    )[0]
+
+    assert (
+        pipeline.decode_result(pipeline.encode_result(paint_cans_needed))
+        == paint_cans_needed
+    )
+    assert (
+        pipeline.decode_result(
+            pipeline.encode_result(validation_error)
+        ).errors()
+        == validation_error.errors()
+    )
+
+
+def test_import_results_skips_other_catalogs(valid_room):
+    """
+    Test if the results exported are imported for the current catalogs
+    only, and are then returned without calculating the rooms again.
+    """
+    room = Room(**valid_room)
+    catalog = CompiledPaintCanCatalog("basic", (5, 1), 5, max_area=100)
+    exporter = PaintCansPipeline(ResultCache(max_size=4))
+    expected = exporter.calculate(room)
+    exporter.calculate(room, catalog=catalog)
+    entries = [
+        ((tuple((allocation.value, catalog_key)), room_key), encoded)
+        for ((allocation, catalog_key), room_key), encoded in (
+            exporter.export_results()
+        )
+    ]
+
+    with patch.object(
+        PaintCansCalculator, "paint_cans_for_free_area"
+    ) as paint_cans_for_free_area:
+        importer = PaintCansPipeline(ResultCache(max_size=4))
+        assert importer.import_results(entries, [None]) == 1
+        assert importer.calculate(room) == expected
+    assert not paint_cans_for_free_area.called
+
+
+def test_import_results_skips_malformed_entries(valid_room):
+    """
+    Test if the entries that can not be imported are skipped and reported,
+    and the other entries are still imported.
+    """
+    room = Room(**valid_room)
+    exporter = PaintCansPipeline(ResultCache(max_size=4))
+    expected = exporter.calculate(room)
+    [
+        (((allocation, catalog_key), room_key), encoded)
+    ] = exporter.export_results()
+    key = ((allocation.value, catalog_key), room_key)
+    entries = [
+        ("room", encoded),
+        (key, b"not msgpack"),
+        (key, PaintCansPipeline.encode_result(expected)[:-1]),
+        (key, encoded),
+    ]
+    failures = []
+
+    importer = PaintCansPipeline(ResultCache(max_size=4))
+
+    assert importer.import_results(entries, [None], failures.append) == 1
+    assert len(failures) == 3
+    assert importer.calculate(room) == expected
+
+
+def test_calculate_coalesces_identical_rooms(valid_room):
+    """
+    Test if identical rooms calculated from many threads while one of them
+    is being calculated are validated and calculated only once.
+    """
+    in_flight = SingleFlight()
+    pipeline = PaintCansPipeline(ResultCache(max_size=0), in_flight=in_flight)
+    room = Room(**valid_room)
+    release = Event()
+    validate = pipeline._validate
+
+    def slow_validate(room):
+        release.wait()
+        return validate(room)
+
+    with patch.object(
+        PaintCansPipeline, "_validate", side_effect=slow_validate
+    ) as validate_mock:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(pipeline.calculate, room) for _ in range(8)
+            ]
+            while in_flight.stats()["coalesced"] < 7:
+                pass
+            release.set()
+            results = [future.result() for future in futures]
+
+    assert validate_mock.call_count == 1
+    assert results == [results[0]] * 8
+    assert in_flight.stats() == {"executed": 1, "coalesced": 7, "in_flight": 0}
+
+
+def test_calculate_coalesced_invalid_rooms_raise_their_own_error(
+    invalid_room_dimensions,
+):
+    """
+    Test if every identical room waiting for a room with inconsistent
+    dimensions gets its own ValidationError with the same errors.
+    """
+    in_flight = SingleFlight()
+    pipeline = PaintCansPipeline(ResultCache(max_size=0), in_flight=in_flight)
+    room = Room(**invalid_room_dimensions)
+    release = Event()
+    validate = pipeline._validate
+
+    def slow_validate(room):
+        release.wait()
+        return validate(room)
+
+    def calculate():
+        try:
+            pipeline.calculate(room)
+        except ValidationError as error:
+            return error
+
+    with patch.object(
+        PaintCansPipeline, "_validate", side_effect=slow_validate
+    ):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(calculate) for _ in range(4)]
+            while in_flight.stats()["coalesced"] < 3:
+                pass
+            release.set()
+            errors = [future.result() for future in futures]
+
+    assert all(isinstance(error, ValidationError) for error in errors)
+    assert len({id(error) for error in errors}) == 4
+    assert all(error.errors() == errors[0].errors() for error in errors)
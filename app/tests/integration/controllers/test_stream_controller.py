@@ -0,0 +1,98 @@
+import json
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from config import ApiConfig
+from src.controllers.batch_controller import PaintCansBatchController
+from src.controllers.stream_controller import PaintCansStreamController
+from src.schemas.request.room import Room
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import UnavailableAllocationError
+from src.services.paint_can_catalog import CompiledPaintCanCatalog
+
+
+def _stream(*lines):
+    async def chunks():
+        for line in lines:
+            yield json.dumps(line).encode() + b"\n"
+
+    return chunks()
+
+
+def _results(controller):
+    async def run():
+        return [
+            chunk
+            async for chunk in (
+                controller.calculate_paint_cans_needed_stream_controller()
+            )
+        ]
+
+    return anyio.run(run)
+
+
+def test_calculate_paint_cans_needed_stream_controller(
+    valid_room, invalid_room_dimensions
+):
+    """
+    Test if the stream returns one NDJSON line per room, in the same order,
+    with the same results of the batch controller, and the validation
+    errors of the lines that are not valid rooms.
+    """
+    rooms = [valid_room, invalid_room_dimensions, {"walls": []}, valid_room]
+    batch = PaintCansBatchController(
+        [Room(**valid_room), Room(**invalid_room_dimensions)]
+    ).calculate_paint_cans_needed_batch_controller()
+
+    chunks = _results(PaintCansStreamController(_stream(*rooms)))
+    records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+
+    assert [record["line"] for record in records] == [1, 2, 3, 4]
+    paint_cans = {
+        str(size): amount
+        for size, amount in batch.results[0].paint_cans.items()
+    }
+    assert records[0] == {"line": 1, "paint_cans": paint_cans}
+    assert records[3] == {"line": 4, "paint_cans": paint_cans}
+    assert records[1]["errors"] == batch.results[1].errors
+    assert records[2]["detail"][0]["loc"] == ["walls"]
+
+
+def test_calculate_paint_cans_needed_stream_controller_in_chunks(valid_room):
+    """
+    Test if the results are yielded chunk by chunk, each one before the
+    lines of the next chunk are read.
+    """
+    read_lines = []
+
+    async def chunks():
+        for line_number in range(5):
+            read_lines.append(line_number)
+            yield json.dumps(valid_room).encode() + b"\n"
+
+    async def run():
+        read_before_chunk = []
+        controller = PaintCansStreamController(chunks())
+        async for chunk in (
+            controller.calculate_paint_cans_needed_stream_controller()
+        ):
+            read_before_chunk.append((len(read_lines), chunk.count(b"\n")))
+        return read_before_chunk
+
+    with patch.object(ApiConfig, "STREAM_CHUNK_ROOMS", 2):
+        assert anyio.run(run) == [(2, 2), (4, 2), (5, 1)]
+
+
+def test_init_with_unavailable_allocation():
+    """
+    Test if an UnavailableAllocationError is raised before the stream
+    starts when the catalog can not choose the cans with the strategy.
+    """
+    catalog = CompiledPaintCanCatalog("basic", (5, 1), 5, max_area=100)
+
+    with pytest.raises(UnavailableAllocationError):
+        PaintCansStreamController(
+            _stream(), AllocationStrategy.CHEAPEST, catalog
+        )
@@ -1,6 +1,15 @@
+from unittest.mock import patch
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from config import ApiConfig
+from src.api import create_api
+from src.controllers.paint_cans_pipeline import PaintCansPipeline
+from src.extensions.cache_snapshot import CacheSnapshot
+from src.extensions.logger import shutdown_logging
+from src.services.paint_cans_needed_calculator import PaintCansCalculator
+
 
 def test_create_api(api: FastAPI):
     """
@@ -11,12 +20,116 @@ def test_create_api(api: FastAPI):
     version = "v1"
     api_base_route = f"/api/{version}"
     service = "/paint_mall"
-    path_list = ["/paint_cans_needed"]
+    path_list = ["/paint_cans_needed", "/paint_cans_needed/batch"]
 
-    assert f"{api_base_route}{service}{path_list[0]}" in [
-        route.path for route in api.routes
-    ]
+    for path in path_list:
+        assert f"{api_base_route}{service}{path}" in [
+            route.path for route in api.routes
+        ]
+
+    assert isinstance(api.state.paint_cans_pipeline, PaintCansPipeline)
 
     with TestClient(api) as client:
         response = client.post("/api/v1/paint_mall/paint_cans_needed")
         assert response.status_code == 422
+
+
+def test_create_api_warm_starts_from_cache_snapshot(
+    tmp_path, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the results cached by an application are saved on shutdown and
+    loaded by the next application, before its first request.
+    """
+    path = str(tmp_path / "snapshot")
+    with patch.object(ApiConfig, "CACHE_SNAPSHOT_FILE", path):
+        with TestClient(create_api()) as client:
+            expected = client.post(
+                "/api/v1/paint_mall/paint_cans_needed",
+                json=valid_request_payload_walls_dimensions,
+            ).json()
+
+        with patch.object(
+            PaintCansCalculator, "paint_cans_for_free_area"
+        ) as paint_cans_for_free_area:
+            api = create_api()
+            with TestClient(api) as client:
+                response = client.post(
+                    "/api/v1/paint_mall/paint_cans_needed",
+                    json=valid_request_payload_walls_dimensions,
+                )
+                metrics = client.get("/api/v1/metrics").json()
+
+    assert response.json() == expected
+    assert not paint_cans_for_free_area.called
+    assert metrics["cache_snapshot"]["loaded"] >= 1
+
+
+def test_create_api_skips_malformed_cache_snapshot_entries(
+    tmp_path, valid_request_payload_walls_dimensions
+):
+    """
+    Tests if the entries of a snapshot that can not be imported are counted
+    as failures and skipped, without stopping the application.
+    """
+    path = str(tmp_path / "snapshot")
+    CacheSnapshot(
+        path,
+        PaintCansPipeline.rules_version(),
+        lambda: [("room", b"a"), ((("greedy", "default"), "room"), b"a")],
+    ).save()
+
+    with patch.object(ApiConfig, "CACHE_SNAPSHOT_FILE", path):
+        with TestClient(create_api()) as client:
+            response = client.post(
+                "/api/v1/paint_mall/paint_cans_needed",
+                json=valid_request_payload_walls_dimensions,
+            )
+            metrics = client.get("/api/v1/metrics").json()
+
+    assert response.status_code == 200
+    assert metrics["cache_snapshot"]["loaded"] == 2
+    assert metrics["cache_snapshot"]["failures"] == 1
+
+
+def test_create_api_builds_its_own_result_cache():
+    """
+    Tests if each application has its own result cache, used by its
+    pipeline, instead of a cache shared by every application.
+    """
+    first, second = create_api(), create_api()
+
+    assert first.state.results_cache is not second.state.results_cache
+    assert first.state.paint_cans_pipeline._results_cache is (
+        first.state.results_cache
+    )
+
+
+def test_create_api_reports_the_rooms_in_flight_of_its_pipeline(
+    api: FastAPI,
+):
+    """
+    Tests if the single_flight metric reports the rooms in flight of the
+    pipeline used by the routes.
+    """
+    client = TestClient(api)
+
+    metrics = client.get("/api/v1/metrics").json()
+
+    assert api.state.paint_cans_pipeline._in_flight is api.state.in_flight
+    assert metrics["single_flight"] == api.state.in_flight.stats()
+
+
+def test_create_api_stops_logging_after_every_shutdown_hook(tmp_path):
+    """
+    Tests if the logging queue is stopped by the last shutdown hook, so the
+    records logged by the other hooks, such as a failed snapshot save, are
+    written.
+    """
+    with patch.object(
+        ApiConfig, "CACHE_SNAPSHOT_FILE", str(tmp_path / "snapshot")
+    ):
+        api = create_api()
+
+    assert api.router.on_shutdown[-1] is shutdown_logging
+    assert shutdown_logging not in api.router.on_shutdown[:-1]
@@ -0,0 +1,101 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.api.resources.paint_cans_calculator.fast_json_codecs import (
+    decode_room_key,
+)
+from src.api.resources.paint_cans_calculator.responses import (
+    encode_paint_cans_needed,
+    paint_cans_needed_body,
+    unprocessable_entity_response,
+)
+from src.controllers.main_controller import PaintCansController
+from src.schemas.request.room import Room
+from src.schemas.response.paint_cans_needed import PaintCansNeeded
+
+
+def test_encode_paint_cans_needed(expected_return_calculate_paint_cans_needed):
+    """
+    Tests if the paint cans needed are encoded into the same bytes of a
+    JSONResponse.
+    """
+    paint_cans_needed = PaintCansNeeded(
+        paint_cans=expected_return_calculate_paint_cans_needed
+    )
+
+    assert encode_paint_cans_needed(paint_cans_needed) == (
+        JSONResponse(content=paint_cans_needed.dict()).body
+    )
+
+
+def test_paint_cans_needed_body_is_interned(
+    expected_return_calculate_paint_cans_needed,
+):
+    """
+    Tests if equal paint cans needed share the same encoded bytes.
+    """
+    first = paint_cans_needed_body(
+        PaintCansNeeded(paint_cans=expected_return_calculate_paint_cans_needed)
+    )
+    second = paint_cans_needed_body(
+        PaintCansNeeded(paint_cans=expected_return_calculate_paint_cans_needed)
+    )
+
+    assert second is first
+    assert first == encode_paint_cans_needed(
+        PaintCansNeeded(paint_cans=expected_return_calculate_paint_cans_needed)
+    )
+
+
+def test_unprocessable_entity_response_is_interned(invalid_room_dimensions):
+    """
+    Tests if the 422 response of a room has the body of a JSONResponse of
+    its errors, encoded once for rooms with the same dimensions.
+    """
+    room = Room(**invalid_room_dimensions)
+    with pytest.raises(ValidationError) as error:
+        PaintCansController(room).calculate_paint_cans_needed_controller()
+
+    first = unprocessable_entity_response(room, error.value)
+    second = unprocessable_entity_response(
+        Room(**invalid_room_dimensions), error.value
+    )
+
+    assert first.status_code == 422
+    assert first.headers["content-type"] == "application/json"
+    assert first.body == JSONResponse(content=error.value.errors()).body
+    assert second.body is first.body
+
+
+def test_unprocessable_entity_response_of_many_walls(invalid_room_dimensions):
+    """
+    Tests if the 422 response of a room with more inconsistent walls than
+    the maximum is encoded again for each request, and not cached.
+    """
+    room = Room(**invalid_room_dimensions)
+    with pytest.raises(ValidationError) as error:
+        PaintCansController(room).calculate_paint_cans_needed_controller()
+
+    with patch.object(ApiConfig, "CACHE_MAX_INVALID_WALLS", 2):
+        first = unprocessable_entity_response(room, error.value)
+        second = unprocessable_entity_response(room, error.value)
+
+    assert first.body == JSONResponse(content=error.value.errors()).body
+    assert second.body == first.body
+    assert second.body is not first.body
+
+
+def test_decode_room_key(valid_room):
+    """
+    Tests if the key decoded from the body of a room is the
+    `Room.canonical_key` of the room.
+    """
+    body = json.dumps(valid_room).encode()
+
+    assert decode_room_key(body) == Room(**valid_room).canonical_key
+    assert decode_room_key(b"not json") is None
@@ -0,0 +1,95 @@
+from enum import Enum
+
+from src.extensions.cache_snapshot import CacheSnapshot
+
+
+class Strategy(str, Enum):
+    GREEDY = "greedy"
+
+
+def test_save_and_load(tmp_path):
+    """
+    Test if the entries saved are loaded in the same order, with tuples in
+    place of lists and the values of enums in place of enums.
+    """
+    entries = [
+        (((Strategy.GREEDY, ("default", 5)), ((1.5, 2.0, 1, 0),)), b"a"),
+        (((Strategy.GREEDY, ("default", 5)), ((3.0, 2.0, 0, 0),)), b"b"),
+    ]
+    path = str(tmp_path / "snapshot")
+    snapshot = CacheSnapshot(path, "v1", lambda: entries)
+
+    assert snapshot.save() == 2
+    assert CacheSnapshot(path, "v1", list).load() == [
+        ((("greedy", ("default", 5)), ((1.5, 2.0, 1, 0),)), b"a"),
+        ((("greedy", ("default", 5)), ((3.0, 2.0, 0, 0),)), b"b"),
+    ]
+
+
+def test_load_invalidates_other_versions(tmp_path):
+    """
+    Test if the entries saved with another version are not loaded.
+    """
+    path = str(tmp_path / "snapshot")
+    CacheSnapshot(path, "v1", lambda: [("room", b"a")]).save()
+    snapshot = CacheSnapshot(path, "v2", list)
+
+    assert snapshot.load() == []
+    assert snapshot.stats()["invalidated"] == 1
+
+
+def test_load_without_valid_file(tmp_path):
+    """
+    Test if a missing or corrupt snapshot file loads no entries, and only
+    the corrupt one is counted as a failure.
+    """
+    path = tmp_path / "snapshot"
+    snapshot = CacheSnapshot(str(path), "v1", list)
+    assert snapshot.load() == []
+
+    path.write_bytes(b"PCSN\x01\x00not zlib")
+    assert snapshot.load() == []
+    assert snapshot.stats()["failures"] == 1
+
+
+def test_import_failed_is_counted(tmp_path):
+    """
+    Test if an entry loaded that could not be imported is counted as a
+    failure.
+    """
+    snapshot = CacheSnapshot(str(tmp_path / "snapshot"), "v1", list)
+
+    snapshot.import_failed(ValueError("malformed entry"))
+
+    assert snapshot.stats()["failures"] == 1
+
+
+def test_save_failure_keeps_previous_snapshot(tmp_path):
+    """
+    Test if a failed save is counted and leaves the previous snapshot.
+    """
+    path = str(tmp_path / "snapshot")
+    CacheSnapshot(path, "v1", lambda: [("room", b"a")]).save()
+
+    def export_entries():
+        raise RuntimeError("export failed")
+
+    snapshot = CacheSnapshot(path, "v1", export_entries)
+    assert snapshot.save() == 0
+    assert snapshot.stats()["failures"] == 1
+    assert CacheSnapshot(path, "v1", list).load() == [("room", b"a")]
+    assert [p.name for p in tmp_path.iterdir()] == ["snapshot"]
+
+
+def test_stop_saving_saves_once_more(tmp_path):
+    """
+    Test if stopping the periodic saves saves the entries at shutdown.
+    """
+    entries = []
+    path = str(tmp_path / "snapshot")
+    snapshot = CacheSnapshot(path, "v1", lambda: entries)
+    snapshot.start_saving(3600)
+    entries.append(("room", b"a"))
+    snapshot.stop_saving()
+
+    assert CacheSnapshot(path, "v1", list).load() == [("room", b"a")]
@@ -0,0 +1,96 @@
+import json
+from typing import Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from config import ApiConfig
+from src.extensions.conditional_requests import (
+    ConditionalRoute,
+    etag_matches,
+    register_etag,
+)
+
+
+class Body(BaseModel):
+    value: int
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ("", False),
+        ("*", False),
+        ('"a"', True),
+        ('W/"a"', True),
+        ('"b", "a"', True),
+        ('"b"', False),
+        ("a", False),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"a"') is expected
+
+
+def test_conditional_route_sends_not_modified():
+    """
+    Tests if the route answers a matching If-None-Match with a 304 without
+    running the endpoint when a successful response is known, or else after
+    running it, and only adds the ETag to successful responses of
+    conditional requests.
+    """
+    calls = []
+    etags = []
+
+    def etag(request: Request, body: bytes) -> Optional[Tuple[str, bool]]:
+        value = json.loads(body)["value"]
+        etags.append(value)
+        if not isinstance(value, int):
+            return None
+        return f'"{value}"', value in calls
+
+    register_etag(Body, etag)
+
+    api = FastAPI()
+    with patch.object(ApiConfig, "ETAG_CACHE_CONTROL", "max-age=60"):
+        router = APIRouter(route_class=ConditionalRoute)
+
+        @router.post("/value")
+        async def value(body: Body) -> dict:
+            calls.append(body.value)
+            return {"value": body.value}
+
+        api.include_router(router)
+
+    with TestClient(api) as client:
+        unknown = client.post(
+            "/value", json={"value": 1}, headers={"if-none-match": '"1"'}
+        )
+        unconditional = client.post("/value", json={"value": 1})
+        response = client.post(
+            "/value", json={"value": 1}, headers={"if-none-match": '"2"'}
+        )
+        not_modified = client.post(
+            "/value", json={"value": 1}, headers={"if-none-match": '"1"'}
+        )
+        invalid = client.post(
+            "/value", json={"value": "a"}, headers={"if-none-match": '"a"'}
+        )
+
+    assert unknown.status_code == 304
+    assert unknown.headers["etag"] == '"1"'
+    assert unconditional.status_code == 200
+    assert "etag" not in unconditional.headers
+    assert response.headers["etag"] == '"1"'
+    assert response.headers["cache-control"] == "max-age=60"
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == '"1"'
+    assert invalid.status_code == 422
+    assert "etag" not in invalid.headers
+    assert calls == [1, 1, 1]
+    assert etags == [1, 1, 1, "a"]
@@ -0,0 +1,78 @@
+from typing import Optional
+from unittest.mock import patch
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from config import ApiConfig
+from src.extensions.fast_json import (
+    FastJSONRoute,
+    PreEncodedJSONResponse,
+    register_fast_json_decoder,
+    register_fast_json_encoder,
+)
+
+
+class Body(BaseModel):
+    value: int
+
+
+class Answer(BaseModel):
+    value: int
+
+
+def test_pre_encoded_json_response_sends_bytes_as_is():
+    """
+    Tests if the content of a pre encoded response is sent as is.
+    """
+    response = PreEncodedJSONResponse(b'{"value":1}')
+
+    assert response.body == b'{"value":1}'
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_fast_json_route_uses_registered_codecs():
+    """
+    Tests if the route decodes and encodes with the registered codecs, and
+    falls back to the FastAPI handler when the decoder returns None or the
+    fast JSON is disabled.
+    """
+    decoded = []
+
+    def decode(body: bytes) -> Optional[Body]:
+        decoded.append(body)
+        return Body.construct(value=1) if body == b'{"value":1}' else None
+
+    register_fast_json_decoder(Body, decode)
+    register_fast_json_encoder(Answer, lambda answer: b'{"fast":true}')
+
+    def build_client(fast_json: bool) -> TestClient:
+        api = FastAPI()
+        with patch.object(ApiConfig, "FAST_JSON", fast_json):
+            router = APIRouter(route_class=FastJSONRoute)
+
+            @router.post("/answer", response_model=Answer)
+            async def answer(body: Body) -> Answer:
+                return Answer(value=body.value)
+
+            api.include_router(router)
+        return TestClient(api)
+
+    with build_client(fast_json=True) as client:
+        assert client.post("/answer", content=b'{"value":1}').json() == {
+            "fast": True
+        }
+        assert client.post("/answer", content=b'{"value":"2"}').json() == {
+            "value": 2
+        }
+        assert client.post(
+            "/answer", content=b'{"value":"a"}'
+        ).status_code == (422)
+    assert len(decoded) == 3
+
+    with build_client(fast_json=False) as client:
+        assert client.post("/answer", content=b'{"value":1}').json() == {
+            "value": 1
+        }
+    assert len(decoded) == 3
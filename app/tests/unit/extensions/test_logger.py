@@ -0,0 +1,180 @@
+import asyncio
+import io
+import logging
+from queue import Queue
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from config import ApiConfig
+from src.extensions.logger import (
+    LOGGER_NAME,
+    DroppingQueueHandler,
+    configure_logging,
+    log_exceptions,
+    logging_metrics,
+    shutdown_logging,
+)
+
+
+def test_configure_logging_adds_a_single_handler():
+    """
+    Tests if configuring the logging many times keeps a single handler.
+    """
+    configure_logging()
+    logger = configure_logging()
+
+    assert logger.name == LOGGER_NAME
+    assert [
+        handler.name
+        for handler in logger.handlers
+        if handler.name == LOGGER_NAME
+    ] == [LOGGER_NAME]
+
+
+def test_log_exceptions_does_not_add_handlers_per_call():
+    """
+    Tests if calling a decorated function many times does not add handlers
+    to its logger.
+    """
+
+    @log_exceptions(msg="exception", extra={"test": "handlers"})
+    def decorated():
+        return True
+
+    for _ in range(10):
+        assert decorated() is True
+
+    logger = logging.getLogger(f"{LOGGER_NAME}.decorated")
+    assert logger.handlers == []
+
+
+def test_log_exceptions_logs_each_exception_once():
+    """
+    Tests if an exception raised by a decorated function is logged once and
+    raised again.
+    """
+
+    @log_exceptions(msg="exception", extra={"test": "once"})
+    def decorated():
+        raise ValueError("Something went wrong")
+
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.addHandler(handler)
+    try:
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                decorated()
+    finally:
+        logger.removeHandler(handler)
+
+    assert len(records) == 3
+    assert all(record.test == "once" for record in records)
+
+
+def test_log_exceptions_of_coroutine_functions():
+    """
+    Tests if an exception raised by a decorated coroutine function is logged
+    when it is awaited, and raised again.
+    """
+
+    @log_exceptions(msg="exception", extra={"test": "coroutine"})
+    async def decorated():
+        raise ValueError("Something went wrong")
+
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.addHandler(handler)
+    try:
+        with pytest.raises(ValueError):
+            anyio.run(decorated)
+    finally:
+        logger.removeHandler(handler)
+
+    assert asyncio.iscoroutinefunction(decorated)
+    assert [record.test for record in records] == ["coroutine"]
+
+
+def test_log_exceptions_keeps_function_metadata():
+    """
+    Tests if the wrapper keeps the name and docstring of the function.
+    """
+
+    @log_exceptions(msg="exception", extra={"test": "metadata"})
+    def decorated():
+        """Docstring."""
+
+    assert decorated.__name__ == "decorated"
+    assert decorated.__doc__ == "Docstring."
+
+
+def test_log_exceptions_disabled():
+    """
+    Tests if the function is returned as is when the exception logging is
+    disabled.
+    """
+
+    def function():
+        return True
+
+    with patch.object(ApiConfig, "LOG_EXCEPTIONS", False):
+        decorated = log_exceptions(msg="exception", extra={})(function)
+
+    assert decorated is function
+
+
+def test_dropping_queue_handler_counts_records_dropped_when_full():
+    """
+    Tests if the queue handler drops and counts the records logged while
+    the queue is full, without blocking.
+    """
+    handler = DroppingQueueHandler(Queue(maxsize=2))
+    record = logging.LogRecord(
+        LOGGER_NAME, logging.ERROR, __file__, 1, "message", None, None
+    )
+
+    for _ in range(5):
+        handler.handle(record)
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_shutdown_logging_writes_queued_records():
+    """
+    Tests if stopping the logging writes the records still in the queue and
+    configuring it again restarts the listener.
+    """
+    logger = configure_logging()
+    queue_handler = next(
+        handler
+        for handler in logging.getLogger(LOGGER_NAME).handlers
+        if handler.name == LOGGER_NAME
+    )
+    stream = io.StringIO()
+    queue = queue_handler.queue
+
+    queue.put_nowait(
+        logging.LogRecord(
+            LOGGER_NAME, logging.ERROR, __file__, 1, "flushed", None, None
+        )
+    )
+    with patch.object(
+        logging.StreamHandler,
+        "emit",
+        lambda _, r: stream.write(r.getMessage()),
+    ):
+        shutdown_logging()
+
+    assert "flushed" in stream.getvalue()
+    assert queue.qsize() == 0
+
+    configure_logging()
+    assert logging_metrics()["queued_records"] == 0
+    assert logger.handlers.count(queue_handler) == 1
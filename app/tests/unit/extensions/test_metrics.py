@@ -0,0 +1,19 @@
+from src.extensions.metrics import (
+    collect_metrics,
+    register_metrics,
+    unregister_metrics,
+)
+
+
+def test_collect_metrics_of_registered_sources():
+    """
+    Tests if the metrics of each registered source are collected under its
+    name, and no longer collected once it is unregistered.
+    """
+    register_metrics("test_source", lambda: {"hits": 1})
+
+    assert collect_metrics()["test_source"] == {"hits": 1}
+
+    unregister_metrics("test_source")
+
+    assert "test_source" not in collect_metrics()
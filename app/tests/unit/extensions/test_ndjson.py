@@ -0,0 +1,43 @@
+import anyio
+
+from src.extensions.ndjson import iter_ndjson_lines
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _lines(chunks, max_line_bytes=1024):
+    async def run():
+        return [
+            line
+            async for line in iter_ndjson_lines(
+                _chunks(*chunks), max_line_bytes
+            )
+        ]
+
+    return anyio.run(run)
+
+
+def test_iter_ndjson_lines_across_chunks():
+    """
+    Tests if lines split across chunks are joined, blank lines are skipped
+    but counted, and the last line does not need a newline.
+    """
+    assert _lines([b'{"a"', b": 1}\n\n  \n{", b'"b": 2}\n{"c": 3}']) == [
+        (1, b'{"a": 1}'),
+        (4, b'{"b": 2}'),
+        (5, b'{"c": 3}'),
+    ]
+
+
+def test_iter_ndjson_lines_too_long():
+    """
+    Tests if a line longer than the maximum is yielded as None, whether it
+    arrives in a single chunk or many, without stopping the next lines.
+    """
+    assert _lines(
+        [b"1234567\n12", b"345", b"678", b"9\n123\n", b"12345678"],
+        max_line_bytes=4,
+    ) == [(1, None), (2, None), (3, b"123"), (4, None)]
@@ -0,0 +1,37 @@
+import threading
+
+import anyio
+
+from src.extensions.offload import run_inline_or_offload
+
+
+def test_run_inline_or_offload_runs_small_payloads_inline():
+    """
+    Tests if a function with a payload up to the maximum inline size runs
+    in the thread of the event loop.
+    """
+
+    async def run():
+        return threading.get_ident(), await run_inline_or_offload(
+            threading.get_ident, size=2, max_inline_size=2
+        )
+
+    event_loop_thread, function_thread = anyio.run(run)
+
+    assert function_thread == event_loop_thread
+
+
+def test_run_inline_or_offload_offloads_large_payloads():
+    """
+    Tests if a function with a payload larger than the maximum inline size
+    runs in a worker thread.
+    """
+
+    async def run():
+        return threading.get_ident(), await run_inline_or_offload(
+            threading.get_ident, size=3, max_inline_size=2
+        )
+
+    event_loop_thread, function_thread = anyio.run(run)
+
+    assert function_thread != event_loop_thread
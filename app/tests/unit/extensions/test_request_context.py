@@ -0,0 +1,42 @@
+from src.extensions.request_context import (
+    RequestErrors,
+    current_request_errors,
+    finish_request,
+    start_request,
+)
+
+
+def test_request_errors_records_each_exception_once():
+    """
+    Tests if an exception recorded by many layers is stored once, with the
+    information of every layer.
+    """
+    request_errors = RequestErrors("request_id")
+    error = ValueError("Something went wrong")
+    request_errors.record(error, {"layer": "service"})
+    request_errors.record(error, {"layer": "controller"})
+
+    assert request_errors.errors == [
+        (error, [{"layer": "service"}, {"layer": "controller"}])
+    ]
+
+
+def test_request_errors_is_empty_without_errors():
+    """
+    Tests if a request without errors is falsy.
+    """
+    assert not RequestErrors("request_id")
+
+
+def test_start_and_finish_request():
+    """
+    Tests if the errors of a request are only available between the start
+    and the finish of the request.
+    """
+    assert current_request_errors() is None
+
+    token = start_request("request_id")
+    assert current_request_errors().request_id == "request_id"
+
+    finish_request(token)
+    assert current_request_errors() is None
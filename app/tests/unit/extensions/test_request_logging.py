@@ -0,0 +1,61 @@
+from src.extensions.request_logging import ErrorLogSampler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_error_log_sampler_allows_burst_per_window():
+    """
+    Tests if only the first records of a signature are allowed within a
+    window.
+    """
+    sampler = ErrorLogSampler(window=60, burst=2, clock=FakeClock())
+
+    assert [sampler.allow("signature")[0] for _ in range(4)] == [
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_error_log_sampler_reports_suppressed_on_next_window():
+    """
+    Tests if the first record of the next window reports how many records
+    were suppressed.
+    """
+    clock = FakeClock()
+    sampler = ErrorLogSampler(window=60, burst=1, clock=clock)
+    for _ in range(3):
+        sampler.allow("signature")
+
+    clock.now = 60
+    assert sampler.allow("signature") == (True, 2)
+
+
+def test_error_log_sampler_signatures_are_independent():
+    """
+    Tests if different signatures are sampled independently.
+    """
+    sampler = ErrorLogSampler(window=60, burst=1, clock=FakeClock())
+
+    assert sampler.allow("signature_1") == (True, 0)
+    assert sampler.allow("signature_2") == (True, 0)
+
+
+def test_error_log_sampler_forgets_least_recent_signatures():
+    """
+    Tests if the number of signatures tracked is bounded.
+    """
+    sampler = ErrorLogSampler(
+        window=60, burst=1, max_signatures=1, clock=FakeClock()
+    )
+    sampler.allow("signature_1")
+    sampler.allow("signature_2")
+
+    assert sampler.allow("signature_1") == (True, 0)
@@ -0,0 +1,108 @@
+import pytest
+
+from src.extensions.result_cache import ResultCache
+
+
+def test_init_with_negative_values():
+    """
+    Test if a ValueError is raised when the maximum size or the time to live
+    is negative.
+    """
+    with pytest.raises(ValueError):
+        ResultCache(max_size=-1)
+    with pytest.raises(ValueError):
+        ResultCache(max_size=1, ttl=-1)
+
+
+def test_get_counts_hits_and_misses():
+    """
+    Test if the lookups that find a result are counted as hits and the ones
+    that do not are counted as misses.
+    """
+    cache = ResultCache(max_size=2)
+    cache.put("room", "result")
+
+    assert cache.get("room") == "result"
+    assert cache.get("other", "default") == "default"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_put_evicts_least_recently_used():
+    """
+    Test if the least recently used result is evicted when the cache is
+    full.
+    """
+    cache = ResultCache(max_size=2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+    cache.get("first")
+    cache.put("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_peek_keeps_counters_and_order():
+    """
+    Test if peeking at a result neither counts the lookup nor marks the
+    result as used.
+    """
+    cache = ResultCache(max_size=2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+
+    assert cache.peek("first") == 1
+    assert cache.peek("third", "default") == "default"
+    cache.put("third", 3)
+
+    assert cache.peek("first") is None
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_get_expires_results_after_ttl():
+    """
+    Test if a result is no longer returned after its time to live.
+    """
+    now = [0.0]
+    cache = ResultCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.put("room", "result")
+
+    now[0] = 9.9
+    assert cache.get("room") == "result"
+    now[0] = 10.0
+    assert cache.get("room") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_put_with_max_size_zero_keeps_nothing():
+    """
+    Test if a cache with a maximum size of 0 keeps no result.
+    """
+    cache = ResultCache(max_size=0)
+    cache.put("room", "result")
+
+    assert cache.get("room") is None
+    assert len(cache) == 0
+
+
+def test_items_returns_entries_not_expired():
+    """
+    Test if the items are returned from the least to the most recently
+    used, without the expired ones and without marking them as used.
+    """
+    now = [0.0]
+    cache = ResultCache(max_size=3, ttl=10, clock=lambda: now[0])
+    cache.put("expired", 0)
+    now[0] = 5.0
+    cache.put("first", 1)
+    cache.put("second", 2)
+    cache.get("first")
+    now[0] = 10.0
+
+    assert cache.items() == [("second", 2), ("first", 1)]
+    assert cache.stats()["hits"] == 1
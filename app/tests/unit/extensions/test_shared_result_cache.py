@@ -0,0 +1,143 @@
+import multiprocessing
+
+import pytest
+
+from src.extensions.shared_result_cache import (
+    _ENTRY,
+    _SEQUENCE,
+    SharedResultCache,
+)
+
+
+def _put_in_another_process(path: str) -> None:
+    cache = SharedResultCache(path, slots=8, slot_bytes=64)
+    cache.put(("room", 1), b"from another process")
+    cache.close()
+
+
+def test_init_with_invalid_sizes(tmp_path):
+    """
+    Test if a ValueError is raised when the number of slots or probes is
+    not positive, or the slots can not hold any value.
+    """
+    path = str(tmp_path / "results")
+    with pytest.raises(ValueError):
+        SharedResultCache(path, slots=0, slot_bytes=64)
+    with pytest.raises(ValueError):
+        SharedResultCache(path, slots=8, slot_bytes=24)
+    with pytest.raises(ValueError):
+        SharedResultCache(path, slots=8, slot_bytes=64, max_probes=0)
+
+
+def test_get_counts_hits_and_misses(tmp_path):
+    """
+    Test if the stored values are found, and the lookups are counted.
+    """
+    cache = SharedResultCache(str(tmp_path / "results"), 8, 64)
+    cache.put(("room", 1), b"result")
+    cache.put(("room", 1), b"new result")
+
+    assert cache.get(("room", 1)) == b"new result"
+    assert cache.get(("room", 2), b"default") == b"default"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["stores"] == 2
+
+
+def test_peek_does_not_count_lookups(tmp_path):
+    """
+    Test if peeking at a value does not count the lookup.
+    """
+    cache = SharedResultCache(str(tmp_path / "results"), 8, 64)
+    cache.put(("room", 1), b"result")
+
+    assert cache.peek(("room", 1)) == b"result"
+    assert cache.peek(("room", 2), b"default") == b"default"
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_put_skips_oversized_values(tmp_path):
+    """
+    Test if a value longer than a slot is not stored.
+    """
+    cache = SharedResultCache(str(tmp_path / "results"), 8, 64)
+    cache.put("room", bytes(41))
+
+    assert cache.get("room") is None
+    assert cache.stats()["oversized"] == 1
+
+
+def test_get_discards_torn_slots(tmp_path):
+    """
+    Test if a slot whose length is larger than the slot, or which is being
+    written, is read as a miss instead of being sliced out of the table.
+    """
+    cache = SharedResultCache(str(tmp_path / "results"), 8, 64)
+    cache.put("room", b"result")
+    offset = next(cache._probe(cache._digest("room")))
+    digest, _ = _ENTRY.unpack_from(cache._mmap, offset + _SEQUENCE.size)
+
+    _ENTRY.pack_into(cache._mmap, offset + _SEQUENCE.size, digest, 1 << 20)
+    assert cache.get("room") is None
+
+    _ENTRY.pack_into(cache._mmap, offset + _SEQUENCE.size, digest, 6)
+    (sequence,) = _SEQUENCE.unpack_from(cache._mmap, offset)
+    _SEQUENCE.pack_into(cache._mmap, offset, sequence + 1)
+    assert cache.get("room") is None
+
+    _SEQUENCE.pack_into(cache._mmap, offset, sequence + 2)
+    assert cache.get("room") == b"result"
+    assert cache.stats()["misses"] == 2
+
+
+def test_put_overwrites_home_slot_when_probes_are_taken(tmp_path):
+    """
+    Test if the table stays bounded, evicting a value when every slot
+    probed for a key is taken by other keys.
+    """
+    cache = SharedResultCache(str(tmp_path / "results"), 4, 64)
+    for key in range(5):
+        cache.put(key, str(key).encode())
+
+    assert cache.get(4) == b"4"
+    assert sum(cache.get(key) is not None for key in range(5)) == 4
+    assert cache.stats()["evictions"] == 1
+
+
+def test_namespaces_do_not_share_values(tmp_path):
+    """
+    Test if the values stored in a namespace, such as the version of the
+    rules, are not found from another namespace of the same file.
+    """
+    path = str(tmp_path / "results")
+    SharedResultCache(path, 8, 64, namespace="v1").put("room", b"v1")
+
+    assert SharedResultCache(path, 8, 64, namespace="v2").get("room") is None
+    assert SharedResultCache(path, 8, 64, namespace="v1").get("room") == b"v1"
+
+
+def test_reset_when_geometry_changes(tmp_path):
+    """
+    Test if a file created with other slots is reset when it is opened.
+    """
+    path = str(tmp_path / "results")
+    SharedResultCache(path, 8, 64).put("room", b"result")
+
+    assert SharedResultCache(path, 16, 64).get("room") is None
+
+
+def test_values_are_shared_between_processes(tmp_path):
+    """
+    Test if a value stored by another process is found by this one.
+    """
+    path = str(tmp_path / "results")
+    cache = SharedResultCache(path, slots=8, slot_bytes=64)
+
+    process = multiprocessing.get_context("spawn").Process(
+        target=_put_in_another_process, args=(path,)
+    )
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    assert cache.get(("room", 1)) == b"from another process"
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+
+import pytest
+
+from src.extensions.single_flight import SingleFlight
+
+
+def test_do_runs_the_function():
+    """
+    Tests if a call without another one in flight runs the function, and
+    the key is forgotten once it finishes.
+    """
+    single_flight = SingleFlight()
+
+    assert single_flight.do("room", lambda: 42) == (42, False)
+    assert single_flight.do("room", lambda: 43) == (43, False)
+    assert single_flight.stats() == {
+        "executed": 2,
+        "coalesced": 0,
+        "in_flight": 0,
+    }
+
+
+def test_do_coalesces_identical_calls_in_flight():
+    """
+    Tests if the calls for a key in flight wait for its result instead of
+    running the function again, while calls for other keys run.
+    """
+    single_flight = SingleFlight()
+    release = Event()
+    calls = []
+
+    def calculate(key):
+        calls.append(key)
+        release.wait()
+        return key * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(single_flight.do, key, lambda k=key: calculate(k))
+            for key in [1] * 6 + [2]
+        ]
+        while single_flight.stats()["coalesced"] < 5 or len(calls) < 2:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert sorted(calls) == [1, 2]
+    assert sorted(result for result, _ in results) == [2] * 6 + [4]
+    assert sum(shared for _, shared in results) == 5
+    assert single_flight.stats() == {
+        "executed": 2,
+        "coalesced": 5,
+        "in_flight": 0,
+    }
+
+
+def test_do_raises_the_error_to_every_call():
+    """
+    Tests if the exception of a call in flight is raised to the calls that
+    waited for it.
+    """
+    single_flight = SingleFlight()
+    barrier = Barrier(2)
+
+    def fail():
+        barrier.wait()
+        while single_flight.stats()["coalesced"] < 1:
+            pass
+        raise ValueError("inconsistent room")
+
+    def call():
+        return single_flight.do("room", fail)
+
+    def wait_and_call():
+        barrier.wait()
+        return single_flight.do("room", fail)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(call), executor.submit(wait_and_call)]
+        errors = []
+        for future in futures:
+            with pytest.raises(ValueError) as error:
+                future.result()
+            errors.append(error.value)
+
+    assert single_flight.stats()["in_flight"] == 0
+    assert errors[0] is not errors[1]
+    assert errors[0].args == errors[1].args == ("inconsistent room",)
+    assert sum(error.__cause__ in errors for error in errors) == 1
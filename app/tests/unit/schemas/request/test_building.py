@@ -0,0 +1,59 @@
+import pytest
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.schemas.request.building import Building
+from src.schemas.request.room import Room
+
+
+def test_valid_building(valid_room, invalid_room_dimensions):
+    """
+    Test to verify if each floor of the building is parsed into a Floor
+    model, and the rooms of every floor are listed floor by floor
+    """
+    building = Building(
+        floors=[
+            {"rooms": [valid_room, invalid_room_dimensions]},
+            {"rooms": [valid_room]},
+        ]
+    )
+
+    assert len(building.floors) == 2
+    assert building.rooms == [
+        Room(**valid_room),
+        Room(**invalid_room_dimensions),
+        Room(**valid_room),
+    ]
+
+
+@pytest.mark.parametrize("floors", [[], [{"rooms": []}]])
+def test_empty_building(floors):
+    """
+    Test to verify if a building without floors, or with a floor without
+    rooms, is rejected
+    """
+    with pytest.raises(ValidationError):
+        Building(floors=floors)
+
+
+def test_oversized_building(valid_room):
+    """
+    Test to verify if a building with more rooms than the configured maximum
+    on all its floors is rejected
+    """
+    rooms = [valid_room] * (ApiConfig.BATCH_MAX_ROOMS // 2 + 1)
+    with pytest.raises(ValidationError):
+        Building(floors=[{"rooms": rooms}, {"rooms": rooms}])
+
+
+def test_too_many_walls_building(valid_room, monkeypatch):
+    """
+    Test to verify if a building with more walls than the configured maximum
+    on all its floors is rejected, even with fewer rooms than the maximum
+    """
+    monkeypatch.setattr(
+        ApiConfig, "REQUEST_MAX_WALLS", len(valid_room["walls"])
+    )
+    Building(floors=[{"rooms": [valid_room]}])
+    with pytest.raises(ValidationError, match="walls"):
+        Building(floors=[{"rooms": [valid_room]}, {"rooms": [valid_room]}])
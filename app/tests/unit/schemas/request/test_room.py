@@ -1,5 +1,8 @@
+import pytest
+from pydantic import ValidationError
 from pytest import approx
 
+from config import ApiConfig
 from src.schemas.request.room import Room
 
 
@@ -31,3 +34,66 @@ def test_valid_doors_area(valid_room):
     validated_room = Room(**valid_room)
     doors_total_area = 4.56
     assert validated_room.doors_area == approx(doors_total_area)
+
+
+# ------------------------ canonical_key -------------------
+def test_canonical_key(valid_room):
+    """
+    Test to verify if rooms with the same walls have the same key, and
+    rooms with the walls in another order do not
+    """
+    validated_room = Room(**valid_room)
+    same_room = Room(**valid_room)
+    reversed_room = Room(walls=validated_room.walls[::-1])
+
+    assert validated_room.canonical_key == same_room.canonical_key
+    assert hash(validated_room.canonical_key) == hash(same_room.canonical_key)
+    assert len(validated_room.canonical_key) == 16
+    assert validated_room.canonical_key != reversed_room.canonical_key
+
+
+def test_canonical_key_does_not_grow_with_walls():
+    """
+    Test to verify if the key of a room is a digest of the same size for
+    any number of walls, also for amounts of doors too large to be packed
+    """
+    wall = {"width": 5, "height": 3, "number_doors": 0, "number_windows": 0}
+    many_walls = Room(walls=[wall] * ApiConfig.ROOM_MAX_WALLS)
+    many_doors = Room(walls=[{**wall, "number_doors": 2**70}])
+
+    assert len(many_walls.canonical_key) == 16
+    assert len(many_doors.canonical_key) == 16
+    assert many_walls.canonical_key != Room(walls=[wall]).canonical_key
+
+
+# ------------------------ walls -------------------
+def test_room_with_any_number_of_walls(valid_room):
+    """
+    Test to verify if a room accepts any number of walls up to the
+    configured maximum, and sums the areas of all of them
+    """
+    wall = valid_room["walls"][0]
+    validated_room = Room(walls=[wall] * 12)
+
+    assert isinstance(validated_room.walls, tuple)
+    assert len(validated_room.walls) == 12
+    assert validated_room.walls_area == approx(12 * 35.0)
+    assert Room(walls=[wall]).walls_area == approx(35.0)
+
+
+def test_room_without_walls():
+    """
+    Test to verify if a room without walls is rejected
+    """
+    with pytest.raises(ValidationError):
+        Room(walls=[])
+
+
+def test_room_with_too_many_walls(valid_room):
+    """
+    Test to verify if a room with more walls than the configured maximum is
+    rejected
+    """
+    wall = valid_room["walls"][0]
+    with pytest.raises(ValidationError):
+        Room(walls=[wall] * (ApiConfig.ROOM_MAX_WALLS + 1))
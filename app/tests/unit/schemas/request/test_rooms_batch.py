@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+
+from config import ApiConfig
+from src.schemas.request.room import Room
+from src.schemas.request.rooms_batch import RoomsBatch
+
+
+def test_valid_rooms_batch(valid_room):
+    """
+    Test to verify if each room of the batch is parsed into a Room model
+    """
+    rooms_batch = RoomsBatch(rooms=[valid_room, valid_room])
+    assert rooms_batch.rooms == [Room(**valid_room), Room(**valid_room)]
+
+
+def test_empty_rooms_batch():
+    """
+    Test to verify if an empty batch is rejected
+    """
+    with pytest.raises(ValidationError):
+        RoomsBatch(rooms=[])
+
+
+def test_oversized_rooms_batch(valid_room):
+    """
+    Test to verify if a batch larger than the configured maximum is rejected
+    """
+    with pytest.raises(ValidationError):
+        RoomsBatch(rooms=[valid_room] * (ApiConfig.BATCH_MAX_ROOMS + 1))
+
+
+def test_too_many_walls_rooms_batch(valid_room, monkeypatch):
+    """
+    Test to verify if a batch with more walls than the configured maximum on
+    all its rooms is rejected, even with fewer rooms than the maximum
+    """
+    monkeypatch.setattr(
+        ApiConfig, "REQUEST_MAX_WALLS", len(valid_room["walls"])
+    )
+    RoomsBatch(rooms=[valid_room])
+    with pytest.raises(ValidationError, match="walls"):
+        RoomsBatch(rooms=[valid_room, valid_room])
@@ -0,0 +1,55 @@
+from src.schemas.request.room import Room
+from src.schemas.room_geometry import RoomGeometry, WallGeometry
+from src.schemas.wall import Wall
+
+
+# ------------------------ WallGeometry -------------------
+def test_wall_geometry_from_wall():
+    """
+    Test to verify if the measures of a wall are the same of the Wall
+    properties
+    """
+    wall = Wall(width=7, height=5, number_doors=1, number_windows=2)
+    geometry = WallGeometry.from_wall(wall)
+
+    assert geometry.area == wall.area
+    assert geometry.windows_area == wall.windows_area
+    assert geometry.doors_area == wall.doors_area
+    assert geometry.openings_area == wall.windows_area + wall.doors_area
+    assert geometry.openings_width == (
+        2 * wall.window.width + 1 * wall.door.width
+    )
+    assert geometry.free_area == wall.area - geometry.openings_area
+
+
+# ------------------------ RoomGeometry -------------------
+def test_room_geometry_from_walls(valid_room):
+    """
+    Test to verify if the totals of a room are the same of the sums of the
+    Wall properties, in the same order
+    """
+    room = Room(**valid_room)
+    geometry = RoomGeometry.from_walls(room.walls)
+    walls_area = sum(wall.area for wall in room.walls)
+    windows_area = sum(wall.windows_area for wall in room.walls)
+    doors_area = sum(wall.doors_area for wall in room.walls)
+
+    assert len(geometry.walls) == len(room.walls)
+    assert geometry.walls_area == walls_area
+    assert geometry.windows_area == windows_area
+    assert geometry.doors_area == doors_area
+    assert geometry.free_area == walls_area - (windows_area + doors_area)
+
+
+def test_room_geometry_computed_once(valid_room):
+    """
+    Test to verify if the geometry is computed when the room is validated
+    and reused afterwards, and computed on demand for rooms built without
+    validation
+    """
+    room = Room(**valid_room)
+    constructed_room = Room.construct(walls=room.walls)
+
+    assert room.geometry is room.geometry
+    assert room.walls_area == room.geometry.walls_area
+    assert constructed_room.geometry == room.geometry
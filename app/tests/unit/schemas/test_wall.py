@@ -95,3 +95,15 @@ def test_no_doors():
     """
     wall = Wall(width=1, height=1, number_doors=0, number_windows=0)
     assert isinstance(wall, Wall)
+
+
+# ------------------------ canonical_key -----------------------------
+def test_canonical_key():
+    """
+    Test to verify if walls with the same dimensions have the same key
+    """
+    wall = Wall(width=5, height=2.5, number_doors=1)
+    same_wall = Wall(width=5.0, height=2.5, number_doors=1, number_windows=0)
+
+    assert wall.canonical_key == (5.0, 2.5, 1, 0)
+    assert wall.canonical_key == same_wall.canonical_key
@@ -0,0 +1,241 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from src.services.can_allocation import (
+    AllocationStrategy,
+    CheapestPaintCansAllocator,
+    ExactPaintCansAllocator,
+    GreedyPaintCansAllocator,
+)
+
+SIZES_IN_LITERS = (0.5, 2.5, 3.6, 18)
+SIZES_IN_DECILITERS = (180, 36, 25, 5)
+PRICES = {0.5: 12.9, 2.5: 49.9, 3.6: 64.9, 18: 259.9}
+PRICES_IN_CENTS = (25990, 6490, 4990, 1290)
+
+
+@pytest.fixture(scope="module")
+def allocator():
+    return ExactPaintCansAllocator(SIZES_IN_LITERS, 5, max_area=1000)
+
+
+@pytest.fixture(scope="module")
+def cheapest_allocator():
+    return CheapestPaintCansAllocator(PRICES, 5, max_area=1000)
+
+
+def brute_force_counts(needed, score):
+    """
+    Finds the best score of the cans that cover the needed deciliters by
+    trying every combination.
+    """
+    best = None
+    for counts in product(
+        *(range(needed // size + 2) for size in SIZES_IN_DECILITERS)
+    ):
+        total = sum(c * s for c, s in zip(counts, SIZES_IN_DECILITERS))
+        if total < needed:
+            continue
+        if best is None or score(counts, total) < best:
+            best = score(counts, total)
+    return best
+
+
+def price_in_cents(counts):
+    return sum(c * p for c, p in zip(counts, PRICES_IN_CENTS))
+
+
+def test_init_with_invalid_arguments():
+    """
+    Tests if a ValueError is raised for sizes that are not positive
+    multiples of 1mL and for a maximum area that is not positive.
+    """
+    with pytest.raises(ValueError):
+        ExactPaintCansAllocator((0.5, 0.2505), 5, max_area=10)
+    with pytest.raises(ValueError):
+        ExactPaintCansAllocator((0.5, 0), 5, max_area=10)
+    with pytest.raises(ValueError):
+        ExactPaintCansAllocator(SIZES_IN_LITERS, 5, max_area=0)
+
+
+def test_init_with_too_large_table():
+    """
+    Tests if a ValueError is raised, before the table is built, for sizes
+    whose allocation table is larger than the configured maximum.
+    """
+    with pytest.raises(ValueError, match="allocation table"):
+        ExactPaintCansAllocator((0.946, 3.785), 5, max_area=10)
+    with pytest.raises(ValueError, match="allocation table"):
+        CheapestPaintCansAllocator({0.946: 10, 3.785: 30}, 5, max_area=10)
+
+
+def test_exact_counts_with_other_sizes():
+    """
+    Tests if the cans of a catalog with other sizes are optimal, inside and
+    above the table.
+    """
+    sizes = (0.9, 2.2, 4.5)
+    small = ExactPaintCansAllocator(sizes, 8, max_area=1)
+    larger = ExactPaintCansAllocator(sizes, 8, max_area=20000)
+
+    for free_area in np.random.default_rng(4).uniform(0, 20000, 500):
+        assert small.counts(free_area) == larger.counts(free_area)
+
+
+def test_greedy_paint_cans():
+    """
+    Tests if the greedy allocation prefers the largest cans and adds an
+    extra can of the smallest size for the area left.
+    """
+    allocator = GreedyPaintCansAllocator(SIZES_IN_LITERS, 5)
+
+    assert allocator.paint_cans(125.84) == {18: 1, 3.6: 1, 2.5: 1, 0.5: 3}
+    assert allocator.counts_many(np.array([125.84, 10.0])).tolist() == [
+        [1, 1, 1, 3],
+        [0, 0, 0, 4],
+    ]
+    with pytest.raises(ValueError):
+        GreedyPaintCansAllocator((), 5)
+
+
+def test_allocation_strategy_values():
+    """
+    Tests if the allocation strategies are parsed from their names.
+    """
+    assert AllocationStrategy("greedy") is AllocationStrategy.GREEDY
+    assert AllocationStrategy("exact") is AllocationStrategy.EXACT
+
+
+def test_paint_cans(allocator):
+    """
+    Tests if the paint cans are ordered from the largest size and cover the
+    area without paint left over when possible.
+    """
+    assert allocator.paint_cans(125.84) == {18: 1, 3.6: 2, 2.5: 0, 0.5: 0}
+    assert allocator.paint_cans(12.5) == {18: 0, 3.6: 0, 2.5: 1, 0.5: 0}
+    assert allocator.paint_cans(0) == {18: 0, 3.6: 0, 2.5: 0, 0.5: 0}
+
+
+def test_counts_are_optimal(allocator):
+    """
+    Tests if the cans chosen leave the least paint over and, among those,
+    are the fewest, for every volume up to a few 18L cans.
+    """
+    for needed in range(0, 200, 3):
+        counts = allocator.counts(needed / 2)
+        total = sum(c * s for c, s in zip(counts, SIZES_IN_DECILITERS))
+
+        assert (total - needed, sum(counts)) == brute_force_counts(
+            needed, lambda counts, total: (total - needed, sum(counts))
+        )
+
+
+def test_counts_ignore_floating_point_noise(allocator):
+    """
+    Tests if an area that only misses a multiple of the can sizes by
+    floating point noise does not need an extra can.
+    """
+    assert allocator.counts(0.1 + 0.2 + 89.7) == (1, 0, 0, 0)
+
+
+def test_counts_above_the_table(allocator):
+    """
+    Tests if the areas above the table, reduced by full 18L cans, get the
+    same cans of a table that covers them.
+    """
+    larger = ExactPaintCansAllocator(SIZES_IN_LITERS, 5, max_area=40000)
+    free_areas = np.random.default_rng(0).uniform(15000, 40000, 2000)
+
+    for free_area in free_areas.tolist():
+        assert allocator.counts(free_area) == larger.counts(free_area)
+
+
+def test_counts_many_matches_counts(allocator):
+    """
+    Tests if each row of counts_many is the same returned by counts, inside
+    and above the table.
+    """
+    free_areas = np.concatenate(
+        (
+            np.random.default_rng(1).uniform(0, 40000, 2000),
+            np.arange(0, 100, 0.5),
+        )
+    )
+    counts = allocator.counts_many(free_areas)
+
+    assert counts.shape == (free_areas.shape[0], 4)
+    for free_area, row in zip(free_areas.tolist(), counts.tolist()):
+        assert tuple(row) == allocator.counts(free_area)
+
+
+# ---------------------------   cheapest    ------------------------
+
+
+def test_cheapest_init_with_invalid_prices():
+    """
+    Tests if a ValueError is raised for prices that are not positive.
+    """
+    with pytest.raises(ValueError):
+        CheapestPaintCansAllocator({0.5: 0, 18: 10}, 5, max_area=10)
+    with pytest.raises(ValueError):
+        CheapestPaintCansAllocator({}, 5, max_area=10)
+
+
+def test_cheapest_paint_cans(cheapest_allocator):
+    """
+    Tests if a larger can is bought when it is cheaper than the smaller
+    cans that cover the same area.
+    """
+    assert cheapest_allocator.paint_cans(10) == {
+        18: 0,
+        3.6: 0,
+        2.5: 1,
+        0.5: 0,
+    }
+    assert cheapest_allocator.paint_cans(80) == {
+        18: 1,
+        3.6: 0,
+        2.5: 0,
+        0.5: 0,
+    }
+    assert cheapest_allocator.price({18: 1, 3.6: 2}) == 389.7
+
+
+def test_cheapest_counts_are_optimal(cheapest_allocator):
+    """
+    Tests if the cans chosen are the cheapest and, among those, leave the
+    least paint over, for every volume up to a few 18L cans.
+    """
+    for needed in range(0, 200, 3):
+        counts = cheapest_allocator.counts(needed / 2)
+        total = sum(c * s for c, s in zip(counts, SIZES_IN_DECILITERS))
+
+        assert (price_in_cents(counts), total) == brute_force_counts(
+            needed, lambda counts, total: (price_in_cents(counts), total)
+        )
+
+
+def test_cheapest_counts_above_the_table(cheapest_allocator):
+    """
+    Tests if the areas above the table, reduced by the cans with the lowest
+    price per liter, get the same cans of a table that covers them.
+    """
+    larger = CheapestPaintCansAllocator(PRICES, 5, max_area=40000)
+    free_areas = np.random.default_rng(2).uniform(15000, 40000, 2000)
+
+    for free_area in free_areas.tolist():
+        assert cheapest_allocator.counts(free_area) == larger.counts(free_area)
+
+
+def test_cheapest_counts_many_matches_counts(cheapest_allocator):
+    """
+    Tests if each row of counts_many is the same returned by counts, inside
+    and above the table.
+    """
+    free_areas = np.random.default_rng(3).uniform(0, 40000, 2000)
+    counts = cheapest_allocator.counts_many(free_areas)
+
+    for free_area, row in zip(free_areas.tolist(), counts.tolist()):
+        assert tuple(row) == cheapest_allocator.counts(free_area)
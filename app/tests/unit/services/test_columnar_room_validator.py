@@ -0,0 +1,108 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.schemas.request.room import Room
+from src.services.columnar_room_validator import ColumnarRoomValidator
+from src.services.exception import InvalidRoomDimensionError
+from src.services.room_validator import RoomValidator
+
+
+# ------------------------------- init ---------------------------
+def test_init_with_invalid_rooms():
+    """
+    Tests if TypeError is raised when any of the rooms is not an instance
+    of the Room class.
+    """
+    with pytest.raises(TypeError):
+        ColumnarRoomValidator.from_rooms(["not a room"])
+
+
+def test_init_with_columns_of_different_length():
+    """
+    Tests if ValueError is raised when the wall columns do not have the
+    same length.
+    """
+    with pytest.raises(ValueError):
+        ColumnarRoomValidator([1.0, 2.0], [1.0], [0], [0], [0, 2])
+
+
+def test_init_with_offsets_not_covering_walls():
+    """
+    Tests if ValueError is raised when the room offsets do not cover all
+    walls.
+    """
+    with pytest.raises(ValueError):
+        ColumnarRoomValidator([1.0, 2.0], [1.0, 2.0], [0, 0], [0, 0], [0, 1])
+
+
+# ------------------------ invalid_dimensions_values -------------------------
+def test_invalid_dimensions_values(
+    validated_room,
+    validated_room_inconsistent_dimensions,
+    expected_fail_to_process_dimensions,
+):
+    """
+    Tests if the errors of each room are the same errors reported by
+    RoomValidator, and an empty dict for a room with consistent dimensions.
+    """
+    columnar_validator = ColumnarRoomValidator.from_rooms(
+        [validated_room, validated_room_inconsistent_dimensions]
+    )
+    assert columnar_validator.invalid_dimensions_values() == [
+        {},
+        expected_fail_to_process_dimensions,
+    ]
+
+
+def test_invalid_dimensions_values_matches_room_validator():
+    """
+    Tests if the errors of randomly generated rooms are exactly the same
+    errors reported by RoomValidator.
+    """
+    generator = random.Random(0)
+    rooms = [
+        Room(
+            walls=[
+                {
+                    "width": generator.choice([0.1, 1.5, 2.6, 7, 12.3]),
+                    "height": generator.choice([0.1, 1.2, 2.2, 5, 9.9]),
+                    "number_doors": generator.randint(0, 3),
+                    "number_windows": generator.randint(0, 3),
+                }
+                for _ in range(4)
+            ]
+        )
+        for _ in range(100)
+    ]
+
+    expected = []
+    for room in rooms:
+        try:
+            RoomValidator(room).validate_dimensions()
+            expected.append({})
+        except InvalidRoomDimensionError as error:
+            expected.append(error.args[0])
+
+    columnar_validator = ColumnarRoomValidator.from_rooms(rooms)
+    assert columnar_validator.invalid_dimensions_values() == expected
+    assert columnar_validator.validate_dimensions().tolist() == [
+        not errors for errors in expected
+    ]
+
+
+# ---------------------------- validate_dimensions ---------------------------
+def test_validate_dimensions(
+    validated_room, validated_room_inconsistent_dimensions
+):
+    """
+    Tests if validate_dimensions returns True only for rooms with
+    consistent dimensions.
+    """
+    columnar_validator = ColumnarRoomValidator.from_rooms(
+        [validated_room, validated_room_inconsistent_dimensions]
+    )
+    assert np.array_equal(
+        columnar_validator.validate_dimensions(), [True, False]
+    )
@@ -0,0 +1,262 @@
+import json
+import os
+import time
+
+import numpy as np
+import pytest
+
+from src.schemas.paint_can_catalog import PaintCanCatalog
+from src.services.can_allocation import AllocationStrategy
+from src.services.exception import (
+    UnavailableAllocationError,
+    UnknownPaintCanCatalogError,
+)
+from src.services.paint_can_catalog import (
+    DEFAULT_CATALOG_ID,
+    CompiledPaintCanCatalog,
+    PaintCanCatalogRegistry,
+    load_paint_can_catalogs,
+)
+
+CATALOGS = {
+    "catalogs": {
+        "eu": {
+            "coverage_per_m2": 8,
+            "cans": [
+                {"size": 0.75, "price": 9.5},
+                {"size": 2.5, "price": 24},
+                {"size": 10, "price": 80},
+            ],
+        },
+        "basic": {"coverage_per_m2": 5, "cans": [{"size": 1}, {"size": 5}]},
+    }
+}
+
+
+def write_catalogs(path, catalogs, mtime_ns=None):
+    path.write_text(json.dumps(catalogs))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture(scope="function")
+def catalogs_file(tmp_path):
+    path = tmp_path / "catalogs.json"
+    write_catalogs(path, CATALOGS, mtime_ns=1_000_000_000)
+    return path
+
+
+# ------------------------ CompiledPaintCanCatalog ---------------------
+def test_compile():
+    """
+    Tests if a catalog is compiled into the allocators of every strategy,
+    with its sizes ordered from the largest.
+    """
+    catalog = CompiledPaintCanCatalog.compile(
+        "eu", PaintCanCatalog.parse_obj(CATALOGS["catalogs"]["eu"]), 100
+    )
+
+    assert catalog.id == "eu"
+    assert catalog.sizes == (10, 2.5, 0.75)
+    assert catalog.paint_cans(80, AllocationStrategy.GREEDY) == {
+        10: 1,
+        2.5: 0,
+        0.75: 0,
+    }
+    assert catalog.paint_cans(16, AllocationStrategy.EXACT) == {
+        10: 0,
+        2.5: 0,
+        0.75: 3,
+    }
+    assert catalog.counts_many(
+        np.array([16]), AllocationStrategy.CHEAPEST
+    ).tolist() == [[0, 1, 0]]
+
+
+def test_compile_without_prices():
+    """
+    Tests if the CHEAPEST allocation is not available for a catalog without
+    prices.
+    """
+    catalog = CompiledPaintCanCatalog.compile(
+        "basic", PaintCanCatalog.parse_obj(CATALOGS["catalogs"]["basic"]), 100
+    )
+
+    assert catalog.prices is None
+    with pytest.raises(UnavailableAllocationError):
+        catalog.paint_cans(10, AllocationStrategy.CHEAPEST)
+
+
+def test_init_with_prices_of_other_sizes():
+    with pytest.raises(ValueError):
+        CompiledPaintCanCatalog("eu", (1, 5), 5, 100, {1: 2.0})
+
+
+def test_with_prices():
+    """
+    Tests if only the CHEAPEST allocation is built again for new prices, and
+    the key of the catalog changes with them.
+    """
+    catalog = CompiledPaintCanCatalog("eu", (1, 5), 5, 100, {1: 2.0, 5: 9.0})
+    repriced = catalog.with_prices({1: 1.0, 5: 9.0}, 100)
+
+    assert repriced.key != catalog.key
+    assert repriced.prices == ((5, 9.0), (1, 1.0))
+    assert repriced._allocators[AllocationStrategy.EXACT] is (
+        catalog._allocators[AllocationStrategy.EXACT]
+    )
+    assert repriced.paint_cans(25, AllocationStrategy.CHEAPEST) == {
+        5: 0,
+        1: 5,
+    }
+
+
+# ------------------------ load_paint_can_catalogs ---------------------
+def test_load_json_and_yaml(tmp_path, catalogs_file):
+    """
+    Tests if the same catalogs are loaded from JSON and YAML files.
+    """
+    yaml = pytest.importorskip("yaml")
+    yaml_file = tmp_path / "catalogs.yaml"
+    yaml_file.write_text(yaml.safe_dump(CATALOGS))
+
+    assert load_paint_can_catalogs(str(catalogs_file)) == (
+        load_paint_can_catalogs(str(yaml_file))
+    )
+    assert set(load_paint_can_catalogs(str(yaml_file))) == {"eu", "basic"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        json.dumps({"catalogs": {"eu": {"coverage_per_m2": 5, "cans": []}}}),
+        json.dumps(
+            {
+                "catalogs": {
+                    "eu": {
+                        "coverage_per_m2": 5,
+                        "cans": [{"size": 1, "price": 2}, {"size": 5}],
+                    }
+                }
+            }
+        ),
+        json.dumps(
+            {
+                "catalogs": {
+                    "eu": {
+                        "coverage_per_m2": 5,
+                        "cans": [{"size": 1}, {"size": 1}],
+                    }
+                }
+            }
+        ),
+        json.dumps(
+            {
+                "catalogs": {
+                    "us": {
+                        "coverage_per_m2": 5,
+                        "cans": [{"size": 0.946}, {"size": 3.785}],
+                    }
+                }
+            }
+        ),
+    ],
+)
+def test_load_invalid_catalogs(tmp_path, content):
+    """
+    Tests if a ValueError is raised for a file that is not JSON or has
+    invalid catalogs.
+    """
+    path = tmp_path / "catalogs.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError):
+        load_paint_can_catalogs(str(path))
+
+
+# ------------------------ PaintCanCatalogRegistry ---------------------
+def test_registry_without_file():
+    """
+    Tests if the built-in catalog is the only one selectable without a
+    catalogs file.
+    """
+    registry = PaintCanCatalogRegistry(path=None, max_area=100)
+
+    assert registry.get() is None
+    assert registry.get(DEFAULT_CATALOG_ID) is None
+    assert registry.reload_if_changed() is False
+    with pytest.raises(UnknownPaintCanCatalogError):
+        registry.get("eu")
+
+
+def test_registry_get(catalogs_file):
+    registry = PaintCanCatalogRegistry(
+        path=str(catalogs_file), max_area=100, default_id="eu"
+    )
+
+    assert registry.get().id == "eu"
+    assert registry.get("basic").id == "basic"
+    assert registry.get(DEFAULT_CATALOG_ID) is None
+    assert registry.stats() == {
+        "catalogs": ["basic", "eu"],
+        "reloads": 1,
+        "failures": 0,
+    }
+
+
+def test_registry_reload_if_changed(catalogs_file):
+    """
+    Tests if the catalogs are only compiled again when the file changes, and
+    swapped for new ones, keeping the catalogs selected before untouched.
+    """
+    registry = PaintCanCatalogRegistry(path=str(catalogs_file), max_area=100)
+    basic = registry.get("basic")
+
+    assert registry.reload_if_changed() is False
+
+    changed = {"catalogs": {"basic": {**CATALOGS["catalogs"]["basic"]}}}
+    changed["catalogs"]["basic"]["coverage_per_m2"] = 10
+    write_catalogs(catalogs_file, changed, mtime_ns=2_000_000_000)
+
+    assert registry.reload_if_changed() is True
+    assert registry.get("basic") is not basic
+    assert registry.get("basic").key != basic.key
+    assert basic.paint_cans(10, AllocationStrategy.GREEDY) == {5: 0, 1: 2}
+    with pytest.raises(UnknownPaintCanCatalogError):
+        registry.get("eu")
+
+
+def test_registry_keeps_catalogs_on_failure(catalogs_file):
+    """
+    Tests if a file that fails to load is counted and the catalogs already
+    loaded are kept, until the file changes again.
+    """
+    registry = PaintCanCatalogRegistry(path=str(catalogs_file), max_area=100)
+    eu = registry.get("eu")
+
+    catalogs_file.write_text("not json")
+    os.utime(catalogs_file, ns=(3_000_000_000, 3_000_000_000))
+
+    assert registry.reload_if_changed() is False
+    assert registry.reload_if_changed() is False
+    assert registry.get("eu") is eu
+    assert registry.stats()["failures"] == 1
+
+
+def test_registry_polling(catalogs_file):
+    """
+    Tests if the polling thread reloads the catalogs file when it changes.
+    """
+    registry = PaintCanCatalogRegistry(path=str(catalogs_file), max_area=100)
+    registry.start_polling(0.01)
+    try:
+        write_catalogs(catalogs_file, {"catalogs": {}}, mtime_ns=4_000_000_000)
+        deadline = time.monotonic() + 5
+        while registry.stats()["reloads"] < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        registry.stop_polling()
+
+    assert registry.stats()["catalogs"] == []
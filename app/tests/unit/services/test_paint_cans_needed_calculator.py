@@ -1,5 +1,10 @@
+from unittest.mock import PropertyMock, patch
+
+import numpy as np
 import pytest
 
+from config import ApiConfig
+from src.services.can_allocation import AllocationStrategy
 from src.services.paint_cans_needed_calculator import PaintCansCalculator
 
 # --------------------------- constant attributes --------------------
@@ -73,3 +78,171 @@ def test_calculate_paint_cans_needed(
         paint_cans_calculator.calculate_paint_cans_needed()
         == expected_return_calculate_paint_cans_needed
     )
+
+
+# -------------------   paint_cans_for_free_area    ---------------------
+
+
+def test_paint_cans_for_free_area(
+    validated_room, expected_return_calculate_paint_cans_needed
+):
+    """
+    Tests if the paint cans needed for the free area of a room are the same
+    returned by calculate_paint_cans_needed for the room.
+    """
+    free_area = PaintCansCalculator(validated_room).room_free_area
+
+    assert (
+        PaintCansCalculator.paint_cans_for_free_area(free_area)
+        == expected_return_calculate_paint_cans_needed
+    )
+
+
+# ---------------------------   calculate_many    ------------------------
+
+
+def test_calculate_many(
+    validated_room, expected_return_calculate_paint_cans_needed
+):
+    """
+    Tests if each row returned by calculate_many builds the same paint cans
+    dict returned by calculate_paint_cans_needed for the same room.
+    """
+    paint_cans_calculator = PaintCansCalculator(validated_room)
+    paint_cans_needed = PaintCansCalculator.calculate_many(
+        np.array([paint_cans_calculator.room_free_area])
+    )
+
+    assert paint_cans_needed.shape == (1, 4)
+    assert (
+        PaintCansCalculator.paint_cans_from_counts(paint_cans_needed[0])
+        == expected_return_calculate_paint_cans_needed
+    )
+
+
+def test_calculate_many_matches_scalar_path(validated_room):
+    """
+    Tests if calculate_many is bit-identical to calculate_paint_cans_needed
+    for many free areas, including exact multiples of the can sizes.
+    """
+    generator = np.random.default_rng(0)
+    free_areas = np.concatenate(
+        (
+            generator.uniform(0.01, 2000, 5000),
+            np.arange(0.5, 500, 0.5),
+            [5 * 18, 5 * 3.6, 5 * 2.5, 5 * 0.5],
+        )
+    )
+    paint_cans_needed = PaintCansCalculator.calculate_many(free_areas)
+
+    for free_area, counts in zip(free_areas.tolist(), paint_cans_needed):
+        with patch.object(
+            PaintCansCalculator,
+            "room_free_area",
+            new_callable=PropertyMock,
+            return_value=free_area,
+        ):
+            expected = PaintCansCalculator(
+                validated_room
+            ).calculate_paint_cans_needed()
+        assert PaintCansCalculator.paint_cans_from_counts(counts) == expected
+
+
+# ---------------------------   allocation    ------------------------
+
+
+def test_init_with_invalid_allocation(validated_room):
+    """
+    Tests if a ValueError is raised for an unknown allocation strategy.
+    """
+    with pytest.raises(ValueError):
+        PaintCansCalculator(validated_room, "largest")
+
+
+def test_default_allocation(validated_room):
+    """
+    Tests if the allocation defaults to ApiConfig.PAINT_CANS_ALLOCATION.
+    """
+    with patch.object(ApiConfig, "PAINT_CANS_ALLOCATION", "exact"):
+        assert (
+            PaintCansCalculator(validated_room).allocation
+            is AllocationStrategy.EXACT
+        )
+
+
+def test_paint_cans_for_free_area_exact():
+    """
+    Tests if the exact allocation leaves no paint over where the greedy one
+    adds small cans.
+    """
+    assert PaintCansCalculator.paint_cans_for_free_area(125.84) == {
+        18: 1,
+        3.6: 1,
+        2.5: 1,
+        0.5: 3,
+    }
+    assert PaintCansCalculator.paint_cans_for_free_area(
+        125.84, AllocationStrategy.EXACT
+    ) == {18: 1, 3.6: 2, 2.5: 0, 0.5: 0}
+
+
+def test_calculate_many_exact(validated_room):
+    """
+    Tests if each row of the exact calculate_many builds the same paint cans
+    dict returned by calculate_paint_cans_needed with exact allocation.
+    """
+    paint_cans_calculator = PaintCansCalculator(
+        validated_room, AllocationStrategy.EXACT
+    )
+    paint_cans_needed = PaintCansCalculator.calculate_many(
+        np.array([paint_cans_calculator.room_free_area]), "exact"
+    )
+
+    assert (
+        PaintCansCalculator.paint_cans_from_counts(paint_cans_needed[0])
+        == paint_cans_calculator.calculate_paint_cans_needed()
+    )
+
+
+def test_paint_cans_for_free_area_cheapest():
+    """
+    Tests if the cheapest allocation buys a single 18L can where the greedy
+    one buys many smaller cans.
+    """
+    assert PaintCansCalculator.paint_cans_for_free_area(
+        80, AllocationStrategy.CHEAPEST
+    ) == {18: 1, 3.6: 0, 2.5: 0, 0.5: 0}
+
+
+def test_set_paint_can_prices():
+    """
+    Tests if the built-in catalog is only compiled again when the prices
+    change, and its results are keyed by the prices.
+    """
+    prices = dict(PaintCansCalculator._PAINT_CAN_PRICES)
+    catalog = PaintCansCalculator._default_catalog
+    key = PaintCansCalculator.allocation_key(AllocationStrategy.CHEAPEST)
+    try:
+        PaintCansCalculator.set_paint_can_prices(dict(prices))
+        assert PaintCansCalculator._default_catalog is catalog
+
+        PaintCansCalculator.set_paint_can_prices({**prices, 18: 1000})
+        assert PaintCansCalculator._default_catalog is not catalog
+        assert (
+            PaintCansCalculator.allocation_key(AllocationStrategy.CHEAPEST)
+            != key
+        )
+        assert PaintCansCalculator.paint_cans_for_free_area(
+            80, AllocationStrategy.CHEAPEST
+        ) == {18: 0, 3.6: 3, 2.5: 2, 0.5: 1}
+    finally:
+        PaintCansCalculator._default_catalog = catalog
+
+
+def test_set_paint_can_prices_with_invalid_catalog():
+    """
+    Tests if a ValueError is raised for a catalog without a price for each
+    paint can size.
+    """
+    with pytest.raises(ValueError):
+        PaintCansCalculator.set_paint_can_prices({18: 100})
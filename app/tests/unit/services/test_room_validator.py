@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 import pytest
 
+from src.schemas.room_geometry import WallGeometry
 from src.services.exception import (
     InsufficientWallFreeAreaError,
     InvalidRoomDimensionError,
@@ -9,6 +12,7 @@ from src.services.exception import (
     WallNotWiderThanDoorWindowError,
 )
 from src.services.room_validator import RoomValidator
+from src.services.validation_result import WallRule
 
 
 # ------------------------Class-level Attributes ---------------------------
@@ -99,27 +103,136 @@ def test_invalid_validate_dimensions_dict_errors(
         assert error.args[0] == expected_fail_to_process_dimensions
 
 
-# ---------------------- _validate_dimensions_looper -------------------------
-def test_raises__validate_dimensions_looper(validated_room):
+# ---------------------------- collect_failures ------------------------------
+def test_valid_collect_failures(validated_room):
     """
-    Tests if the method _validate_dimensions_looper() returns the expected
-      results for a given valid room.
+    Tests if the method collect_failures() returns an empty result when a
+    valid room is passed as input.
     """
     room_validator = RoomValidator(validated_room)
+    result = room_validator.collect_failures()
+    assert result.is_valid is True
+
+
+def test_invalid_collect_failures(
+    validated_room_inconsistent_dimensions, expected_fail_to_process_dimensions
+):
+    """
+    Tests if the method collect_failures() does not raise for a room with
+    inconsistent dimensions, and if its failures build the same errors
+    raised by validate_dimensions().
+    """
+    room_validator = RoomValidator(validated_room_inconsistent_dimensions)
+    result = room_validator.collect_failures()
+
+    assert result.is_valid is False
+    assert (
+        RoomValidator.format_invalid_dimensions_values(result)
+        == expected_fail_to_process_dimensions
+    )
+
+
+def test_collect_failures_reuses_result(
+    validated_room, validated_room_inconsistent_dimensions
+):
+    """
+    Tests if the method collect_failures() clears and reuses a given result.
+    """
+    result = RoomValidator(
+        validated_room_inconsistent_dimensions
+    ).collect_failures()
+
+    assert RoomValidator(validated_room).collect_failures(result) is result
+    assert result.is_valid is True
+
+
+# ---------------------------- wall_validation -------------------------------
+def test_wall_validation(validated_room_inconsistent_dimensions):
+    """
+    Tests if the method wall_validation() returns the failures of each rule
+    checked for a wall and the areas of the wall.
+    """
+    for wall in validated_room_inconsistent_dimensions.walls:
+        validation = RoomValidator.wall_validation(wall)
+        geometry = WallGeometry.from_wall(wall)
+        expected_failures = tuple(
+            (rule, getattr(RoomValidator, check)(wall, geometry))
+            for rule, check in RoomValidator._WALL_RULES
+            if getattr(RoomValidator, check)(wall, geometry) is not None
+        )
+
+        assert validation.failures == expected_failures
+        assert validation.area == wall.area
+        assert validation.windows_area == wall.windows_area
+        assert validation.doors_area == wall.doors_area
 
-    expected_results = [
-        (i, wall, method, ())
-        for i, wall in enumerate(room_validator._room.walls)
-        for method in [
-            room_validator.wall_area_within_given_area_range,
-            room_validator.wall_free_area_to_paint,
-            room_validator.wall_taller_than_door,
-            room_validator.wall_taller_than_window,
-            room_validator.wall_wider_than_amount_doors_windows,
+
+def test_wall_validation_is_memoized(validated_room):
+    """
+    Tests if the rules are checked once per wall dimensions, and rooms made
+    of walls seen before skip the rules entirely.
+    """
+    RoomValidator._walls_validations.clear()
+    wall = validated_room.walls[0]
+    stats = RoomValidator._walls_validations.stats()
+
+    first = RoomValidator.wall_validation(wall)
+    second = RoomValidator.wall_validation(wall.copy())
+
+    assert second is first
+    assert RoomValidator._walls_validations.stats()["hits"] == (
+        stats["hits"] + 1
+    )
+
+    RoomValidator(validated_room).collect_failures()
+    with patch.object(
+        RoomValidator,
+        "_wall_area_failure",
+        side_effect=AssertionError("rule checked again"),
+    ):
+        assert RoomValidator(validated_room).collect_failures().is_valid
+
+
+def test_wall_validation_failures_in_rule_order(
+    validated_room_inconsistent_dimensions,
+):
+    """
+    Tests if the failures of a wall are in the order of WallRule.
+    """
+    for wall in validated_room_inconsistent_dimensions.walls:
+        rules = [
+            rule for rule, _ in RoomValidator.wall_validation(wall).failures
         ]
-    ]
+        assert rules == sorted(rules)
+        assert all(isinstance(rule, WallRule) for rule in rules)
+
+
+def test_format_walls_validations(
+    validated_room,
+    validated_room_inconsistent_dimensions,
+    expected_fail_to_process_dimensions,
+):
+    """
+    Tests if the errors built from the validations of the walls are the
+    same errors raised by validate_dimensions().
+    """
     assert (
-        list(room_validator._validate_dimensions_looper()) == expected_results
+        RoomValidator.format_walls_validations(
+            [
+                RoomValidator.wall_validation(wall)
+                for wall in validated_room_inconsistent_dimensions.walls
+            ]
+        )
+        == expected_fail_to_process_dimensions
+    )
+    assert (
+        RoomValidator.format_walls_validations(
+            [
+                RoomValidator.wall_validation(wall)
+                for wall in validated_room.walls
+            ]
+        )
+        == {}
     )
 
 
@@ -0,0 +1,63 @@
+import pytest
+
+from src.services.validation_result import RoomValidationResult, WallRule
+
+
+# ------------------------------- init ---------------------------
+def test_init_allocates_one_slot_per_wall_and_rule():
+    """
+    Tests if the result is allocated with one slot for each wall and rule,
+    and starts without failures.
+    """
+    result = RoomValidationResult(4)
+    assert result.capacity == 4 * len(WallRule)
+    assert result.is_valid is True
+    assert len(result) == 0
+
+
+def test_init_with_negative_number_walls():
+    """
+    Tests if ValueError is raised when the number of walls is negative.
+    """
+    with pytest.raises(ValueError):
+        RoomValidationResult(-1)
+
+
+# ------------------------------- add ---------------------------
+def test_add_stores_failures_in_order():
+    """
+    Tests if the failures added are iterated in the same order, with the
+    wall index, rule code and params.
+    """
+    result = RoomValidationResult(2)
+    result.add(0, WallRule.AREA_OUT_OF_RANGE, (0.01, 1, 50))
+    result.add(1, WallRule.NOT_TALLER_THAN_DOOR, (2.1,))
+
+    assert result.is_valid is False
+    assert list(result) == [
+        (0, WallRule.AREA_OUT_OF_RANGE, (0.01, 1, 50)),
+        (1, WallRule.NOT_TALLER_THAN_DOOR, (2.1,)),
+    ]
+
+
+def test_add_beyond_capacity():
+    """
+    Tests if IndexError is raised when all slots are in use.
+    """
+    result = RoomValidationResult(0)
+    with pytest.raises(IndexError):
+        result.add(0, WallRule.AREA_OUT_OF_RANGE, (0.01, 1, 50))
+
+
+# ------------------------------- clear ---------------------------
+def test_clear_keeps_capacity():
+    """
+    Tests if clear forgets the failures and keeps the allocated slots.
+    """
+    result = RoomValidationResult(1)
+    result.add(0, WallRule.AREA_OUT_OF_RANGE, (0.01, 1, 50))
+    result.clear()
+
+    assert result.is_valid is True
+    assert list(result) == []
+    assert result.capacity == len(WallRule)
@@ -8,3 +8,38 @@ def test_api_config():
     assert hasattr(ApiConfig, "SERVER_PORT")
     assert hasattr(ApiConfig, "WORKERS")
     assert hasattr(ApiConfig, "LOG_LEVEL")
+    assert hasattr(ApiConfig, "LOG_EXCEPTIONS")
+    assert hasattr(ApiConfig, "ERROR_LOG_LEVEL")
+    assert hasattr(ApiConfig, "ERROR_LOG_SAMPLING_WINDOW")
+    assert hasattr(ApiConfig, "ERROR_LOG_SAMPLING_BURST")
+    assert hasattr(ApiConfig, "ROOM_MAX_WALLS")
+    assert hasattr(ApiConfig, "COLUMNAR_VALIDATION_MIN_WALLS")
+    assert hasattr(ApiConfig, "BATCH_MAX_ROOMS")
+    assert hasattr(ApiConfig, "REQUEST_MAX_WALLS")
+    assert hasattr(ApiConfig, "STREAM_CHUNK_ROOMS")
+    assert hasattr(ApiConfig, "STREAM_CHUNK_BYTES")
+    assert hasattr(ApiConfig, "STREAM_MAX_LINE_BYTES")
+    assert hasattr(ApiConfig, "LOG_QUEUE_SIZE")
+    assert hasattr(ApiConfig, "MICRO_BATCH_WINDOW")
+    assert hasattr(ApiConfig, "MICRO_BATCH_MAX_SIZE")
+    assert hasattr(ApiConfig, "RESULT_CACHE_SIZE")
+    assert hasattr(ApiConfig, "RESULT_CACHE_TTL")
+    assert hasattr(ApiConfig, "WALL_CACHE_SIZE")
+    assert hasattr(ApiConfig, "ASYNC_INLINE_MAX_WALLS")
+    assert hasattr(ApiConfig, "FAST_JSON")
+    assert hasattr(ApiConfig, "ETAGS")
+    assert hasattr(ApiConfig, "SHARED_RESULT_CACHE_FILE")
+    assert hasattr(ApiConfig, "SHARED_RESULT_CACHE_SLOTS")
+    assert hasattr(ApiConfig, "SHARED_RESULT_CACHE_SLOT_BYTES")
+    assert hasattr(ApiConfig, "CACHE_SNAPSHOT_FILE")
+    assert hasattr(ApiConfig, "CACHE_SNAPSHOT_INTERVAL")
+    assert hasattr(ApiConfig, "ETAG_CACHE_CONTROL")
+    assert hasattr(ApiConfig, "RESPONSE_CACHE_SIZE")
+    assert hasattr(ApiConfig, "CACHE_MAX_INVALID_WALLS")
+    assert hasattr(ApiConfig, "PAINT_CANS_ALLOCATION")
+    assert hasattr(ApiConfig, "EXACT_ALLOCATION_MAX_AREA")
+    assert hasattr(ApiConfig, "ALLOCATION_MAX_TABLE_UNITS")
+    assert hasattr(ApiConfig, "PAINT_CAN_PRICES")
+    assert hasattr(ApiConfig, "PAINT_CAN_CATALOGS_FILE")
+    assert hasattr(ApiConfig, "PAINT_CAN_CATALOGS_POLL_INTERVAL")
+    assert hasattr(ApiConfig, "PAINT_CAN_CATALOG")